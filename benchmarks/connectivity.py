@@ -0,0 +1,173 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+import uxarray as ux
+
+from uxarray.grid.connectivity import (
+    _build_edge_node_connectivity,
+    _build_node_face_csr,
+    _build_node_faces_connectivity,
+    _populate_face_face_connectivity,
+    _populate_node_edge_connectivity,
+    _populate_node_node_connectivity,
+    _populate_edge_edge_connectivity,
+)
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__))).parents[0]
+
+grid_path_CSne30 = (
+    current_path / "test" / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+)
+grid_path_QU = (
+    current_path / "test" / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+)
+
+
+def _structured_quad_face_nodes(n_face):
+    """Face node connectivity of a synthetic structured quadrilateral mesh
+    with approximately ``n_face`` faces."""
+    nx = int(np.sqrt(n_face))
+    ny = n_face // nx
+
+    i, j = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    i = i.ravel()
+    j = j.ravel()
+
+    face_nodes = np.empty((nx * ny, 4), dtype=ux.INT_DTYPE)
+    face_nodes[:, 0] = i * (ny + 1) + j
+    face_nodes[:, 1] = (i + 1) * (ny + 1) + j
+    face_nodes[:, 2] = (i + 1) * (ny + 1) + j + 1
+    face_nodes[:, 3] = i * (ny + 1) + j + 1
+
+    return face_nodes
+
+
+class EdgeNodeConnectivity:
+    """Construction of ``edge_node_connectivity`` from ``face_node_connectivity``."""
+
+    param_names = ["n_face"]
+    params = [["outCSne30", 100_000, 1_000_000, 10_000_000]]
+
+    timeout = 600
+
+    def setup(self, n_face):
+        if n_face == "outCSne30":
+            uxgrid = ux.open_grid(grid_path_CSne30)
+            self.face_nodes = uxgrid.face_node_connectivity.values
+        else:
+            self.face_nodes = _structured_quad_face_nodes(n_face)
+
+    def time_build_edge_node_connectivity(self, n_face):
+        _build_edge_node_connectivity(self.face_nodes, *self.face_nodes.shape)
+
+    def peakmem_build_edge_node_connectivity(self, n_face):
+        _build_edge_node_connectivity(self.face_nodes, *self.face_nodes.shape)
+
+
+class NodeFaceConnectivity:
+    """Construction of ``node_face_connectivity`` from ``face_node_connectivity``."""
+
+    param_names = ["n_face"]
+    params = [["outCSne30", 100_000, 1_000_000]]
+
+    def setup(self, n_face):
+        if n_face == "outCSne30":
+            uxgrid = ux.open_grid(grid_path_CSne30)
+            self.face_nodes = uxgrid.face_node_connectivity.values
+        else:
+            self.face_nodes = _structured_quad_face_nodes(n_face)
+
+        self.n_node = self.face_nodes.max() + 1
+
+    def time_build_node_face_csr(self, n_face):
+        _build_node_face_csr(self.face_nodes, self.n_node)
+
+    def time_build_node_faces_connectivity(self, n_face):
+        _build_node_faces_connectivity(self.face_nodes, self.n_node)
+
+
+class Topology:
+    """Construction of the full topology of a grid, either in a single fused
+    pass (``Grid.build_topology``) or by accessing each connectivity variable."""
+
+    param_names = ["n_face"]
+    params = [[100_000, 1_000_000]]
+
+    names = [
+        "n_nodes_per_face",
+        "edge_node_connectivity",
+        "face_edge_connectivity",
+        "edge_face_connectivity",
+        "node_face_connectivity",
+        "face_face_connectivity",
+    ]
+
+    def setup(self, n_face):
+        face_nodes = _structured_quad_face_nodes(n_face)
+        n_node = face_nodes.max() + 1
+
+        self.grid_ds = xr.Dataset(
+            {
+                "node_lon": ("n_node", np.linspace(-180, 180, n_node)),
+                "node_lat": ("n_node", np.linspace(-90, 90, n_node)),
+                "face_node_connectivity": (
+                    ("n_face", "n_max_face_nodes"),
+                    face_nodes,
+                    {"_FillValue": ux.INT_FILL_VALUE},
+                ),
+            }
+        )
+
+        # compile the fused kernel outside the timed region
+        ux.Grid(self.grid_ds.copy()).build_topology()
+
+    def time_build_topology(self, n_face):
+        ux.Grid(self.grid_ds.copy()).build_topology()
+
+    def peakmem_build_topology(self, n_face):
+        ux.Grid(self.grid_ds.copy()).build_topology()
+
+    def time_individual_connectivity(self, n_face):
+        uxgrid = ux.Grid(self.grid_ds.copy())
+        for name in self.names:
+            getattr(uxgrid, name)
+
+    def peakmem_individual_connectivity(self, n_face):
+        uxgrid = ux.Grid(self.grid_ds.copy())
+        for name in self.names:
+            getattr(uxgrid, name)
+
+
+class AdjacencyConnectivity:
+    """Construction of the adjacency connectivity variables from the edges of
+    a grid."""
+
+    param_names = ["grid", "ragged"]
+    params = [["outCSne30", "QU"], [False, True]]
+
+    grid_paths = {"outCSne30": grid_path_CSne30, "QU": grid_path_QU}
+
+    def setup(self, grid, ragged):
+        self.uxgrid = ux.open_grid(self.grid_paths[grid], ragged=ragged)
+
+        # construct the edges outside the timed region
+        self.uxgrid.edge_node_connectivity
+        self.uxgrid.edge_face_connectivity
+        self.uxgrid.face_edge_connectivity
+
+    def time_face_face_connectivity(self, grid, ragged):
+        _populate_face_face_connectivity(self.uxgrid)
+
+    def time_node_edge_connectivity(self, grid, ragged):
+        _populate_node_edge_connectivity(self.uxgrid)
+
+    def time_node_node_connectivity(self, grid, ragged):
+        _populate_node_edge_connectivity(self.uxgrid)
+        _populate_node_node_connectivity(self.uxgrid)
+
+    def time_edge_edge_connectivity(self, grid, ragged):
+        _populate_node_edge_connectivity(self.uxgrid)
+        _populate_edge_edge_connectivity(self.uxgrid)
@@ -0,0 +1,50 @@
+import numpy as np
+
+from uxarray.grid.coordinates import (
+    _get_lonlat_from_xyz,
+    _get_xyz_from_lonlat,
+    _lonlat_rad_to_xyz,
+    _xyz_to_lonlat_rad,
+)
+
+
+class CoordinateConversion:
+    """Conversion between spherical and Cartesian coordinates."""
+
+    param_names = ["n_node", "dtype"]
+    params = [[100_000, 1_000_000, 10_000_000], ["float64", "float32"]]
+
+    def setup(self, n_node, dtype):
+        rng = np.random.default_rng(0)
+        self.lon = rng.uniform(-180, 180, n_node)
+        self.lat = rng.uniform(-90, 90, n_node)
+        self.x, self.y, self.z = _get_xyz_from_lonlat(self.lon, self.lat)
+
+    def time_get_xyz_from_lonlat(self, n_node, dtype):
+        _get_xyz_from_lonlat(self.lon, self.lat, dtype=dtype)
+
+    def time_get_lonlat_from_xyz(self, n_node, dtype):
+        _get_lonlat_from_xyz(self.x, self.y, self.z, dtype=dtype)
+
+    def peakmem_get_xyz_from_lonlat(self, n_node, dtype):
+        _get_xyz_from_lonlat(self.lon, self.lat, dtype=dtype)
+
+
+class VectorizedCoordinateConversion:
+    """Conversion between spherical and Cartesian coordinates using the
+    NumPy (non-JIT) kernels."""
+
+    param_names = ["n_node"]
+    params = [[100_000, 1_000_000, 10_000_000]]
+
+    def setup(self, n_node):
+        rng = np.random.default_rng(0)
+        self.lon = np.deg2rad(rng.uniform(-180, 180, n_node))
+        self.lat = np.deg2rad(rng.uniform(-90, 90, n_node))
+        self.x, self.y, self.z = _lonlat_rad_to_xyz(self.lon, self.lat)
+
+    def time_lonlat_rad_to_xyz(self, n_node):
+        _lonlat_rad_to_xyz(self.lon, self.lat)
+
+    def time_xyz_to_lonlat_rad(self, n_node):
+        _xyz_to_lonlat_rad(self.x, self.y, self.z)
@@ -0,0 +1,101 @@
+import numba
+import numpy as np
+
+from uxarray.grid.area import (
+    get_all_face_area_from_coords,
+    _get_all_face_area_exact_from_csr,
+)
+
+from .connectivity import _structured_quad_face_nodes
+
+
+class FaceAreas:
+    """Computation of the area of each face of a synthetic quadrilateral
+    mesh, over the number of faces and threads."""
+
+    param_names = ["n_face", "n_threads", "quadrature_rule"]
+    params = [[100_000, 1_000_000], [1, 2, 4, 8], ["triangular", "gaussian"]]
+
+    timeout = 600
+
+    def setup(self, n_face, n_threads, quadrature_rule):
+        if n_threads > numba.config.NUMBA_NUM_THREADS:
+            raise NotImplementedError(
+                f"Only {numba.config.NUMBA_NUM_THREADS} threads are available"
+            )
+
+        self.face_nodes = _structured_quad_face_nodes(n_face)
+        self.n_nodes_per_face = np.full(self.face_nodes.shape[0], 4)
+
+        n_node = self.face_nodes.max() + 1
+        self.node_lon = np.linspace(-180, 180, n_node)
+        self.node_lat = np.linspace(-85, 85, n_node)
+        self.node_z = np.zeros(n_node)
+
+        self.n_threads_default = numba.get_num_threads()
+        numba.set_num_threads(n_threads)
+
+        # compile the kernels outside the timed region
+        self._face_areas(quadrature_rule)
+
+    def teardown(self, n_face, n_threads, quadrature_rule):
+        numba.set_num_threads(self.n_threads_default)
+
+    def _face_areas(self, quadrature_rule):
+        return get_all_face_area_from_coords(
+            self.node_lon,
+            self.node_lat,
+            self.node_z,
+            self.face_nodes,
+            self.n_nodes_per_face,
+            2,
+            quadrature_rule,
+        )
+
+    def time_face_areas(self, n_face, n_threads, quadrature_rule):
+        self._face_areas(quadrature_rule)
+
+    def peakmem_face_areas(self, n_face, n_threads, quadrature_rule):
+        self._face_areas(quadrature_rule)
+
+
+class ExactFaceAreas:
+    """Computation of the closed-form area of each face of a synthetic
+    quadrilateral mesh, over the number of faces and threads."""
+
+    param_names = ["n_face", "n_threads"]
+    params = [[100_000, 1_000_000], [1, 2, 4, 8]]
+
+    def setup(self, n_face, n_threads):
+        if n_threads > numba.config.NUMBA_NUM_THREADS:
+            raise NotImplementedError(
+                f"Only {numba.config.NUMBA_NUM_THREADS} threads are available"
+            )
+
+        face_nodes = _structured_quad_face_nodes(n_face)
+        self.offsets = np.arange(0, face_nodes.size + 1, 4)
+        self.indices = face_nodes.ravel()
+
+        n_node = face_nodes.max() + 1
+        self.node_lon = np.linspace(-180, 180, n_node)
+        self.node_lat = np.linspace(-85, 85, n_node)
+
+        self.n_threads_default = numba.get_num_threads()
+        numba.set_num_threads(n_threads)
+
+        # compile the kernel outside the timed region
+        self._face_areas()
+
+    def teardown(self, n_face, n_threads):
+        numba.set_num_threads(self.n_threads_default)
+
+    def _face_areas(self):
+        return _get_all_face_area_exact_from_csr(
+            self.node_lon, self.node_lat, None, self.offsets, self.indices
+        )
+
+    def time_face_areas(self, n_face, n_threads):
+        self._face_areas()
+
+    def peakmem_face_areas(self, n_face, n_threads):
+        self._face_areas()
@@ -0,0 +1,183 @@
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+import uxarray as ux
+
+from uxarray.grid.neighbors import BallTree
+
+from .connectivity import _structured_quad_face_nodes
+
+current_path = Path(os.path.dirname(os.path.realpath(__file__))).parents[0]
+
+grid_path_CSne30 = (
+    current_path / "test" / "meshfiles" / "ugrid" / "outCSne30" / "outCSne30.ug"
+)
+
+
+def _rll_grid(n_face):
+    """Grid of a synthetic regular latitude-longitude mesh with approximately
+    ``n_face`` faces."""
+    face_nodes = _structured_quad_face_nodes(n_face)
+    nx = int(np.sqrt(n_face))
+    ny = n_face // nx
+
+    # node (i, j) is numbered i * (ny + 1) + j
+    lon, lat = np.meshgrid(
+        np.linspace(-180, 180, nx + 1), np.linspace(-90, 90, ny + 1), indexing="ij"
+    )
+
+    return ux.Grid(
+        xr.Dataset(
+            {
+                "node_lon": ("n_node", lon.ravel()),
+                "node_lat": ("n_node", lat.ravel()),
+                "face_node_connectivity": (
+                    ("n_face", "n_max_face_nodes"),
+                    face_nodes,
+                    {"_FillValue": ux.INT_FILL_VALUE},
+                ),
+            }
+        )
+    )
+
+
+class AlternatingTrees:
+    """Alternating between trees constructed on nodes and face centers, as
+    done when remapping node- and face-centered variables of the same grid."""
+
+    def setup(self):
+        self.uxgrid = ux.open_grid(grid_path_CSne30)
+
+        # populate the coordinates outside the timed region
+        self.uxgrid.face_lon
+        self.uxgrid.node_x
+
+    def time_alternating_ball_trees(self):
+        for _ in range(10):
+            self.uxgrid.get_ball_tree(coordinates="nodes")
+            self.uxgrid.get_ball_tree(coordinates="face centers")
+
+
+class TreeSerialization:
+    """Loading a saved tree (with memory-mapped arrays) instead of
+    constructing it."""
+
+    param_names = ["coordinates"]
+    params = [["nodes", "face centers"]]
+
+    def setup(self, coordinates):
+        self.uxgrid = ux.open_grid(grid_path_CSne30)
+        self.uxgrid.face_lon
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "tree")
+        self.uxgrid.get_ball_tree(coordinates=coordinates).save(self.path)
+
+    def teardown(self, coordinates):
+        self.tmp_dir.cleanup()
+
+    def time_construct(self, coordinates):
+        BallTree(self.uxgrid, coordinates=coordinates)
+
+    def time_load(self, coordinates):
+        BallTree.load(self.uxgrid, self.path)
+
+
+class SphericalIndexQuery:
+    """Nearest neighbor queries of random points on the face centers of a
+    synthetic regular latitude-longitude grid, using the spherical index or
+    the haversine BallTree."""
+
+    param_names = ["n_face", "index"]
+    params = [[100_000, 1_000_000], ["spherical_index", "ball_tree"]]
+
+    timeout = 600
+
+    def setup(self, n_face, index):
+        uxgrid = _rll_grid(n_face)
+
+        if index == "spherical_index":
+            self.index = uxgrid.get_spherical_index(coordinates="face centers")
+        else:
+            self.index = uxgrid.get_ball_tree(coordinates="face centers")
+
+        rng = np.random.default_rng(0)
+        self.coords = np.stack(
+            [
+                rng.uniform(-180, 180, 100_000),
+                np.rad2deg(np.arcsin(rng.uniform(-1, 1, 100_000))),
+            ],
+            axis=-1,
+        )
+
+        # compile the query kernels outside the timed region
+        self.index.query(self.coords[:10], k=4)
+        self.index.query_radius(self.coords[:10], 1.0)
+
+    def time_query(self, n_face, index):
+        self.index.query(self.coords, k=4)
+
+    def time_query_radius(self, n_face, index):
+        self.index.query_radius(self.coords, 1.0)
+
+
+class LocatePoints:
+    """Location of the faces that contain random points on a synthetic
+    regular latitude-longitude grid."""
+
+    param_names = ["n_face"]
+    params = [[100_000, 1_000_000]]
+
+    timeout = 600
+
+    def setup(self, n_face):
+        self.uxgrid = _rll_grid(n_face)
+
+        rng = np.random.default_rng(0)
+        self.lon = rng.uniform(-180, 180, 1_000_000)
+        self.lat = np.rad2deg(np.arcsin(rng.uniform(-1, 1, 1_000_000)))
+
+        # construct the index and compile the kernels outside the timed region
+        self.uxgrid.locate_points(self.lon[:10], self.lat[:10])
+
+    def time_locate_points(self, n_face):
+        self.uxgrid.locate_points(self.lon, self.lat)
+
+
+class ChunkedQuery:
+    """Nearest neighbor queries of many random points with the haversine
+    BallTree, either at once or in chunks with several threads."""
+
+    param_names = ["chunk_size", "n_workers"]
+    params = [[None, 100_000], [1, 4]]
+
+    timeout = 600
+
+    def setup(self, chunk_size, n_workers):
+        self.tree = _rll_grid(100_000).get_ball_tree(coordinates="face centers")
+
+        rng = np.random.default_rng(0)
+        self.coords = np.stack(
+            [
+                rng.uniform(-180, 180, 1_000_000),
+                np.rad2deg(np.arcsin(rng.uniform(-1, 1, 1_000_000))),
+            ],
+            axis=-1,
+        )
+
+    def time_query(self, chunk_size, n_workers):
+        self.tree.query(self.coords, k=4, chunk_size=chunk_size, n_workers=n_workers)
+
+    def peakmem_query(self, chunk_size, n_workers):
+        self.tree.query(
+            self.coords,
+            k=4,
+            chunk_size=chunk_size,
+            n_workers=n_workers,
+            index_dtype=np.int32,
+            distance_dtype=np.float32,
+        )
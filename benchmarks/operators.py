@@ -0,0 +1,86 @@
+import numpy as np
+import xarray as xr
+
+import uxarray as ux
+
+from .connectivity import _structured_quad_face_nodes
+
+
+def _structured_quad_grid(n_face):
+    """Grid of a synthetic structured quadrilateral mesh with approximately
+    ``n_face`` faces."""
+    face_nodes = _structured_quad_face_nodes(n_face)
+    n_node = face_nodes.max() + 1
+
+    return ux.Grid(
+        xr.Dataset(
+            {
+                "node_lon": ("n_node", np.linspace(-180, 180, n_node)),
+                "node_lat": ("n_node", np.linspace(-90, 90, n_node)),
+                "face_node_connectivity": (
+                    ("n_face", "n_max_face_nodes"),
+                    face_nodes,
+                    {"_FillValue": ux.INT_FILL_VALUE},
+                ),
+            }
+        )
+    )
+
+
+class NodalAverage:
+    """Averaging node-centered data onto each face."""
+
+    param_names = ["n_face"]
+    params = [[100_000, 1_000_000, 4_000_000]]
+
+    timeout = 600
+
+    def setup(self, n_face):
+        self.uxgrid = _structured_quad_grid(n_face)
+        self.uxda = ux.UxDataArray(
+            np.random.default_rng(0).random((4, self.uxgrid.n_node)),
+            dims=["time", "n_node"],
+            uxgrid=self.uxgrid,
+        )
+
+        # build the averaging operator outside the timed region
+        self.uxda.nodal_average()
+
+    def time_nodal_average(self, n_face):
+        self.uxda.nodal_average()
+
+    def time_nodal_average_dask(self, n_face):
+        self.uxda.chunk({"time": 1}).nodal_average().compute()
+
+
+class FaceOperators:
+    """Gradient and difference of face-centered data, and construction of
+    the operators of a grid."""
+
+    param_names = ["n_face"]
+    params = [[100_000, 1_000_000]]
+
+    timeout = 600
+
+    def setup(self, n_face):
+        self.uxgrid = _structured_quad_grid(n_face)
+        self.uxda = ux.UxDataArray(
+            np.random.default_rng(0).random((4, self.uxgrid.n_face)),
+            dims=["time", "n_face"],
+            uxgrid=self.uxgrid,
+        )
+
+        # build the operators and the quantities they depend on outside the timed region
+        self.uxda.gradient()
+        self.uxda.difference()
+        self.uxgrid.operators.face_laplacian
+
+    def time_gradient(self, n_face):
+        self.uxda.gradient()
+
+    def time_difference(self, n_face):
+        self.uxda.difference()
+
+    def time_build_face_laplacian(self, n_face):
+        self.uxgrid._operator_cache.clear()
+        self.uxgrid.operators.face_laplacian
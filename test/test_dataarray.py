@@ -4,6 +4,8 @@ from unittest import TestCase
 from pathlib import Path
 
 import numpy as np
+import numpy.testing as nt
+import dask.array
 
 import uxarray as ux
 
@@ -139,3 +141,34 @@ class TestGeometryConversions(TestCase):
 
         # resulting data should be the mean of the corner nodes of the single face
         self.assertEqual(uxda_nodal_average, np.mean(data))
+
+    def test_nodal_average_operator(self):
+        """Compares the nodal average with the mean of the nodes of each face,
+        for in-memory and dask-backed data."""
+        uxds = ux.open_dataset(gridfile_geoflow, dsfile_v1_geoflow)
+        uxgrid = uxds.uxgrid
+
+        v1 = uxds['v1']
+        face_nodes = uxgrid.face_node_connectivity.values
+        n_nodes_per_face = uxgrid.n_nodes_per_face.values
+
+        expected = np.stack([
+            v1.values[..., nodes[:n_nodes]].mean(axis=-1)
+            for nodes, n_nodes in zip(face_nodes, n_nodes_per_face)
+        ], axis=-1)
+
+        nt.assert_allclose(v1.nodal_average().values, expected)
+
+        # the averaging operator is built once per grid
+        assert uxgrid._operator_cache["face_node_average"] is not None
+        operator = uxgrid._operator_cache["face_node_average"]
+        v1.nodal_average()
+        assert uxgrid._operator_cache["face_node_average"] is operator
+
+        # dask-backed data is averaged lazily, block by block over the leading dimensions
+        v1_chunked = v1.chunk({"time": 5, "n_node": 1000})
+        v1_nodal_average = v1_chunked.nodal_average()
+
+        assert isinstance(v1_nodal_average.data, dask.array.Array)
+        assert v1_nodal_average.chunks[0] == v1_chunked.chunks[0]
+        nt.assert_allclose(v1_nodal_average.values, expected)
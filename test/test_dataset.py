@@ -1,6 +1,7 @@
 import os
 from unittest import TestCase
 from pathlib import Path
+import numpy as np
 import numpy.testing as nt
 import xarray as xr
 
@@ -42,7 +43,40 @@ class TestUxDataset(TestCase):
 
         integrate_var2 = uxds_var2_ne30.integrate()
 
-        nt.assert_almost_equal(integrate_var2, constants.VAR2_INTG, decimal=3)
+        nt.assert_almost_equal(integrate_var2["var2"].values, constants.VAR2_INTG, decimal=3)
+
+    def test_integrate_multiple_variables(self):
+        """Integrates every face-centered variable of a dataset at once."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_var2_ne30)
+        n_face = uxds.uxgrid.n_face
+
+        rng = np.random.default_rng(0)
+        uxds["var3d"] = (("time", "n_face", "lev"), rng.random((3, n_face, 2)))
+        uxds["ones"] = (("n_face",), np.ones(n_face))
+        uxds["node_ones"] = (("n_node",), np.ones(uxds.uxgrid.n_node))
+        uxds["time_only"] = (("time",), np.arange(3))
+        uxds = uxds.assign_coords(time=[10, 20, 30])
+
+        integral = uxds.integrate()
+
+        assert set(integral.data_vars) == {"var2", "var3d", "ones", "node_ones"}
+        assert integral["var3d"].dims == ("time", "lev")
+        nt.assert_array_equal(integral["time"], [10, 20, 30])
+        nt.assert_allclose(integral["ones"], 4 * np.pi)
+        nt.assert_allclose(integral["node_ones"], integral["ones"])
+        nt.assert_allclose(
+            integral["var3d"],
+            uxds["var3d"].transpose("time", "lev", "n_face").integrate().values)
+        nt.assert_allclose(integral["var2"], uxds["var2"].integrate().values)
+
+        # concurrently and lazily
+        integral_threaded = uxds.integrate(n_workers=2)
+        integral_lazy = uxds.chunk({"n_face": 1000}).integrate(n_workers=2)
+
+        assert integral_lazy["var3d"].chunks is not None
+        for name in integral.data_vars:
+            nt.assert_allclose(integral_threaded[name], integral[name])
+            nt.assert_allclose(integral_lazy[name].values, integral[name].values)
 
     def test_info(self):
         """Tests custom info containing grid information."""
@@ -67,6 +101,37 @@ class TestUxDataset(TestCase):
         for dim in ugrid_dims:
             assert dim in uxds_remap.dims
 
+    def test_reorder(self):
+        """Tests that reordering a dataset permutes its data variables
+        consistently with its grid."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_var2_ne30)
+        uxds_reordered = uxds.reorder("hilbert")
+
+        permutation = uxds.uxgrid.copy().reorder("hilbert")
+
+        nt.assert_array_equal(uxds_reordered["var2"].values,
+                              uxds["var2"].isel(n_face=permutation["n_face"]).values)
+        nt.assert_array_equal(uxds_reordered.uxgrid.node_lon.values,
+                              uxds.uxgrid.node_lon.values[permutation["n_node"]])
+
+        # the grid of the original dataset is not modified
+        assert uxds.uxgrid == ux.open_grid(gridfile_ne30)
+
+    def test_partition(self):
+        """Tests that partitioning a dataset chunks it along the parts of its
+        grid."""
+        uxds = ux.open_dataset(gridfile_ne30, dsfile_var2_ne30)
+        uxds_partitioned = uxds.partition(4)
+
+        assert uxds_partitioned["var2"].chunks == ((1350, 1350, 1350, 1350),)
+
+        # data remains aligned with the reordered faces
+        nt.assert_allclose(
+            uxds_partitioned.uxgrid.face_areas.sum(),
+            uxds.uxgrid.face_areas.sum())
+        nt.assert_allclose(uxds_partitioned.integrate()["var2"].values,
+                           uxds.integrate()["var2"].values)
+
     def test_read_from_https(self):
         """Tests reading a dataset from a HTTPS link."""
         import requests
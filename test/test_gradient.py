@@ -5,10 +5,12 @@ import xarray as xr
 from unittest import TestCase
 import numpy as np
 import numpy.testing as nt
+import dask.array
 import os
 from pathlib import Path
 
 from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+from uxarray.grid.dependencies import _invalidate_derived
 
 current_path = Path(os.path.dirname(os.path.realpath(__file__)))
 
@@ -168,3 +170,78 @@ class TestDifference(TestCase):
 
         # expected number of edges is n_face + 1, since we have 4 polygons
         assert len(np.nonzero(uxda_diff.values)[0]) == uxds.uxgrid.n_face + 1
+
+
+class TestOperators(TestCase):
+
+    mpas_atmo_path = current_path / 'meshfiles' / "mpas" / "QU" / 'mesh.QU.1920km.151026.nc'
+    quad_hex_grid_path = current_path / "meshfiles" / "ugrid" / "quad-hexagon" / "grid.nc"
+    quad_hex_data_path = current_path / "meshfiles" / "ugrid" / "quad-hexagon" / "data.nc"
+
+    def test_cached(self):
+        """Each operator is built once and discarded when the grid changes."""
+        uxgrid = ux.open_grid(self.quad_hex_grid_path)
+
+        gradient = uxgrid.operators.edge_face_gradient
+        assert gradient.shape == (uxgrid.n_edge, uxgrid.n_face)
+        assert uxgrid.operators.edge_face_gradient is gradient
+
+        _invalidate_derived(uxgrid, ["node_lon", "node_lat"])
+        assert uxgrid.operators.edge_face_gradient is not gradient
+
+    def test_difference_and_gradient(self):
+        """Compares the operators with differences of the faces and nodes
+        that saddle each edge."""
+        uxgrid = ux.open_grid(self.mpas_atmo_path)
+
+        edge_faces = uxgrid.edge_face_connectivity.values
+        edge_nodes = uxgrid.edge_node_connectivity.values
+        saddle = edge_faces[:, 1] != INT_FILL_VALUE
+
+        face_data = np.random.random(uxgrid.n_face)
+        node_data = np.random.random(uxgrid.n_node)
+
+        expected = np.zeros(uxgrid.n_edge)
+        expected[saddle] = face_data[edge_faces[saddle, 0]] - face_data[edge_faces[saddle, 1]]
+
+        nt.assert_allclose(uxgrid.operators.edge_face_difference @ face_data, expected)
+
+        expected[saddle] /= uxgrid.edge_face_distances.values[saddle]
+        nt.assert_allclose(uxgrid.operators.edge_face_gradient @ face_data, expected)
+
+        nt.assert_allclose(uxgrid.operators.edge_node_difference @ node_data,
+                           node_data[edge_nodes[:, 0]] - node_data[edge_nodes[:, 1]])
+
+    def test_divergence_and_laplacian(self):
+        """The divergence conserves fluxes between faces and the Laplacian
+        of constant data is zero."""
+        for grid_path in [self.mpas_atmo_path, self.quad_hex_grid_path]:
+            uxgrid = ux.open_grid(grid_path)
+
+            saddle = uxgrid.edge_face_connectivity.values[:, 1] != INT_FILL_VALUE
+            flux = np.random.random(uxgrid.n_edge) * saddle
+
+            divergence = uxgrid.operators.face_edge_divergence @ flux
+            nt.assert_allclose(np.dot(uxgrid.face_areas, divergence), 0, atol=1e-12)
+
+            laplacian = uxgrid.operators.face_laplacian @ np.ones(uxgrid.n_face)
+            nt.assert_allclose(laplacian, 0, atol=1e-10)
+
+    def test_node_face_average(self):
+        """Averaging constant face-centered data onto nodes preserves it."""
+        uxgrid = ux.open_grid(self.mpas_atmo_path)
+
+        node_face_average = uxgrid.operators.node_face_average
+
+        assert node_face_average.shape == (uxgrid.n_node, uxgrid.n_face)
+        nt.assert_allclose(node_face_average @ np.full(uxgrid.n_face, 2.0), 2.0)
+
+    def test_dask(self):
+        """Gradients of dask-backed data are computed lazily."""
+        uxds = ux.open_dataset(self.quad_hex_grid_path, self.quad_hex_data_path)
+
+        expected = uxds['t2m'].gradient().values
+        grad = uxds['t2m'].chunk().gradient()
+
+        assert isinstance(grad.data, dask.array.Array)
+        nt.assert_allclose(grad.values, expected)
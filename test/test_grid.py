@@ -8,9 +8,11 @@ from pathlib import Path
 
 import uxarray as ux
 
-from uxarray.grid.connectivity import _populate_face_edge_connectivity, _build_edge_face_connectivity
+from uxarray.grid.connectivity import _populate_face_edge_connectivity, _build_edge_face_connectivity, \
+    _build_edge_node_connectivity
 
-from uxarray.grid.coordinates import _populate_lonlat_coord
+from uxarray.grid.coordinates import _populate_lonlat_coord, _get_xyz_from_lonlat, _get_lonlat_from_xyz, \
+    _lonlat_rad_to_xyz, _xyz_to_lonlat_rad, node_lonlat_rad_to_xyz, node_xyz_to_lonlat_rad
 
 from uxarray.constants import INT_FILL_VALUE
 
@@ -285,6 +287,23 @@ class TestOperators(TestCase):
         """Test Not Equals ('!=') operator."""
         assert self.grid_CSne30_01 != self.grid_RLL1deg
 
+    def test_eq_storage(self):
+        """Test that equality does not depend on how connectivity is
+        stored."""
+        grid_CSne30_ragged = ux.open_grid(gridfile_CSne30,
+                                          ragged=True,
+                                          connectivity_dtype=np.int32)
+        assert self.grid_CSne30_01 == grid_CSne30_ragged
+
+    def test_fingerprint(self):
+        """Test that the fingerprint is cached and identifies the
+        topology."""
+        fingerprint = self.grid_CSne30_01.fingerprint
+
+        assert self.grid_CSne30_01._fingerprint == fingerprint
+        assert self.grid_CSne30_02.fingerprint == fingerprint
+        assert self.grid_RLL1deg.fingerprint != fingerprint
+
 
 class TestFaceAreas(TestCase):
     grid_CSne30 = ux.open_grid(gridfile_CSne30)
@@ -385,6 +404,72 @@ class TestFaceAreas(TestCase):
                                decimal=3)
 
 
+    def test_compute_face_areas_exact(self):
+        """Compares the closed-form face areas with a high-order quadrature
+        and checks that the faces of closed meshes cover the unit sphere."""
+        for grid_path in [gridfile_CSne30, gridfile_mpas]:
+            uxgrid = ux.open_grid(grid_path)
+
+            exact_areas, exact_jacobian = uxgrid.compute_face_areas(method="exact")
+            exact_areas = exact_areas.copy()
+
+            nt.assert_allclose(exact_areas.sum(), constants.UNIT_SPHERE_AREA, rtol=1e-13)
+            nt.assert_array_equal(exact_jacobian, exact_areas)
+
+            quadrature_areas, _ = uxgrid.compute_face_areas("gaussian", 10)
+            nt.assert_allclose(exact_areas, quadrature_areas, rtol=1e-12)
+
+            # Cartesian node coordinates
+            cartesian_areas, _ = uxgrid.compute_face_areas(latlon=False, method="exact")
+            nt.assert_allclose(cartesian_areas, exact_areas, rtol=1e-12)
+
+        # the area does not depend on the orientation of a face
+        verts = [[[0.57735027, -5.77350269e-01, -0.57735027],
+                  [0.57735027, 5.77350269e-01, -0.57735027],
+                  [-0.57735027, 5.77350269e-01, -0.57735027]]]
+        area = ux.open_grid(verts, latlon=False).calculate_total_face_area(method="exact")
+        reversed_area = ux.open_grid([verts[0][::-1]], latlon=False).calculate_total_face_area(method="exact")
+
+        nt.assert_almost_equal(area, constants.TRI_AREA, decimal=3)
+        nt.assert_almost_equal(area, reversed_area, decimal=14)
+
+        with self.assertRaises(ValueError):
+            uxgrid.compute_face_areas(method="simpson")
+
+
+    def test_face_area_cache(self):
+        """Tests that face areas are computed once per combination of
+        parameters, and that the cache is bounded and can be cleared."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        areas, jacobian = uxgrid.compute_face_areas()
+        gaussian_areas, _ = uxgrid.compute_face_areas("gaussian", 5)
+
+        assert uxgrid.compute_face_areas()[0] is areas
+        assert uxgrid.compute_face_areas("gaussian", 5)[0] is gaussian_areas
+        assert uxgrid.compute_face_areas("gaussian", 6)[0] is not gaussian_areas
+        assert len(uxgrid._face_area_cache) == 3
+
+        # integration uses the cached areas
+        uxda = ux.UxDataArray(data=np.ones(uxgrid.n_face),
+                              dims=["n_face"],
+                              uxgrid=uxgrid)
+        uxda.integrate()
+        assert uxgrid.compute_face_areas()[0] is areas
+
+        # the least recently used areas are discarded first
+        for order in range(1, ux.constants.FACE_AREA_CACHE_SIZE + 1):
+            uxgrid.compute_face_areas("gaussian", order)
+
+        assert len(uxgrid._face_area_cache) == ux.constants.FACE_AREA_CACHE_SIZE
+        assert ("quadrature", "triangular", 4, "spherical") not in uxgrid._face_area_cache
+
+        uxgrid.clear_face_area_cache()
+        assert len(uxgrid._face_area_cache) == 0
+        assert uxgrid._face_areas is None
+        nt.assert_array_equal(uxgrid.face_areas, areas)
+
+
 class TestPopulateCoordinates(TestCase):
 
     def test_populate_cartesian_xyz_coord(self):
@@ -469,6 +554,51 @@ class TestPopulateCoordinates(TestCase):
                                    decimal=12)
 
 
+    def test_vectorized_conversion(self):
+        # random points including the poles, compared against the scalar conversion of each point
+        rng = np.random.default_rng(0)
+        lon_deg = np.concatenate([[0.0, 45.0, 180.0], rng.uniform(-180, 360, 100)])
+        lat_deg = np.concatenate([[90.0, -90.0, 0.0], rng.uniform(-90, 90, 100)])
+
+        expected_xyz = np.array([
+            node_lonlat_rad_to_xyz([lon, lat])
+            for lon, lat in zip(np.deg2rad(lon_deg), np.deg2rad(lat_deg))
+        ])
+
+        x, y, z = _get_xyz_from_lonlat(lon_deg, lat_deg)
+        nt.assert_allclose(np.stack([x, y, z], axis=1), expected_xyz, atol=1e-15)
+        nt.assert_allclose(
+            np.stack(_lonlat_rad_to_xyz(np.deg2rad(lon_deg), np.deg2rad(lat_deg)), axis=1),
+            expected_xyz,
+            atol=1e-15)
+
+        # unnormalized input
+        scale = rng.uniform(0.5, 2.0, (lon_deg.shape[0], 1))
+        xyz = expected_xyz * scale
+        expected_lonlat = np.rad2deg(
+            [node_xyz_to_lonlat_rad(list(node)) for node in xyz])
+
+        lon, lat = _get_lonlat_from_xyz(*xyz.T)
+        nt.assert_allclose(lon, expected_lonlat[:, 0], atol=1e-9)
+        nt.assert_allclose(lat, expected_lonlat[:, 1], atol=1e-9)
+
+        lon_rad, lat_rad = _xyz_to_lonlat_rad(*xyz.T)
+        nt.assert_allclose(np.rad2deg(lon_rad), expected_lonlat[:, 0], atol=1e-9)
+        nt.assert_allclose(np.rad2deg(lat_rad), expected_lonlat[:, 1], atol=1e-9)
+
+    def test_conversion_dtype(self):
+        lon_deg = np.linspace(0, 359, 50)
+        lat_deg = np.linspace(-89, 89, 50)
+
+        x, y, z = _get_xyz_from_lonlat(lon_deg, lat_deg, dtype=np.float32)
+        self.assertEqual(x.dtype, np.float32)
+        nt.assert_allclose(x, _get_xyz_from_lonlat(lon_deg, lat_deg)[0], atol=1e-6)
+
+        lon, lat = _get_lonlat_from_xyz(x, y, z, dtype=np.float32)
+        self.assertEqual(lat.dtype, np.float32)
+        nt.assert_allclose(lat, lat_deg, atol=1e-3)
+
+
 class TestConnectivity(TestCase):
     mpas_filepath = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
     exodus_filepath = current_path / "meshfiles" / "exodus" / "outCSne8" / "outCSne8.g"
@@ -639,6 +769,58 @@ class TestConnectivity(TestCase):
             # euler's formula (n_face = n_edges - n_nodes + 2)
             assert (n_face == n_edge - n_node + 2)
 
+    def test_edge_nodes_match_row_unique(self):
+        """Verifies that the packed-key edge deduplication matches a row-wise
+        ``np.unique`` over the sorted face-edge node pairs, including grids
+        with fill values."""
+        verts = [
+            self.f0_deg, self.f1_deg, self.f2_deg, self.f3_deg, self.f4_deg,
+            self.f5_deg, self.f6_deg
+        ]
+        grids = [self.grid_mpas, self.grid_ugrid, ux.open_grid(verts)]
+
+        for grid in grids:
+            face_nodes = grid.face_node_connectivity.values
+            edge_nodes, inverse_indices, fill_value_mask = _build_edge_node_connectivity(
+                face_nodes, grid.n_face, grid.n_max_face_nodes)
+
+            # reference face-edge pairs
+            closed = np.full((grid.n_face, grid.n_max_face_nodes + 1), INT_FILL_VALUE)
+            closed[:, :-1] = face_nodes
+            n_nodes_per_face = grid.n_nodes_per_face.values
+            closed[np.arange(grid.n_face), n_nodes_per_face] = face_nodes[:, 0]
+            pairs = np.stack((closed[:, :-1].ravel(), closed[:, 1:].ravel()), axis=1)
+            valid = np.all(pairs != INT_FILL_VALUE, axis=1)
+            pairs = np.sort(pairs[valid], axis=1)
+
+            nt.assert_array_equal(edge_nodes, np.unique(pairs, axis=0))
+            nt.assert_array_equal(fill_value_mask, ~valid)
+            nt.assert_array_equal(edge_nodes[inverse_indices[valid]], pairs)
+            assert np.all(inverse_indices[~valid] == INT_FILL_VALUE)
+
+    def test_edge_nodes_fill_value_mask(self):
+        """Tests that ``fill_value_mask`` is aligned with the face-edge pairs of
+        ``inverse_indices`` however the edges are constructed."""
+        verts = [
+            self.f0_deg, self.f1_deg, self.f2_deg, self.f3_deg, self.f4_deg,
+            self.f5_deg, self.f6_deg
+        ]
+
+        for ragged in [False, True]:
+            grids = [
+                ux.open_grid(verts, ragged=ragged),
+                ux.open_grid(verts, ragged=ragged).build_topology(),
+                ux.open_grid(verts, ragged=ragged).build_topology()
+            ]
+            grids[2].reorder("hilbert")
+
+            for grid in grids:
+                attrs = grid.edge_node_connectivity.attrs
+                inverse_indices = attrs["inverse_indices"]
+
+                nt.assert_array_equal(attrs["fill_value_mask"],
+                                      inverse_indices == INT_FILL_VALUE)
+
     def test_build_face_edges_connectivity_mpas(self):
         """Tests the construction of (``Mesh2_edge_nodes``) on an MPAS grid
         with known edge nodes."""
@@ -841,6 +1023,28 @@ class TestConnectivity(TestCase):
                     np.array_equal(valid_face_index_from_sparse_matrix,
                                    face_index_from_dict))
 
+    def test_node_face_connectivity_csr(self):
+        """Tests that the CSR representation of ``node_face_connectivity``
+        matches the padded connectivity variable."""
+        grids = [self.grid_exodus, self.grid_ugrid, ux.open_grid(self.ugrid_filepath_02)]
+
+        for grid in grids:
+            offsets, indices = grid.get_csr_connectivity("node_face_connectivity")
+            node_faces = grid.node_face_connectivity.values
+
+            assert offsets.shape[0] == grid.n_node + 1
+            assert indices.shape[0] == np.count_nonzero(
+                grid.face_node_connectivity.values != INT_FILL_VALUE)
+
+            for node_idx in range(grid.n_node):
+                cur_faces = node_faces[node_idx]
+                nt.assert_array_equal(indices[offsets[node_idx]:offsets[node_idx + 1]],
+                                      cur_faces[cur_faces != INT_FILL_VALUE])
+
+        # CSR representation derived from a padded connectivity variable
+        offsets, indices = self.grid_ugrid.get_csr_connectivity("face_node_connectivity")
+        nt.assert_array_equal(indices, self.grid_ugrid.face_node_connectivity.values.ravel())
+
     def test_edge_face_connectivity_mpas(self):
         """Tests the construction of ``Mesh2_face_edges`` to the expected
         results of an MPAS grid."""
@@ -888,6 +1092,100 @@ class TestConnectivity(TestCase):
         # no invalid entries should occur
         assert n_invalid == 0
 
+    def test_face_face_connectivity_sample(self):
+        """Tests the construction of ``face_face_connectivity`` on an example
+        with two faces sharing one edge."""
+        verts = [[(0.0, -90.0), (180, 0.0), (0.0, 90)],
+                 [(-180, 0.0), (0, 90.0), (0.0, -90)]]
+
+        uxgrid = ux.open_grid(verts)
+
+        nt.assert_array_equal(uxgrid.face_face_connectivity.values, [[1], [0]])
+
+    def test_node_edge_node_node_connectivity(self):
+        """Tests that ``node_edge_connectivity`` and
+        ``node_node_connectivity`` are consistent with the edges of the
+        grid."""
+        for grid_path in [gridfile_CSne30, gridfile_mpas]:
+            for ragged in [False, True]:
+                uxgrid = ux.open_grid(grid_path, ragged=ragged)
+                edge_nodes = uxgrid.edge_node_connectivity.values
+
+                offsets, node_edges = uxgrid.get_csr_connectivity(
+                    "node_edge_connectivity")
+                _, node_nodes = uxgrid.get_csr_connectivity(
+                    "node_node_connectivity")
+
+                # each edge appears once for each of its nodes
+                nt.assert_array_equal(np.sort(node_edges),
+                                      np.repeat(np.arange(uxgrid.n_edge), 2))
+
+                for node_idx in range(uxgrid.n_node):
+                    edges = node_edges[offsets[node_idx]:offsets[node_idx + 1]]
+                    nodes = node_nodes[offsets[node_idx]:offsets[node_idx + 1]]
+
+                    assert (edge_nodes[edges] == node_idx).any(axis=1).all()
+                    nt.assert_array_equal(
+                        np.sort(np.stack([nodes, np.full_like(nodes, node_idx)], axis=1), axis=1),
+                        np.sort(edge_nodes[edges], axis=1))
+
+    def test_edge_edge_connectivity(self):
+        """Tests that ``edge_edge_connectivity`` contains every other edge
+        that shares a node with each edge."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+        edge_nodes = uxgrid.edge_node_connectivity.values
+        edge_edges = uxgrid.edge_edge_connectivity.values
+
+        for edge_idx in range(uxgrid.n_edge):
+            neighbors = edge_edges[edge_idx]
+            neighbors = neighbors[neighbors != INT_FILL_VALUE]
+
+            shares_node = np.isin(edge_nodes, edge_nodes[edge_idx]).any(axis=1)
+            shares_node[edge_idx] = False
+
+            nt.assert_array_equal(np.sort(neighbors),
+                                  np.nonzero(shares_node)[0])
+
+    def test_build_topology(self):
+        """Tests that the fused construction of the topology matches the
+        individually constructed connectivity variables."""
+        names = [
+            "n_nodes_per_face", "edge_node_connectivity",
+            "face_edge_connectivity", "edge_face_connectivity",
+            "node_face_connectivity", "face_face_connectivity"
+        ]
+        gridfile_mixed = current_path / "meshfiles" / "exodus" / "mixed" / "mixed.exo"
+
+        for grid_path in [gridfile_CSne30, gridfile_geoflow, gridfile_mixed]:
+            for ragged in [False, True]:
+                uxgrid = ux.open_grid(grid_path, ragged=ragged).build_topology()
+                uxgrid_lazy = ux.open_grid(grid_path, ragged=ragged)
+
+                for name in names:
+                    nt.assert_array_equal(
+                        getattr(uxgrid, name).values,
+                        getattr(uxgrid_lazy, name).values)
+
+        # fan of triangles around a single high degree node at the pole
+        lon = np.linspace(-180, 180, 257)
+        face_vertices = np.stack([
+            np.stack([np.zeros(256), lon[:-1], lon[1:]], axis=1),
+            np.stack([np.full(256, 90.0),
+                      np.full(256, 80.0),
+                      np.full(256, 80.0)],
+                     axis=1)
+        ],
+                                 axis=2)
+
+        uxgrid = ux.Grid.from_face_vertices(face_vertices,
+                                            latlon=True).build_topology()
+        uxgrid_lazy = ux.Grid.from_face_vertices(face_vertices, latlon=True)
+
+        for name in names:
+            nt.assert_array_equal(
+                getattr(uxgrid, name).values,
+                getattr(uxgrid_lazy, name).values)
+
 
 class TestClassMethods(TestCase):
     gridfile_ugrid = current_path / "meshfiles" / "ugrid" / "geoflow-small" / "grid.nc"
@@ -924,3 +1222,359 @@ class TestClassMethods(TestCase):
         uxgrid = ux.Grid.from_face_vertices(multi_face_latlon, latlon=True)
 
         single_face_cart = [(0.0,)]
+
+
+class TestRaggedGrid(TestCase):
+    gridfile_mixed = current_path / "meshfiles" / "exodus" / "mixed" / "mixed.exo"
+
+    def test_ragged_storage(self):
+        """Tests that ragged grids only store the CSR representation of
+        variable-length connectivity variables."""
+        uxgrid = ux.open_grid(self.gridfile_mixed, ragged=True)
+
+        assert uxgrid.ragged
+        assert "face_node_connectivity" not in uxgrid._ds
+
+        offsets, indices = uxgrid.get_csr_connectivity("face_node_connectivity")
+        nt.assert_array_equal(np.diff(offsets), uxgrid.n_nodes_per_face.values)
+        assert (indices != INT_FILL_VALUE).all()
+
+        # padded representation is materialized on access
+        assert uxgrid.face_node_connectivity.shape == (uxgrid.n_face,
+                                                       uxgrid.n_max_face_nodes)
+
+    def test_ragged_matches_padded(self):
+        """Tests that quantities derived from a ragged grid match those of a
+        padded grid."""
+        for grid_path in [self.gridfile_mixed, gridfile_mpas, gridfile_geoflow]:
+            uxgrid = ux.open_grid(grid_path)
+            uxgrid_ragged = ux.open_grid(grid_path, ragged=True)
+
+            for conn_name in [
+                    "face_node_connectivity", "edge_node_connectivity",
+                    "face_edge_connectivity", "edge_face_connectivity",
+                    "node_face_connectivity"
+            ]:
+                nt.assert_array_equal(
+                    getattr(uxgrid, conn_name).values,
+                    getattr(uxgrid_ragged, conn_name).values)
+
+            nt.assert_array_almost_equal(uxgrid.face_areas,
+                                         uxgrid_ragged.face_areas)
+            nt.assert_array_almost_equal(uxgrid.face_lon.values,
+                                         uxgrid_ragged.face_lon.values)
+            nt.assert_array_equal(uxgrid.antimeridian_face_indices,
+                                  uxgrid_ragged.antimeridian_face_indices)
+
+    def test_ragged_isel_copy(self):
+        """Tests that slicing and copying a ragged grid preserves its storage
+        mode."""
+        uxgrid_ragged = ux.open_grid(gridfile_mpas, ragged=True)
+
+        subset = uxgrid_ragged.isel(n_face=[0, 1, 2])
+        assert subset.ragged
+        assert subset.n_face == 3
+
+        grid_copy = uxgrid_ragged.copy()
+        assert grid_copy.ragged
+        assert grid_copy == uxgrid_ragged
+
+
+class TestConnectivityDtype(TestCase):
+
+    def test_int32_connectivity(self):
+        """Tests that connectivity stored as int32 matches the default
+        representation."""
+        fill_value_int32 = np.iinfo(np.int32).min
+
+        for grid_path in [gridfile_mpas, gridfile_geoflow]:
+            uxgrid = ux.open_grid(grid_path)
+            uxgrid_int32 = ux.open_grid(grid_path, connectivity_dtype=np.int32)
+
+            assert uxgrid_int32.connectivity_dtype == np.int32
+
+            for conn_name in [
+                    "face_node_connectivity", "edge_node_connectivity",
+                    "face_edge_connectivity", "edge_face_connectivity",
+                    "node_face_connectivity"
+            ]:
+                conn = getattr(uxgrid, conn_name).values
+                conn_int32 = getattr(uxgrid_int32, conn_name).values
+
+                assert conn_int32.dtype == np.int32
+                nt.assert_array_equal(conn == INT_FILL_VALUE,
+                                      conn_int32 == fill_value_int32)
+                nt.assert_array_equal(conn[conn != INT_FILL_VALUE],
+                                      conn_int32[conn_int32 != fill_value_int32])
+
+            nt.assert_array_almost_equal(uxgrid.face_areas,
+                                         uxgrid_int32.face_areas)
+
+    def test_set_connectivity_dtype(self):
+        """Tests setting the default connectivity dtype."""
+        ux.utils.set_connectivity_dtype(np.int32)
+        try:
+            uxgrid = ux.open_grid(gridfile_geoflow)
+            assert uxgrid.face_node_connectivity.dtype == np.int32
+        finally:
+            ux.utils.set_connectivity_dtype(ux.INT_DTYPE)
+
+        with self.assertRaises(ValueError):
+            ux.utils.set_connectivity_dtype(np.int16)
+
+
+class TestGridCache(TestCase):
+
+    def test_grid_cache(self):
+        """Tests that derived quantities are written to and loaded from the
+        grid cache."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ux.utils.enable_grid_cache(cache_dir)
+            try:
+                uxgrid = ux.open_grid(gridfile_geoflow)
+                edge_nodes = uxgrid.edge_node_connectivity.values
+                face_areas = uxgrid.face_areas
+
+                entry_dir = os.path.join(cache_dir, uxgrid._fingerprint)
+                assert os.path.isfile(
+                    os.path.join(entry_dir, "edge_node_connectivity-int64.npz"))
+
+                # replace the cached face areas to ensure they are loaded instead of computed
+                entry_path = os.path.join(entry_dir,
+                                          "face_areas-triangular-4-spherical.npz")
+                np.savez(entry_path,
+                         face_areas=np.ones_like(face_areas),
+                         face_jacobian=np.ones_like(face_areas))
+
+                uxgrid_cached = ux.open_grid(gridfile_geoflow)
+                nt.assert_array_equal(
+                    uxgrid_cached.edge_node_connectivity.values, edge_nodes)
+                nt.assert_array_equal(uxgrid_cached.face_areas,
+                                      np.ones_like(face_areas))
+            finally:
+                ux.utils.disable_grid_cache()
+
+    def test_grid_cache_disabled(self):
+        """Tests that nothing is written when the grid cache is disabled."""
+        uxgrid = ux.open_grid(gridfile_geoflow)
+        uxgrid.edge_node_connectivity
+
+        assert uxgrid._fingerprint is None
+
+
+class TestDerivedQuantities(TestCase):
+
+    def test_compute(self):
+        """Tests that requested quantities and the quantities they are
+        computed from are precomputed."""
+        uxgrid = ux.open_grid(gridfile_geoflow)
+        uxgrid.compute(["edge_face_connectivity", "face_areas"])
+
+        for name in [
+                "n_nodes_per_face", "edge_node_connectivity",
+                "face_edge_connectivity", "edge_face_connectivity", "node_x"
+        ]:
+            assert name in uxgrid._ds
+
+        assert uxgrid._face_areas is not None
+
+        uxgrid_lazy = ux.open_grid(gridfile_geoflow)
+        nt.assert_array_equal(uxgrid.edge_face_connectivity.values,
+                              uxgrid_lazy.edge_face_connectivity.values)
+        nt.assert_array_equal(uxgrid.face_areas, uxgrid_lazy.face_areas)
+
+        with self.assertRaises(ValueError):
+            uxgrid.compute("node_area")
+
+    def test_invalidate(self):
+        """Tests that modifying the node coordinates discards the quantities
+        that depend on them."""
+        from uxarray.grid.dependencies import _invalidate_derived
+
+        uxgrid = ux.open_grid(gridfile_geoflow)
+        uxgrid.compute(["edge_node_connectivity", "face_lon", "face_areas"])
+        uxgrid.get_ball_tree()
+        fingerprint = uxgrid.fingerprint
+
+        uxgrid._ds["node_lat"] = uxgrid.node_lat / 2
+        _invalidate_derived(uxgrid, ["node_lat"])
+
+        # topology is kept, geometry is discarded
+        assert "edge_node_connectivity" in uxgrid._ds
+        for name in ["face_lon", "node_x"]:
+            assert name not in uxgrid._ds
+        assert uxgrid._face_areas is None
+        assert len(uxgrid._face_area_cache) == 0
+        assert len(uxgrid._tree_cache) == 0
+
+        assert uxgrid.fingerprint != fingerprint
+        nt.assert_allclose(np.rad2deg(np.arcsin(uxgrid.node_z.values)),
+                           uxgrid.node_lat.values)
+
+
+    def test_update_coordinates(self):
+        """Tests that setting the node coordinates discards the quantities
+        that depend on them."""
+        uxgrid = ux.open_grid(gridfile_geoflow)
+        face_lon = uxgrid.face_lon.values.copy()
+        face_areas = uxgrid.face_areas.copy()
+        uxgrid.get_ball_tree(coordinates="face centers")
+        fingerprint = uxgrid.fingerprint
+
+        uxgrid.node_lon = uxgrid.node_lon.values / 2
+        assert uxgrid.fingerprint != fingerprint
+        assert len(uxgrid._tree_cache) == 0
+        assert not np.allclose(uxgrid.face_lon.values, face_lon)
+
+        uxgrid.node_lat = uxgrid.node_lat.values / 2
+        assert not np.allclose(uxgrid.face_areas, face_areas)
+        nt.assert_allclose(np.rad2deg(np.arcsin(uxgrid.node_z.values)),
+                           uxgrid.node_lat.values)
+
+        with self.assertRaises(ValueError):
+            uxgrid.node_lon = np.zeros(uxgrid.n_node + 1)
+
+class TestReorder(TestCase):
+
+    def test_reorder(self):
+        """Tests that reordering a grid permutes its faces, nodes and edges
+        consistently."""
+        for method in ["hilbert", "morton", "rcm"]:
+            for ragged in [False, True]:
+                uxgrid = ux.open_grid(gridfile_CSne30,
+                                      ragged=ragged).build_topology()
+                uxgrid_orig = ux.open_grid(gridfile_CSne30,
+                                           ragged=ragged).build_topology()
+
+                permutation = uxgrid.reorder(method)
+                face_perm = permutation["n_face"]
+                node_perm = permutation["n_node"]
+                edge_perm = permutation["n_edge"]
+
+                nt.assert_array_equal(np.sort(face_perm),
+                                      np.arange(uxgrid.n_face))
+
+                nt.assert_array_equal(uxgrid.node_lon.values,
+                                      uxgrid_orig.node_lon.values[node_perm])
+
+                # each face is composed of the same nodes
+                nt.assert_array_equal(
+                    node_perm[uxgrid.face_node_connectivity.values],
+                    uxgrid_orig.face_node_connectivity.values[face_perm])
+
+                # each edge connects the same nodes and saddles the same faces
+                nt.assert_array_equal(
+                    node_perm[uxgrid.edge_node_connectivity.values],
+                    uxgrid_orig.edge_node_connectivity.values[edge_perm])
+                nt.assert_array_equal(
+                    face_perm[uxgrid.edge_face_connectivity.values],
+                    uxgrid_orig.edge_face_connectivity.values[edge_perm])
+
+                nt.assert_allclose(uxgrid.face_areas,
+                                   uxgrid_orig.face_areas[face_perm])
+
+    def test_reorder_row_order(self):
+        """Tests that reordering a grid keeps the faces and edges of each
+        node in ascending order, with its neighboring nodes ordered by their
+        shared edge."""
+        for ragged in [False, True]:
+            uxgrid = ux.open_grid(gridfile_CSne30,
+                                  ragged=ragged).build_topology()
+            uxgrid.node_edge_connectivity
+            uxgrid.node_node_connectivity
+            uxgrid.edge_edge_connectivity
+
+            uxgrid.reorder("hilbert")
+
+            for name in ["node_face_connectivity", "node_edge_connectivity"]:
+                offsets, indices = uxgrid.get_csr_connectivity(name)
+                rows = np.repeat(np.arange(offsets.shape[0] - 1),
+                                 np.diff(offsets))
+                assert np.all((np.diff(indices) > 0) | (np.diff(rows) > 0))
+
+            # each neighboring node is the other node of the edge in the same position
+            offsets, node_edges = uxgrid.get_csr_connectivity(
+                "node_edge_connectivity")
+            _, node_nodes = uxgrid.get_csr_connectivity(
+                "node_node_connectivity")
+            edge_nodes = uxgrid.edge_node_connectivity.values[node_edges]
+            rows = np.repeat(np.arange(uxgrid.n_node), np.diff(offsets))
+            nt.assert_array_equal(
+                node_nodes,
+                np.where(edge_nodes[:, 0] == rows, edge_nodes[:, 1],
+                         edge_nodes[:, 0]))
+
+            # the other edges of the first node of each edge, followed by those of its second node
+            edge_offsets, edge_edges = uxgrid.get_csr_connectivity(
+                "edge_edge_connectivity")
+            for edge_idx in range(0, uxgrid.n_edge, 97):
+                expected = [
+                    other_edge for node_idx in
+                    uxgrid.edge_node_connectivity.values[edge_idx]
+                    for other_edge in
+                    node_edges[offsets[node_idx]:offsets[node_idx + 1]]
+                    if other_edge != edge_idx
+                ]
+                nt.assert_array_equal(
+                    edge_edges[edge_offsets[edge_idx]:
+                               edge_offsets[edge_idx + 1]], expected)
+
+    def test_reorder_locality(self):
+        """Tests that reordering a grid places the nodes of each face closer
+        to each other."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        def _node_span(grid):
+            face_nodes = grid.face_node_connectivity.values
+            return np.mean(face_nodes.max(axis=1) - face_nodes.min(axis=1))
+
+        span = _node_span(uxgrid)
+        uxgrid.reorder("hilbert")
+
+        assert _node_span(uxgrid) < span / 2
+
+    def test_reorder_invalid_method(self):
+        """Tests that an unsupported reordering method raises an error."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        with self.assertRaises(ValueError):
+            uxgrid.reorder("random")
+
+
+class TestPartition(TestCase):
+
+    def test_partition(self):
+        """Tests that the parts of a grid cover each face exactly once and
+        that the halo of each part consists of its neighbors."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+        face_faces = uxgrid.face_face_connectivity.values
+
+        for method in ["rcb", "hilbert"]:
+            parts, halos = uxgrid.partition(7, method=method)
+
+            assert len(parts) == 7
+            nt.assert_array_equal(np.sort(np.concatenate(parts)),
+                                  np.arange(uxgrid.n_face))
+
+            sizes = [part.shape[0] for part in parts]
+            assert max(sizes) - min(sizes) <= 1
+
+            for part, halo in zip(parts, halos):
+                assert np.intersect1d(part, halo).size == 0
+
+                # every edge neighbor outside of the part is in the halo
+                neighbors = face_faces[part].ravel()
+                neighbors = neighbors[neighbors != INT_FILL_VALUE]
+                assert np.isin(np.setdiff1d(neighbors, part), halo).all()
+
+    def test_partition_invalid(self):
+        """Tests that invalid arguments raise an error."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        with self.assertRaises(ValueError):
+            uxgrid.partition(0)
+
+        with self.assertRaises(ValueError):
+            uxgrid.partition(4, method="metis")
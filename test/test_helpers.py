@@ -81,6 +81,42 @@ class TestIntegrate(TestCase):
         np.testing.assert_array_almost_equal(W, dW)
 
 
+    def test_face_area_coords_mixed(self):
+        """Test that the area of each face of a mixed grid matches the area
+        computed by ``calculate_face_area`` for that face alone."""
+        x = np.array([0.0, 90.0, 90.0, 0.0, 180.0])
+        y = np.array([0.0, 0.0, 45.0, 45.0, 0.0])
+        z = np.zeros(5)
+
+        face_nodes = np.array([[0, 1, 2, 3], [1, 4, 2, INT_FILL_VALUE]],
+                              dtype=INT_DTYPE)
+        face_dimension = np.array([4, 3], dtype=INT_DTYPE)
+
+        for quadrature_rule, order in [("triangular", 4), ("gaussian", 5)]:
+            area, jacobian = ux.grid.area.get_all_face_area_from_coords(
+                x, y, z, face_nodes, face_dimension, 2, quadrature_rule,
+                order)
+
+            for face_idx, n_nodes in enumerate(face_dimension):
+                nodes = face_nodes[face_idx, :n_nodes]
+                expected_area, expected_jacobian = ux.grid.area.calculate_face_area(
+                    x[nodes], y[nodes], z[nodes], quadrature_rule, order)
+
+                nt.assert_allclose(area[face_idx], expected_area, rtol=1e-12)
+                nt.assert_allclose(jacobian[face_idx],
+                                   expected_jacobian,
+                                   rtol=1e-12)
+
+    def test_face_area_invalid_quadrature_rule(self):
+        x = np.array([0.0, 90.0, 90.0])
+        y = np.array([0.0, 0.0, 45.0])
+        face_nodes = np.array([[0, 1, 2]], dtype=INT_DTYPE)
+
+        with self.assertRaises(ValueError):
+            ux.grid.area.get_all_face_area_from_coords(
+                x, y, np.zeros(3), face_nodes, np.array([3]), 2, "simpson")
+
+
 class TestGridCenter(TestCase):
 
     def test_grid_center(self):
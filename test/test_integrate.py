@@ -3,6 +3,7 @@ import os
 from unittest import TestCase
 from pathlib import Path
 import numpy as np
+import dask.array
 
 import numpy.testing as nt
 
@@ -54,3 +55,101 @@ class TestIntegrate(TestCase):
         assert integral.ndim == len(dims) - 1
 
         nt.assert_almost_equal(integral, np.ones((5, 5)) * 4 * np.pi)
+
+    def test_exact(self):
+        """Integral using the closed-form face areas."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        uxda = ux.UxDataArray(data=np.ones((2, uxgrid.n_face)),
+                              dims=["a", "n_face"],
+                              uxgrid=uxgrid,
+                              name='var2')
+
+        integral = uxda.integrate(method="exact")
+
+        nt.assert_allclose(integral, np.ones(2) * 4 * np.pi, rtol=1e-13)
+
+    def test_dask(self):
+        """Integral of dask-backed data, which is computed lazily."""
+        uxgrid = ux.open_grid(self.gridfile_ne30)
+
+        test_data = np.random.default_rng(0).random((4, 3, uxgrid.n_face))
+
+        uxda = ux.UxDataArray(data=test_data,
+                              dims=["time", "lev", "n_face"],
+                              uxgrid=uxgrid,
+                              name='var2')
+        uxda_chunked = uxda.chunk({"time": 2, "n_face": 1000})
+
+        integral = uxda_chunked.integrate()
+
+        assert isinstance(integral.data, dask.array.Array)
+        assert integral.chunks == ((2, 2), (3,))
+
+        nt.assert_allclose(integral.values, uxda.integrate().values, rtol=1e-12)
+
+    def test_node_and_edge_centered(self):
+        """Integrals of data mapped to each node or edge, using the areas of
+        the dual cells around them."""
+        gridfile_mpas = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+
+        for grid_path in [self.gridfile_ne30, gridfile_mpas]:
+            uxgrid = ux.open_grid(grid_path)
+
+            # the dual cells cover the sphere
+            for n_elements, dim in [(uxgrid.n_node, "n_node"),
+                                    (uxgrid.n_edge, "n_edge")]:
+                uxda = ux.UxDataArray(data=np.ones((2, n_elements)),
+                                      dims=["a", dim],
+                                      uxgrid=uxgrid)
+                nt.assert_allclose(uxda.integrate(method="exact"),
+                                   np.ones(2) * 4 * np.pi)
+
+            # node-centered integration is consistent with integrating the nodal average of each face
+            node_data = ux.UxDataArray(
+                data=np.random.default_rng(0).random(uxgrid.n_node),
+                dims=["n_node"],
+                uxgrid=uxgrid)
+            nt.assert_allclose(node_data.integrate(),
+                               node_data.nodal_average().integrate())
+
+            # cached on the grid
+            assert uxgrid.compute_node_areas() is uxgrid.node_areas
+            assert uxgrid.compute_edge_areas() is uxgrid.edge_areas
+
+    def test_edge_areas(self):
+        """The area of the dual cell around each edge is the area of the kite
+        formed by its nodes and the centers of the faces on either side."""
+        from uxarray.grid.area import _get_all_face_area_exact_from_csr
+
+        gridfile_mpas = current_path / "meshfiles" / "mpas" / "QU" / "mesh.QU.1920km.151026.nc"
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        edge_nodes = uxgrid.edge_node_connectivity.values
+        edge_faces = uxgrid.edge_face_connectivity.values
+        valid = edge_faces != ux.INT_FILL_VALUE
+        edges = np.repeat(np.arange(uxgrid.n_edge), 2)[valid.ravel()]
+
+        # triangles formed by the center of each face and the nodes of each of its edges
+        x, y, z = (np.concatenate([
+            getattr(uxgrid, "node_" + axis).values,
+            getattr(uxgrid, "face_" + axis).values
+        ]) for axis in "xyz")
+        triangles = np.stack([
+            uxgrid.n_node + edge_faces[valid], edge_nodes[edges, 0],
+            edge_nodes[edges, 1]
+        ],
+                             axis=1).ravel()
+        triangle_areas = _get_all_face_area_exact_from_csr(
+            x,
+            y,
+            z,
+            np.arange(0, triangles.shape[0] + 1, 3),
+            triangles,
+            coords_type="cartesian")
+
+        nt.assert_allclose(uxgrid.compute_edge_areas(method="exact"),
+                           np.bincount(edges,
+                                       weights=triangle_areas,
+                                       minlength=uxgrid.n_edge),
+                           rtol=1e-10)
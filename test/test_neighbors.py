@@ -1,8 +1,11 @@
+import glob
+import json
 import os
 import numpy as np
 import numpy.testing as nt
 import xarray as xr
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from pathlib import Path
 
@@ -338,3 +341,343 @@ class TestKDTree(TestCase):
                 single_ind = uxgrid.get_kd_tree(coordinates="nodes").query_radius(cur_c, 45)
 
                 assert np.array_equal(single_ind, multi_ind[i])
+
+
+class TestTreeCache(TestCase):
+
+    def test_trees_coexist(self):
+        """Trees for different elements, coordinate systems and metrics are
+        each constructed once and kept side by side."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        node_tree = uxgrid.get_ball_tree(coordinates="nodes")
+        face_tree = uxgrid.get_ball_tree(coordinates="face centers")
+        cartesian_tree = uxgrid.get_ball_tree(coordinates="nodes",
+                                              coordinate_system="cartesian",
+                                              distance_metric="minkowski")
+        kd_tree = uxgrid.get_kd_tree(coordinates="nodes")
+
+        assert node_tree is not face_tree
+        assert node_tree is not cartesian_tree
+
+        # alternating between elements reuses the cached trees
+        for _ in range(3):
+            assert uxgrid.get_ball_tree(coordinates="nodes") is node_tree
+            assert uxgrid.get_ball_tree(coordinates="face centers") is face_tree
+        assert uxgrid.get_kd_tree(coordinates="nodes") is kd_tree
+
+        assert uxgrid.tree_cache_info() == {"hits": 7, "misses": 4, "size": 4, "max_size": ux.constants.TREE_CACHE_SIZE}
+
+        # trees on different elements return different neighbors
+        _, node_ind = node_tree.query([3.0, 3.0], k=3)
+        _, face_ind = face_tree.query([3.0, 3.0], k=3)
+        assert node_ind.max() < uxgrid.n_node
+        assert face_ind.max() < uxgrid.n_face
+
+        # reconstructing replaces the cached tree
+        assert uxgrid.get_ball_tree(coordinates="nodes", reconstruct=True) is not node_tree
+
+        uxgrid.clear_tree_cache()
+        assert uxgrid.tree_cache_info()["size"] == 0
+
+    def test_modified_tree(self):
+        """A cached tree whose coordinates are changed is not returned for
+        its original elements."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        node_tree = uxgrid.get_ball_tree(coordinates="nodes")
+        node_tree.coordinates = "face centers"
+
+        tree = uxgrid.get_ball_tree(coordinates="nodes")
+
+        assert tree is not node_tree
+        assert tree.coordinates == "nodes"
+        assert tree._n_elements == uxgrid.n_node
+        assert uxgrid.tree_cache_info()["hits"] == 0
+
+        _, ind = tree.query([3.0, 3.0], k=3)
+        _, ind_expected = uxgrid.get_ball_tree(coordinates="nodes",
+                                               reconstruct=True).query(
+                                                   [3.0, 3.0], k=3)
+        nt.assert_array_equal(ind, ind_expected)
+
+        # the modified tree still serves the face centers it was changed to
+        _, face_ind = node_tree.query([3.0, 3.0], k=3)
+        assert face_ind.max() < uxgrid.n_face
+
+    def test_size_bound(self):
+        """The least recently used tree is discarded once the cache is
+        full."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        max_size = ux.constants.TREE_CACHE_SIZE
+        try:
+            ux.constants.TREE_CACHE_SIZE = 2
+
+            node_tree = uxgrid.get_ball_tree(coordinates="nodes")
+            uxgrid.get_ball_tree(coordinates="face centers")
+            uxgrid.get_ball_tree(coordinates="nodes")
+            uxgrid.get_ball_tree(coordinates="edge centers")
+
+            assert uxgrid.tree_cache_info()["size"] == 2
+            assert uxgrid.get_ball_tree(coordinates="nodes") is node_tree
+            assert uxgrid.tree_cache_info()["misses"] == 3
+        finally:
+            ux.constants.TREE_CACHE_SIZE = max_size
+
+
+class TestTreeSerialization(TestCase):
+
+    def test_save_load(self):
+        """Trees loaded from disk have memory-mapped arrays and return the
+        same neighbors as the saved ones."""
+        import tempfile
+
+        uxgrid = ux.open_grid(gridfile_mpas)
+        coords = [[3.0, 3.0], [-60.0, 45.0]]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for tree_type, get_tree, query_coords in [
+                (ux.grid.neighbors.BallTree, uxgrid.get_ball_tree, coords),
+                (ux.grid.neighbors.KDTree, uxgrid.get_kd_tree, [[1.0, 0.0, 0.0], [0.0, 0.6, 0.8]]),
+            ]:
+                tree = get_tree(coordinates="face centers")
+                path = os.path.join(tmp_dir, tree_type.__name__)
+                tree.save(path)
+
+                loaded = tree_type.load(uxgrid, path)
+                assert loaded.coordinates == "face centers"
+                assert isinstance(loaded._current_tree().data.base, np.memmap)
+
+                d, ind = tree.query(query_coords, k=3)
+                d_loaded, ind_loaded = loaded.query(query_coords, k=3)
+                nt.assert_array_equal(ind, ind_loaded)
+                nt.assert_array_equal(d, d_loaded)
+
+            # trees are replaced by concurrent writers without ever being partially written
+            path = os.path.join(tmp_dir, "concurrent")
+            tree = uxgrid.get_ball_tree(coordinates="face centers")
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda _: tree.save(path), range(8)))
+
+            nt.assert_array_equal(ux.grid.neighbors.BallTree.load(uxgrid, path).query(coords, k=3)[1],
+                                  tree.query(coords, k=3)[1])
+            assert sorted(os.listdir(tmp_dir)) == ["BallTree", "KDTree", "concurrent"]
+
+            # trees are only loaded for the grid they were constructed from
+            with self.assertRaises(ValueError):
+                ux.grid.neighbors.BallTree.load(ux.open_grid(gridfile_CSne30),
+                                                os.path.join(tmp_dir, "BallTree"))
+
+            with self.assertRaises(ValueError):
+                ux.grid.neighbors.KDTree.load(uxgrid, os.path.join(tmp_dir, "BallTree"))
+
+            # trees are only loaded by the version of scikit-learn that saved them
+            metadata_path = os.path.join(tmp_dir, "BallTree", "tree.json")
+            with open(metadata_path) as f:
+                metadata = json.load(f)
+            metadata["sklearn_version"] = "0.0"
+            with open(metadata_path, "w") as f:
+                json.dump(metadata, f)
+
+            with self.assertRaises(ValueError):
+                ux.grid.neighbors.BallTree.load(uxgrid, os.path.join(tmp_dir, "BallTree"))
+
+    def test_grid_cache(self):
+        """Trees are written to the grid cache and loaded from it by other
+        grids opened from the same file."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ux.utils.enable_grid_cache(cache_dir)
+            try:
+                uxgrid = ux.open_grid(gridfile_mpas)
+                _, ind = uxgrid.get_ball_tree(coordinates="nodes").query([3.0, 3.0], k=3)
+
+                entry_paths = glob.glob(os.path.join(cache_dir, uxgrid.fingerprint,
+                                                     "tree-BallTree-nodes-spherical-haversine-*"))
+                assert len(entry_paths) == 1
+                assert os.path.isfile(os.path.join(entry_paths[0], "tree.json"))
+
+                tree_cached = ux.open_grid(gridfile_mpas).get_ball_tree(coordinates="nodes")
+                assert isinstance(tree_cached._current_tree().data.base, np.memmap)
+                nt.assert_array_equal(tree_cached.query([3.0, 3.0], k=3)[1], ind)
+            finally:
+                ux.utils.disable_grid_cache()
+
+
+    def test_grid_cache_edge_order(self):
+        """Grids with the same fingerprint but a different order of their
+        edges do not share cached edge trees."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            ux.utils.enable_grid_cache(cache_dir)
+            try:
+                # edges read from the MPAS file, and constructed from the faces
+                uxgrid = ux.open_grid(gridfile_mpas)
+                uxgrid_ugrid = ux.Grid(xr.Dataset({
+                    "node_lon": uxgrid.node_lon,
+                    "node_lat": uxgrid.node_lat,
+                    "face_node_connectivity": uxgrid.face_node_connectivity,
+                }))
+                assert uxgrid.fingerprint == uxgrid_ugrid.fingerprint
+                assert not np.array_equal(uxgrid.edge_lon.values, uxgrid_ugrid.edge_lon.values)
+
+                uxgrid.get_ball_tree(coordinates="edge centers")
+                tree = uxgrid_ugrid.get_ball_tree(coordinates="edge centers")
+
+                coords = np.stack([uxgrid_ugrid.edge_lon.values[:10], uxgrid_ugrid.edge_lat.values[:10]], axis=-1)
+                nt.assert_array_equal(tree.query(coords, k=1)[1].ravel(), np.arange(10))
+
+                # the tree of one grid is not loaded for the other one
+                path = os.path.join(cache_dir, "edge_tree")
+                uxgrid.get_ball_tree(coordinates="edge centers").save(path)
+                with self.assertRaises(ValueError):
+                    ux.grid.neighbors.BallTree.load(uxgrid_ugrid, path)
+            finally:
+                ux.utils.disable_grid_cache()
+
+class TestSphericalIndex(TestCase):
+    grid_files = [gridfile_CSne30, gridfile_mpas]
+
+    # random points uniformly distributed on the sphere, along with the poles and points on the antimeridian
+    rng = np.random.default_rng(0)
+    coords = np.concatenate([
+        np.stack([rng.uniform(-180, 180, 500),
+                  np.rad2deg(np.arcsin(rng.uniform(-1, 1, 500)))], axis=-1),
+        [[0.0, 90.0], [0.0, -90.0], [180.0, 0.0], [-180.0, 10.0]],
+    ])
+
+    def test_query(self):
+        """Compares the k nearest neighbors with those of the haversine
+        BallTree."""
+        for grid_file in self.grid_files:
+            uxgrid = ux.open_grid(grid_file)
+
+            for coordinates in ["nodes", "face centers", "edge centers"]:
+                index = uxgrid.get_spherical_index(coordinates=coordinates)
+                tree = uxgrid.get_ball_tree(coordinates=coordinates)
+
+                d, ind = index.query(self.coords, k=4)
+                d_tree, _ = tree.query(self.coords, k=4)
+
+                assert ind.shape == (self.coords.shape[0], 4)
+                nt.assert_allclose(d, d_tree, atol=1e-10)
+
+                # neighbors are sorted by their great-circle distance
+                assert np.all(np.diff(d, axis=1) >= 0)
+
+        d, ind = index.query([3.0, 3.0], k=1, in_radians=True)
+        assert ind.ndim == 0
+
+        with self.assertRaises(AssertionError):
+            index.query([3.0, 3.0], k=0)
+
+    def test_query_radius(self):
+        """Compares the neighbors within a radius with those of the haversine
+        BallTree."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        index = uxgrid.get_spherical_index(coordinates="face centers")
+        tree = uxgrid.get_ball_tree(coordinates="face centers")
+
+        d, ind = index.query_radius(self.coords, 5.0, return_distance=True, sort_results=True)
+        ind_tree = tree.query_radius(self.coords, 5.0)
+
+        for cur_d, cur_ind, cur_ind_tree in zip(d, ind, ind_tree):
+            nt.assert_array_equal(np.sort(cur_ind), np.sort(cur_ind_tree))
+            assert np.all(cur_d <= 5.0)
+            assert np.all(np.diff(cur_d) >= 0)
+
+        counts = index.query_radius(self.coords, 5.0, count_only=True)
+        nt.assert_array_equal(counts, [len(cur_ind) for cur_ind in ind_tree])
+
+    def test_cached(self):
+        """The index of each element is constructed once per grid."""
+        uxgrid = ux.open_grid(gridfile_mpas)
+
+        index = uxgrid.get_spherical_index(coordinates="nodes")
+        assert uxgrid.get_spherical_index(coordinates="nodes") is index
+        assert uxgrid.get_spherical_index(coordinates="face centers") is not index
+
+        with self.assertRaises(ValueError):
+            uxgrid.get_spherical_index(coordinates="corners")
+
+
+class TestLocatePoints(TestCase):
+
+    def test_face_centers(self):
+        """Each face center is located in its own face."""
+        for grid_file in [gridfile_CSne30, gridfile_mpas]:
+            uxgrid = ux.open_grid(grid_file)
+
+            faces = uxgrid.locate_points(uxgrid.face_lon.values, uxgrid.face_lat.values)
+            nt.assert_array_equal(faces, np.arange(uxgrid.n_face))
+
+    def test_elongated_faces(self):
+        """Points are located in the face that contains them, not the face
+        with the closest center, and outside of a regional grid."""
+        uxgrid = ux.Grid.from_face_vertices(
+            [[(0.0, 0.0), (1.0, 0.0), (1.0, 10.0), (0.0, 10.0)],
+             [(1.0, 0.0), (1.2, 0.0), (1.2, 10.0), (1.0, 10.0)]],
+            latlon=True,
+        )
+
+        # the first point is closer to the center of the narrow face
+        faces = uxgrid.locate_points([0.95, 1.1, 5.0], [5.0, 5.0, 5.0])
+        nt.assert_array_equal(faces, [0, 1, -1])
+
+        nt.assert_array_equal(uxgrid.locate_points(0.5, [[1.0], [9.0]]), [[0], [0]])
+
+
+class TestChunkedQuery(TestCase):
+    rng = np.random.default_rng(0)
+    coords = np.stack([rng.uniform(-180, 180, 1000),
+                       np.rad2deg(np.arcsin(rng.uniform(-1, 1, 1000)))], axis=-1)
+
+    def test_chunks(self):
+        """Querying in chunks with several threads matches a single query."""
+        uxgrid = ux.open_grid(gridfile_CSne30)
+
+        for tree in [uxgrid.get_ball_tree(coordinates="face centers"),
+                     uxgrid.get_kd_tree(coordinates="nodes", coordinate_system="spherical")]:
+            d, ind = tree.query(self.coords, k=3)
+            d_chunked, ind_chunked = tree.query(self.coords, k=3, chunk_size=64, n_workers=4)
+
+            nt.assert_array_equal(ind_chunked, ind)
+            nt.assert_array_equal(d_chunked, d)
+
+            nt.assert_array_equal(tree.query(self.coords, k=3, return_distance=False, chunk_size=100), ind)
+
+        with self.assertRaises(ValueError):
+            tree.query(self.coords, k=3, chunk_size=0)
+
+    def test_output(self):
+        """Results are written to preallocated arrays and cast to the
+        requested data types."""
+        import tempfile
+
+        uxgrid = ux.open_grid(gridfile_CSne30)
+        tree = uxgrid.get_ball_tree(coordinates="face centers")
+
+        d, ind = tree.query(self.coords, k=2)
+
+        d32, ind32 = tree.query(self.coords, k=2, index_dtype=np.int32, distance_dtype=np.float32)
+        assert ind32.dtype == np.int32 and d32.dtype == np.float32
+        nt.assert_array_equal(ind32, ind)
+        nt.assert_allclose(d32, d, rtol=1e-6)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ind_out = np.lib.format.open_memmap(os.path.join(tmpdir, "ind.npy"), mode="w+",
+                                                dtype=np.int32, shape=(self.coords.shape[0], 2))
+            d_out = np.empty((self.coords.shape[0], 2))
+
+            result = tree.query(self.coords, k=2, chunk_size=100, out=(d_out, ind_out))
+            assert result[0] is d_out and result[1] is ind_out
+            nt.assert_array_equal(ind_out, ind)
+            nt.assert_array_equal(d_out, d)
+            del ind_out
+
+        with self.assertRaises(ValueError):
+            tree.query(self.coords, k=2, out=(d_out, np.empty((10, 2), dtype=ux.INT_DTYPE)))
@@ -53,6 +53,37 @@ class TestNearestNeighborRemap(TestCase):
         assert np.array_equal(source_data_single_dim, destination_single_data)
         assert np.array_equal(source_data_multi_dim, destination_multi_data)
 
+    def test_remap_to_equal_grid_edge_centers(self):
+        """Edge data is remapped by location between equal grids whose edges
+        are ordered differently."""
+        import xarray as xr
+
+        uxgrid = ux.open_grid(mpasfile_QU)
+        grid_ds = xr.Dataset({
+            "node_lon": uxgrid.node_lon,
+            "node_lat": uxgrid.node_lat,
+            "face_node_connectivity": uxgrid.face_node_connectivity,
+        })
+
+        # the edges of the source grid are constructed from its faces, and those of the destination grid are given
+        # in reverse order
+        source_grid = ux.Grid(grid_ds)
+        destination_grid = ux.Grid(grid_ds.assign(
+            edge_node_connectivity=source_grid.edge_node_connectivity[::-1]))
+        assert source_grid == destination_grid
+
+        # data equal to the index of each source edge
+        source_data = np.arange(source_grid.n_edge, dtype=np.float64)
+
+        destination_data = _nearest_neighbor(source_grid, destination_grid, source_data,
+                                             remap_to="edge centers")
+
+        # each destination edge receives the data of the source edge at the same location
+        d, ind = source_grid.get_ball_tree(coordinates="edge centers").query(
+            np.stack([destination_grid.edge_lon.values, destination_grid.edge_lat.values], axis=-1), k=1)
+        assert np.array_equal(destination_data, ind.ravel())
+        assert not np.array_equal(destination_data, source_data)
+
     def test_remap_to_corner_nodes_cartesian(self):
         """Test remapping to the same dummy 3-vertex grid, using cartesian
         coordinates.
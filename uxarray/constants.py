@@ -1,12 +1,34 @@
+import os
+
 import numpy as np
 
 # numpy indexing code is written for np.intp
 INT_DTYPE = np.intp
 INT_FILL_VALUE = np.iinfo(INT_DTYPE).min
 
+# supported data types for storing connectivity variables, with the fill value of each being its minimum value
+CONNECTIVITY_DTYPES = (np.dtype(np.int32), np.dtype(INT_DTYPE))
+
+# default data type for storing connectivity variables, which can be set to np.int32 to halve the memory footprint
+# of grids with fewer than 2^31 elements
+CONNECTIVITY_DTYPE = np.dtype(INT_DTYPE)
+
 ERROR_TOLERANCE = 1.0e-15
 
 ENABLE_JIT_CACHE = True
 ENABLE_JIT = True
 
 GRID_DIMS = ["n_node", "n_edge", "n_face"]
+
+# maximum number of face area and jacobian arrays (one per method, quadrature rule, order and coordinate type), and of
+# node and edge areas derived from them, that each grid keeps in memory, with the least recently used one being
+# discarded first
+FACE_AREA_CACHE_SIZE = 8
+
+# maximum number of neighbor trees (one per tree type, element, coordinate system and distance metric) that each grid
+# keeps in memory, with the least recently used one being discarded first
+TREE_CACHE_SIZE = 8
+
+# root directory of the persistent cache of derived grid quantities, which is disabled when set to None
+DEFAULT_GRID_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "uxarray")
+GRID_CACHE_DIR = os.environ.get("UXARRAY_GRID_CACHE_DIR")
@@ -19,6 +19,8 @@ def open_grid(
     ],
     latlon: Optional[bool] = False,
     use_dual: Optional[bool] = False,
+    ragged: Optional[bool] = False,
+    connectivity_dtype: Optional[np.dtype] = None,
     **kwargs: Dict[str, Any],
 ) -> Grid:
     """Creates a ``uxarray.Grid`` object from a grid topology definition.
@@ -39,6 +41,15 @@ def open_grid(
     use_dual: bool, optional
         Specify whether to use the primal (use_dual=False) or dual (use_dual=True) mesh if the file type is mpas
 
+    ragged: bool, optional
+        Specify whether to store variable-length connectivity variables (i.e. ``face_node_connectivity``) in
+        compressed sparse row (CSR) format instead of padding them with fill values, which reduces the memory
+        footprint of mixed-element grids
+
+    connectivity_dtype: np.dtype, optional
+        Specify the integer data type (``np.int32`` or ``np.int64``) used to store connectivity variables, defaults to
+        ``uxarray.constants.CONNECTIVITY_DTYPE``
+
     **kwargs : Dict[str, Any]
         Additional arguments passed on to ``xarray.open_dataset``. Refer to the
         [xarray
@@ -69,11 +80,21 @@ def open_grid(
 
     # construct Grid from dataset
     if isinstance(grid_filename_or_obj, xr.Dataset):
-        uxgrid = Grid.from_dataset(grid_filename_or_obj, use_dual=use_dual)
+        uxgrid = Grid.from_dataset(
+            grid_filename_or_obj,
+            use_dual=use_dual,
+            ragged=ragged,
+            connectivity_dtype=connectivity_dtype,
+        )
 
     # construct Grid from face vertices
     elif isinstance(grid_filename_or_obj, (list, tuple, np.ndarray, xr.DataArray)):
-        uxgrid = Grid.from_face_vertices(grid_filename_or_obj, latlon=latlon)
+        uxgrid = Grid.from_face_vertices(
+            grid_filename_or_obj,
+            latlon=latlon,
+            ragged=ragged,
+            connectivity_dtype=connectivity_dtype,
+        )
 
     # attempt to use Xarray directly for remaining input types
     else:
@@ -82,7 +103,12 @@ def open_grid(
                 grid_filename_or_obj, decode_times=False, **kwargs
             )
 
-            uxgrid = Grid.from_dataset(grid_ds, use_dual=use_dual)
+            uxgrid = Grid.from_dataset(
+                grid_ds,
+                use_dual=use_dual,
+                ragged=ragged,
+                connectivity_dtype=connectivity_dtype,
+            )
         except ValueError:
             raise ValueError("Inputted grid_filename_or_obj not supported.")
 
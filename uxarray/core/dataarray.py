@@ -15,12 +15,8 @@ from xarray.core.utils import UncachedAccessor
 
 from warnings import warn
 
-from uxarray.core.gradient import (
-    _calculate_grad_on_edge_from_faces,
-    _calculate_edge_face_difference,
-    _calculate_edge_node_difference,
-)
-
+from uxarray.core.utils import _area_weighted_sum
+from uxarray.grid.operators import _get_operator, _apply_operator
 from uxarray.plot.accessor import UxDataArrayPlotAccessor
 from uxarray.subset import DataArraySubsetAccessor
 from uxarray.remap import UxDataArrayRemapAccessor
@@ -311,22 +307,34 @@ class UxDataArray(xr.DataArray):
         )
 
     def integrate(
-        self, quadrature_rule: Optional[str] = "triangular", order: Optional[int] = 4
+        self,
+        quadrature_rule: Optional[str] = "triangular",
+        order: Optional[int] = 4,
+        method: Optional[str] = "quadrature",
     ) -> UxDataArray:
         """Computes the integral of a data variable residing on an unstructured
         grid.
 
+        Data mapped to each face is weighted by the area of each face, while
+        data mapped to each node or edge is weighted by the area of the dual
+        cell around each node (``Grid.compute_node_areas``) or edge
+        (``Grid.compute_edge_areas``).
+
         Parameters
         ----------
         quadrature_rule : str, optional
             Quadrature rule to use. Defaults to "triangular".
         order : int, optional
             Order of quadrature rule. Defaults to 4.
+        method : str, optional
+            Either "quadrature" (default), which computes the face areas using ``quadrature_rule`` and ``order``,
+            or "exact", which computes them in closed form (see ``Grid.compute_face_areas``)
 
         Returns
         -------
         uxda : UxDataArray
-            UxDataArray containing the integrated data variable
+            UxDataArray containing the integrated data variable, which is lazy (dask-backed) if the data variable is
+            backed by a dask array
 
         Examples
         --------
@@ -336,28 +344,34 @@ class UxDataArray(xr.DataArray):
         # Compute the integral
         >>> integral = uxds['psi'].integrate()
         """
-        if self.values.shape[-1] == self.uxgrid.n_face:
-            face_areas, face_jacobian = self.uxgrid.compute_face_areas(
-                quadrature_rule, order
+        if self.shape[-1] == self.uxgrid.n_face:
+            areas, face_jacobian = self.uxgrid.compute_face_areas(
+                quadrature_rule, order, method=method
             )
 
-            # perform dot product between face areas and last dimension of data
-            integral = np.einsum("i,...i", face_areas, self.values)
-
-        elif self.values.shape[-1] == self.uxgrid.n_node:
-            raise ValueError("Integrating data mapped to each node not yet supported.")
+        elif self.shape[-1] == self.uxgrid.n_node:
+            # area of the dual cell around each node
+            areas = self.uxgrid.compute_node_areas(
+                quadrature_rule, order, method=method
+            )
 
-        elif self.values.shape[-1] == self.uxgrid.n_edge:
-            raise ValueError("Integrating data mapped to each edge not yet supported.")
+        elif self.shape[-1] == self.uxgrid.n_edge:
+            # area of the dual cell around each edge
+            areas = self.uxgrid.compute_edge_areas(
+                quadrature_rule, order, method=method
+            )
 
         else:
             raise ValueError(
                 f"The final dimension of the data variable does not match the number of nodes, edges, "
                 f"or faces. Expected one of "
                 f"{self.uxgrid.n_node}, {self.uxgrid.n_edge}, or {self.uxgrid.n_face}, "
-                f"but received {self.values.shape[-1]}"
+                f"but received {self.shape[-1]}"
             )
 
+        # perform dot product between areas and last dimension of data, without loading dask-backed data
+        integral = _area_weighted_sum(areas, self.data)
+
         # construct a uxda with integrated quantity
         uxda = UxDataArray(
             integral, uxgrid=self.uxgrid, dims=self.dims[:-1], name=self.name
@@ -379,25 +393,19 @@ class UxDataArray(xr.DataArray):
                 f"{self.uxgrid.n_face}."
             )
 
-        data = self.values
-        face_nodes = self.uxgrid.face_node_connectivity.values
-        n_nodes_per_face = self.uxgrid.n_nodes_per_face.values
+        # move the node dimension to the end
+        uxda = self.transpose(..., "n_node")
 
-        # compute the nodal average while preserving original dimensions
-        data_nodal_average = np.array(
-            [
-                np.mean(data[..., cur_face[0:n_max_nodes]], axis=-1)
-                for cur_face, n_max_nodes in zip(face_nodes, n_nodes_per_face)
-            ]
-        )
+        # (n_face, n_node) averaging matrix, which is built once per grid
+        face_node_average = _get_operator(self.uxgrid, "face_node_average")
 
-        # set `n_nodes` as final dimension
-        data_nodal_average = np.moveaxis(data_nodal_average, 0, -1)
+        # compute the nodal average while preserving the other dimensions, lazily for dask-backed data
+        data_nodal_average = _apply_operator(face_node_average, uxda.data)
 
         return UxDataArray(
             uxgrid=self.uxgrid,
             data=data_nodal_average,
-            dims=self.dims,
+            dims=uxda.dims,
             name=self.name + "_nodal_average" if self.name is not None else None,
         ).rename({"n_node": "n_face"})
 
@@ -446,15 +454,18 @@ class UxDataArray(xr.DataArray):
                 "currently store any information for representing the sign."
             )
 
-        _grad = _calculate_grad_on_edge_from_faces(
-            d_var=self.values,
-            edge_faces=self.uxgrid.edge_face_connectivity.values,
-            edge_face_distances=self.uxgrid.edge_face_distances.values,
-            n_edge=self.uxgrid.n_edge,
-            normalize=normalize,
-        )
+        # move the face dimension to the end
+        uxda = self.transpose(..., "n_face")
+
+        # (n_edge, n_face) gradient matrix, which is built once per grid
+        edge_face_gradient = _get_operator(self.uxgrid, "edge_face_gradient")
+
+        _grad = np.abs(_apply_operator(edge_face_gradient, uxda.data))
+
+        if normalize:
+            _grad = _grad / np.sqrt((_grad**2).sum())
 
-        dims = list(self.dims)
+        dims = list(uxda.dims)
         dims[-1] = "n_edge"
 
         uxda = UxDataArray(
@@ -493,16 +504,17 @@ class UxDataArray(xr.DataArray):
                 f"Invalid destination '{destination}'. Must be one of ['node', 'edge', 'face']"
             )
 
-        dims = list(self.dims)
         var_name = str(self.name) + "_" if self.name is not None else " "
 
         if self._face_centered():
             if destination == "edge":
-                _difference = _calculate_edge_face_difference(
-                    self.values,
-                    self.uxgrid.edge_face_connectivity.values,
-                    self.uxgrid.n_edge,
+                uxda = self.transpose(..., "n_face")
+                _difference = np.abs(
+                    _apply_operator(
+                        _get_operator(self.uxgrid, "edge_face_difference"), uxda.data
+                    )
                 )
+                dims = list(uxda.dims)
                 dims[-1] = "n_edge"
                 name = f"{var_name}edge_face_difference"
             elif destination == "face":
@@ -518,9 +530,13 @@ class UxDataArray(xr.DataArray):
 
         elif self._node_centered():
             if destination == "edge":
-                _difference = _calculate_edge_node_difference(
-                    self.values, self.uxgrid.edge_node_connectivity.values
+                uxda = self.transpose(..., "n_node")
+                _difference = np.abs(
+                    _apply_operator(
+                        _get_operator(self.uxgrid, "edge_node_difference"), uxda.data
+                    )
                 )
+                dims = list(uxda.dims)
                 dims[-1] = "n_edge"
                 name = f"{var_name}edge_node_difference"
             elif destination == "node":
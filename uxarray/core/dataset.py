@@ -5,10 +5,14 @@ import xarray as xr
 
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
+
 from typing import Optional, IO, Union
 
 from uxarray.grid import Grid
 from uxarray.core.dataarray import UxDataArray
+from uxarray.core.utils import _area_weighted_sum
+from uxarray.constants import GRID_DIMS
 
 from uxarray.plot.accessor import UxDatasetPlotAccessor
 
@@ -265,8 +269,16 @@ class UxDataset(xr.Dataset):
         lines.append("}")
         buf.write("\n".join(lines))
 
-    def integrate(self, quadrature_rule="triangular", order=4):
-        """Integrates over all the faces of the givfen mesh.
+    def integrate(
+        self,
+        quadrature_rule: Optional[str] = "triangular",
+        order: Optional[int] = 4,
+        method: Optional[str] = "quadrature",
+        n_workers: Optional[int] = None,
+    ) -> UxDataset:
+        """Integrates every data variable of this dataset that is mapped to
+        the faces, nodes or edges of its grid over all of them, sharing a
+        single computation of the areas of each kind of element.
 
         Parameters
         ----------
@@ -274,10 +286,19 @@ class UxDataset(xr.Dataset):
             Quadrature rule to use. Defaults to "triangular".
         order : int, optional
             Order of quadrature rule. Defaults to 4.
+        method : str, optional
+            Either "quadrature" (default), which computes the face areas using ``quadrature_rule`` and ``order``,
+            or "exact", which computes them in closed form (see ``Grid.compute_face_areas``)
+        n_workers : int, optional
+            Number of threads used to load and integrate the data variables concurrently, which speeds up
+            integrating variables that are lazily read from disk. Defaults to integrating one variable at a time.
+            Dask-backed data variables are always integrated lazily.
 
         Returns
         -------
-        Calculated integral : float
+        uxds : UxDataset
+            UxDataset containing the integral of each data variable over its grid dimension (see
+            ``UxDataArray.integrate``), which is lazy (dask-backed) for dask-backed data variables
 
         Examples
         --------
@@ -286,39 +307,129 @@ class UxDataset(xr.Dataset):
         >>> import uxarray as ux
         >>> uxds = ux.open_dataset("grid.ug", "centroid_pressure_data_ug")
 
-        # Compute the integral
+        # Compute the integral of each data variable
         >>> integral = uxds.integrate()
         """
 
-        # TODO: Deprecation Warning
-        warn(
-            "This method currently only works when there is a single DataArray in this Dataset. For integration of a "
-            "single data variable, use the UxDataArray.integrate() method instead. This function will be deprecated and "
-            "replaced with one that can perform a Dataset-wide integration in a future release.",
-            DeprecationWarning,
+        # grid dimension of each data variable that is integrated
+        grid_dims = {}
+        for name, da in self.data_vars.items():
+            for dim in ("n_face", "n_node", "n_edge"):
+                if dim in da.dims:
+                    grid_dims[name] = dim
+                    break
+
+        # area of each face, or of the dual cell around each node or edge
+        areas = {}
+        for dim in set(grid_dims.values()):
+            if dim == "n_face":
+                areas[dim], _ = self.uxgrid.compute_face_areas(
+                    quadrature_rule, order, method=method
+                )
+            elif dim == "n_node":
+                areas[dim] = self.uxgrid.compute_node_areas(
+                    quadrature_rule, order, method=method
+                )
+            else:
+                areas[dim] = self.uxgrid.compute_edge_areas(
+                    quadrature_rule, order, method=method
+                )
+
+        def _integrate(name):
+            variable = self.variables[name].transpose(..., grid_dims[name])
+            integral = _area_weighted_sum(areas[grid_dims[name]], variable.data)
+
+            return xr.Variable(variable.dims[:-1], integral, attrs=variable.attrs)
+
+        if n_workers is not None and n_workers > 1:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                integrals = list(executor.map(_integrate, grid_dims))
+        else:
+            integrals = [_integrate(name) for name in grid_dims]
+
+        # coordinates that do not depend on the grid (i.e. time)
+        coords = {
+            name: coord
+            for name, coord in self.coords.items()
+            if not set(coord.dims).intersection(GRID_DIMS)
+        }
+
+        return UxDataset(
+            dict(zip(grid_dims, integrals)),
+            coords=coords,
+            uxgrid=self.uxgrid,
+            source_datasets=self.source_datasets,
         )
 
-        integral = 0.0
+    def reorder(self, method: Optional[str] = "hilbert"):
+        """Reorders the faces, nodes and edges of a copy of the grid of this
+        dataset for memory locality (see ``Grid.reorder``) and permutes the
+        data variables consistently.
 
-        # call function to get area of all the faces as a np array
-        face_areas, face_jacobian = self.uxgrid.compute_face_areas(
-            quadrature_rule, order
+        Parameters
+        ----------
+        method : str, default="hilbert"
+            Reordering method, one of "hilbert", "morton" or "rcm"
+
+        Returns
+        -------
+        uxds : UxDataset
+            Reordered dataset. The permutation of each dimension, which is required for restoring the original order
+            (i.e. before writing), is returned by calling ``Grid.reorder`` directly instead
+
+        Examples
+        --------
+        >>> uxds_reordered = uxds.reorder("hilbert")
+        """
+        uxgrid = self.uxgrid.copy()
+        permutation = uxgrid.reorder(method)
+
+        ds = self.isel(
+            {dim: perm for dim, perm in permutation.items() if dim in self.dims}
         )
+        ds.uxgrid = uxgrid
 
-        # TODO: Should we fix this requirement? Shouldn't it be applicable to
-        # TODO: all variables of dataset or a dataarray instead?
-        var_key = list(self.keys())
-        if len(var_key) > 1:
-            # warning: print message
-            print(
-                "WARNING: The dataset has more than one variable, using the first variable for integration"
-            )
+        return ds
 
-        var_key = var_key[0]
-        face_vals = self[var_key].to_numpy()
-        integral = np.dot(face_areas, face_vals)
+    def partition(self, n_parts: int, method: Optional[str] = "rcb"):
+        """Partitions the faces of the grid of this dataset into spatially
+        contiguous parts (see ``Grid.partition``) and chunks the dataset along
+        them, such that each chunk of ``n_face`` covers a single region.
 
-        return integral
+        Since chunks are contiguous ranges of indices, the faces (and the nodes and edges of a copy of the grid)
+        are reordered so that the faces of each part are stored consecutively.
+
+        Parameters
+        ----------
+        n_parts : int
+            Number of parts
+        method : str, default="rcb"
+            Partitioning method, either "rcb" or "hilbert"
+
+        Returns
+        -------
+        uxds : UxDataset
+            Reordered dataset, chunked along ``n_face`` with one chunk per part
+
+        Examples
+        --------
+        >>> uxds_partitioned = uxds.partition(8)
+        """
+        from uxarray.grid.reorder import _permute_grid
+
+        uxgrid = self.uxgrid.copy()
+        parts, _ = uxgrid.partition(n_parts, method)
+        permutation = _permute_grid(uxgrid, np.concatenate(parts))
+
+        ds = self.isel(
+            {dim: perm for dim, perm in permutation.items() if dim in self.dims}
+        )
+        ds.uxgrid = uxgrid
+
+        if "n_face" in ds.dims:
+            ds = ds.chunk({"n_face": tuple(part.shape[0] for part in parts)})
+
+        return ds
 
     def to_array(self) -> UxDataArray:
         """Override to make the result an instance of
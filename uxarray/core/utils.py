@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def _map_dims_to_ugrid(
     ds,
     _source_dims_dict,
@@ -32,3 +35,18 @@ def _map_dims_to_ugrid(
     ds = ds.swap_dims(_source_dims_dict)
 
     return ds
+
+
+def _area_weighted_sum(areas, data):
+    """Sums an array over its last dimension (a grid dimension), weighted by
+    the area associated with each element (i.e. face).
+
+    In-memory data is reduced with a single matrix-vector product, while
+    dask-backed data is reduced lazily, chunk by chunk, through
+    ``dask.array.einsum``.
+    """
+    if isinstance(data, np.ndarray):
+        n_elements = data.shape[-1]
+        return (data.reshape(-1, n_elements) @ areas).reshape(data.shape[:-1])
+
+    return np.einsum("i,...i", areas, data)
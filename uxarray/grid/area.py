@@ -1,12 +1,17 @@
+import math
+
 import numpy as np
-from numba import njit, config
-from uxarray.constants import ENABLE_JIT_CACHE, ENABLE_JIT
+from numba import njit, prange, config
+from uxarray.constants import ENABLE_JIT_CACHE, ENABLE_JIT, INT_DTYPE
 
-from uxarray.grid.coordinates import node_lonlat_rad_to_xyz
+from uxarray.grid.coordinates import node_lonlat_rad_to_xyz, _get_xyz_from_lonlat
 
 
 config.DISABLE_JIT = not ENABLE_JIT
 
+# methods for computing the area of each face, see ``Grid.compute_face_areas``
+AREA_METHODS = ("quadrature", "exact")
+
 
 @njit(cache=ENABLE_JIT_CACHE)
 def calculate_face_area(
@@ -99,7 +104,6 @@ def calculate_face_area(
     return area, jacobian
 
 
-@njit(cache=ENABLE_JIT_CACHE)
 def get_all_face_area_from_coords(
     x,
     y,
@@ -145,35 +149,437 @@ def get_all_face_area_from_coords(
     -------
     area of all faces : ndarray
     """
-
     n_face, n_max_face_nodes = face_nodes.shape
 
-    # set initial area of each face to 0
-    area = np.zeros(n_face)
-    jacobian = np.zeros(n_face)
+    # only the first ``face_geometry[i]`` nodes of face ``i`` are used
+    valid = np.arange(n_max_face_nodes) < np.asarray(face_geometry)[:, np.newaxis]
+
+    offsets = np.zeros(n_face + 1, dtype=INT_DTYPE)
+    np.cumsum(np.count_nonzero(valid, axis=1), out=offsets[1:])
+
+    return _get_all_face_area_from_csr(
+        x,
+        y,
+        z,
+        offsets,
+        face_nodes[valid],
+        dim,
+        quadrature_rule,
+        order,
+        coords_type,
+    )
 
-    for face_idx, max_nodes in enumerate(face_geometry):
-        face_x = x[face_nodes[face_idx, 0:max_nodes]]
-        face_y = y[face_nodes[face_idx, 0:max_nodes]]
 
-        # check if z dimension
+def _get_all_face_area_from_csr(
+    x,
+    y,
+    z,
+    offsets,
+    indices,
+    dim,
+    quadrature_rule="triangular",
+    order=4,
+    coords_type="spherical",
+):
+    """Computes the area of each face given a ``face_node_connectivity``
+    stored in compressed sparse row (CSR) format, see
+    ``get_all_face_area_from_coords``.
+
+    The node coordinates are converted to Cartesian coordinates and the
+    quadrature table is constructed once, after which the faces are
+    integrated in parallel by ``_face_areas_kernel``.
 
+    Parameters
+    ----------
+    offsets : ndarray, required
+        Row offsets of shape (``n_face + 1``), where the nodes of face ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``
+
+    indices : ndarray, required
+        Flattened node ids of each face
+
+    Returns
+    -------
+    area of all faces : ndarray
+    """
+    if coords_type == "spherical":
+        node_x, node_y, node_z = _get_xyz_from_lonlat(x, y)
+    else:
+        node_x = np.ascontiguousarray(x, dtype=np.float64)
+        node_y = np.ascontiguousarray(y, dtype=np.float64)
+
+        # check if z dimension
         if dim > 2:
-            face_z = z[face_nodes[face_idx, 0:max_nodes]]
+            node_z = np.ascontiguousarray(z, dtype=np.float64)
         else:
-            face_z = face_x * 0.0
+            node_z = np.zeros_like(node_x)
+
+    dA, dB, weights = _get_quadrature_table(quadrature_rule, order)
+
+    return _face_areas_kernel(
+        node_x,
+        node_y,
+        node_z,
+        np.ascontiguousarray(offsets),
+        np.ascontiguousarray(indices),
+        dA,
+        dB,
+        weights,
+        quadrature_rule == "triangular",
+    )
+
+
+def _get_quadrature_table(quadrature_rule="triangular", order=4):
+    """Flattens the points and weights of a quadrature rule over a triangle
+    into three arrays, such that the integral of ``f`` is
+    ``sum(weights[p] * f(dA[p], dB[p]))``.
+
+    For the Gaussian rule, the points are the tensor product of the
+    one-dimensional points, while for the triangular rule ``dA`` and ``dB``
+    are the first two barycentric coordinates of each point.
+
+    Returns
+    -------
+    dA, dB, weights : ndarray
+    """
+    if quadrature_rule == "gaussian":
+        dG, dW = get_gauss_quadratureDG(order)
+        n_points = dW.shape[0]
 
-        # After getting all the nodes of a face assembled call the  cal. face area routine
-        face_area, face_jacobian = calculate_face_area(
-            face_x, face_y, face_z, quadrature_rule, order, coords_type
+        dA = np.repeat(dG[0], n_points)
+        dB = np.tile(dG[0], n_points)
+        weights = np.outer(dW, dW).ravel()
+    elif quadrature_rule == "triangular":
+        dG, dW = get_tri_quadratureDG(order)
+
+        dA = dG[:, 0]
+        dB = dG[:, 1]
+        weights = dW
+    else:
+        raise ValueError("Invalid quadrature rule, specify gaussian or triangular")
+
+    return (
+        np.ascontiguousarray(dA, dtype=np.float64),
+        np.ascontiguousarray(dB, dtype=np.float64),
+        np.ascontiguousarray(weights, dtype=np.float64),
+    )
+
+
+def _get_control_areas(face_areas, offsets, indices, n_elements):
+    """Splits the area of each face equally among the elements (i.e. nodes
+    or edges) of a face connectivity stored in compressed sparse row (CSR)
+    format, and sums the contributions to each element.
+
+    Returns
+    -------
+    control areas : ndarray
+        Area associated with each of the ``n_elements`` elements
+    """
+    counts = np.diff(offsets)
+    weights = np.repeat(face_areas / np.maximum(counts, 1), counts)
+
+    return np.bincount(indices, weights=weights, minlength=n_elements)
+
+
+def _get_kite_areas(face_areas, face_xyz, node_xyz, offsets, face_edges, edge_nodes):
+    """Computes the area of the kite (or diamond-shaped) cell around each
+    edge, formed by its nodes and the centers of the faces on either side.
+
+    Each face-edge pair contributes the spherical triangle formed by the
+    center of the face and the two nodes of the edge, whose areas are scaled
+    such that the triangles of each face sum to its area in ``face_areas``.
+
+    Parameters
+    ----------
+    face_areas : ndarray
+        Area of each face
+    face_xyz, node_xyz : tuple of ndarray
+        Cartesian coordinates of the center of each face and of each node
+    offsets, face_edges : ndarray
+        Compressed sparse row (CSR) representation of the face edge connectivity
+    edge_nodes : ndarray
+        Edge node connectivity of shape (``n_edge``, 2)
+
+    Returns
+    -------
+    kite areas : ndarray
+        Area of the kite around each edge
+    """
+    counts = np.diff(offsets)
+    n_face = counts.shape[0]
+    entry_faces = np.repeat(np.arange(n_face), counts)
+
+    def _unit_vectors(xyz, idx):
+        vectors = np.stack(
+            [np.asarray(coord, dtype=np.float64)[idx] for coord in xyz], axis=1
         )
-        # store current face area
+        return vectors / np.linalg.norm(vectors, axis=1)[:, np.newaxis]
+
+    a = _unit_vectors(face_xyz, entry_faces)
+    b = _unit_vectors(node_xyz, edge_nodes[face_edges, 0])
+    c = _unit_vectors(node_xyz, edge_nodes[face_edges, 1])
+
+    # Van Oosterom-Strackee formula, see ``_face_areas_exact_kernel``
+    triple = np.einsum("ij,ij->i", a, np.cross(b - a, c - a))
+    denominator = (
+        1.0
+        + np.einsum("ij,ij->i", a, b)
+        + np.einsum("ij,ij->i", b, c)
+        + np.einsum("ij,ij->i", c, a)
+    )
+    triangle_areas = np.abs(2.0 * np.arctan2(triple, denominator))
+
+    face_totals = np.bincount(entry_faces, weights=triangle_areas, minlength=n_face)
+
+    # the area of degenerate faces (whose triangles have no area) is split equally among their edges
+    degenerate = face_totals[entry_faces] <= 0.0
+    if degenerate.any():
+        triangle_areas[degenerate] = 1.0
+        face_totals = np.bincount(entry_faces, weights=triangle_areas, minlength=n_face)
+
+    weights = face_areas[entry_faces] * triangle_areas / face_totals[entry_faces]
+
+    return np.bincount(face_edges, weights=weights, minlength=edge_nodes.shape[0])
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _face_areas_kernel(
+    node_x, node_y, node_z, offsets, indices, dA, dB, weights, barycentric
+):
+    """Integrates the Jacobian of each face, split into a fan of triangles
+    around its first node, over the given quadrature table.
+
+    Faces are processed in parallel and each one only reads the Cartesian
+    coordinates of its nodes, without any intermediate allocations.
+
+    Returns
+    -------
+    area : ndarray
+        Area of each face
+    jacobian : ndarray
+        Jacobian of each face, which is twice the Jacobian at the last
+        quadrature point of its last triangle (consistent with
+        ``calculate_face_area``)
+    """
+    n_face = offsets.shape[0] - 1
+
+    area = np.zeros(n_face)
+    jacobian = np.zeros(n_face)
+
+    for face_idx in prange(n_face):
+        start = offsets[face_idx]
+        n_nodes = offsets[face_idx + 1] - start
+
+        node1 = indices[start]
+
+        face_area = 0.0
+        face_jacobian = 0.0
+        for j in range(n_nodes - 2):
+            node2 = indices[start + j + 1]
+            node3 = indices[start + j + 2]
+
+            for p in range(weights.shape[0]):
+                point_jacobian = _spherical_triangle_jacobian(
+                    node_x[node1],
+                    node_y[node1],
+                    node_z[node1],
+                    node_x[node2],
+                    node_y[node2],
+                    node_z[node2],
+                    node_x[node3],
+                    node_y[node3],
+                    node_z[node3],
+                    dA[p],
+                    dB[p],
+                    barycentric,
+                )
+                face_area += weights[p] * point_jacobian
+                face_jacobian = point_jacobian + point_jacobian
+
         area[face_idx] = face_area
         jacobian[face_idx] = face_jacobian
 
     return area, jacobian
 
 
+def _get_all_face_area_exact_from_csr(
+    x, y, z, offsets, indices, coords_type="spherical"
+):
+    """Computes the exact area of each face, whose edges are great circle
+    arcs, given a ``face_node_connectivity`` stored in compressed sparse row
+    (CSR) format.
+
+    Parameters
+    ----------
+    x, y, z : ndarray, required
+        Longitude, latitude (in degrees) and an unused third coordinate of
+        each node if ``coords_type`` is "spherical", Cartesian coordinates
+        of each node otherwise
+
+    offsets : ndarray, required
+        Row offsets of shape (``n_face + 1``), where the nodes of face ``i`` are
+        ``indices[offsets[i]:offsets[i + 1]]``
+
+    indices : ndarray, required
+        Flattened node ids of each face
+
+    coords_type : str, optional
+        coordinate type, default is spherical, can be cartesian also.
+
+    Returns
+    -------
+    area of all faces : ndarray
+    """
+    if coords_type == "spherical":
+        node_x, node_y, node_z = _get_xyz_from_lonlat(x, y)
+    else:
+        # project the nodes onto the unit sphere
+        node_x, node_y, node_z = (
+            np.asarray(coord, dtype=np.float64) for coord in (x, y, z)
+        )
+        norm = np.sqrt(node_x * node_x + node_y * node_y + node_z * node_z)
+        node_x, node_y, node_z = node_x / norm, node_y / norm, node_z / norm
+
+    return _face_areas_exact_kernel(
+        node_x,
+        node_y,
+        node_z,
+        np.ascontiguousarray(offsets),
+        np.ascontiguousarray(indices),
+    )
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _face_areas_exact_kernel(node_x, node_y, node_z, offsets, indices):
+    """Computes the area of each face as the sum of the spherical excesses
+    of a fan of triangles around its first node.
+
+    The excess ``E`` of a triangle with unit vertices ``a``, ``b`` and ``c``
+    is given by the Van Oosterom-Strackee formula ``tan(E / 2) = a . (b x c) /
+    (1 + a . b + b . c + c . a)``, which (unlike L'Huilier's formula) is well
+    conditioned for small and nearly degenerate triangles. The triple product
+    is evaluated as ``a . ((b - a) x (c - a))`` to avoid cancellation for
+    triangles whose vertices are close to each other.
+
+    Excesses are signed by the orientation of each triangle, so non-convex
+    faces are handled correctly and the absolute value of their sum is the
+    area of the face regardless of its orientation.
+    """
+    n_face = offsets.shape[0] - 1
+
+    area = np.zeros(n_face)
+
+    for face_idx in prange(n_face):
+        start = offsets[face_idx]
+        n_nodes = offsets[face_idx + 1] - start
+
+        node1 = indices[start]
+        ax = node_x[node1]
+        ay = node_y[node1]
+        az = node_z[node1]
+
+        excess = 0.0
+        for j in range(n_nodes - 2):
+            node2 = indices[start + j + 1]
+            node3 = indices[start + j + 2]
+
+            bx = node_x[node2]
+            by = node_y[node2]
+            bz = node_z[node2]
+
+            cx = node_x[node3]
+            cy = node_y[node3]
+            cz = node_z[node3]
+
+            # edges relative to the first node
+            ubx = bx - ax
+            uby = by - ay
+            ubz = bz - az
+
+            ucx = cx - ax
+            ucy = cy - ay
+            ucz = cz - az
+
+            triple = (
+                ax * (uby * ucz - ubz * ucy)
+                + ay * (ubz * ucx - ubx * ucz)
+                + az * (ubx * ucy - uby * ucx)
+            )
+            denominator = (
+                1.0
+                + (ax * bx + ay * by + az * bz)
+                + (bx * cx + by * cy + bz * cz)
+                + (cx * ax + cy * ay + cz * az)
+            )
+
+            excess += 2.0 * math.atan2(triple, denominator)
+
+        area[face_idx] = abs(excess)
+
+    return area
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _spherical_triangle_jacobian(
+    x1, y1, z1, x2, y2, z2, x3, y3, z3, dA, dB, barycentric
+):
+    """Jacobian of the projection of a planar triangle onto the unit sphere
+    at a quadrature point, computed from scalar node coordinates.
+
+    The point is given by its first two barycentric coordinates if
+    ``barycentric`` (see ``calculate_spherical_triangle_jacobian_barycentric``)
+    and by its coordinates on the unit square otherwise (see
+    ``calculate_spherical_triangle_jacobian``).
+    """
+    if barycentric:
+        dC = 1.0 - dA - dB
+        fx = dA * x1 + dB * x2 + dC * x3
+        fy = dA * y1 + dB * y2 + dC * y3
+        fz = dA * z1 + dB * z2 + dC * z3
+
+        dax = x1 - x3
+        day = y1 - y3
+        daz = z1 - z3
+
+        dbx = x2 - x3
+        dby = y2 - y3
+        dbz = z2 - z3
+    else:
+        fx = (1.0 - dB) * ((1.0 - dA) * x1 + dA * x2) + dB * x3
+        fy = (1.0 - dB) * ((1.0 - dA) * y1 + dA * y2) + dB * y3
+        fz = (1.0 - dB) * ((1.0 - dA) * z1 + dA * z2) + dB * z3
+
+        dax = (1.0 - dB) * (x2 - x1)
+        day = (1.0 - dB) * (y2 - y1)
+        daz = (1.0 - dB) * (z2 - z1)
+
+        dbx = -(1.0 - dA) * x1 - dA * x2 + x3
+        dby = -(1.0 - dA) * y1 - dA * y2 + y3
+        dbz = -(1.0 - dA) * z1 - dA * z2 + z3
+
+    dInvR = 1.0 / np.sqrt(fx * fx + fy * fy + fz * fz)
+    dDenomTerm = dInvR * dInvR * dInvR
+
+    dagx = (dax * (fy * fy + fz * fz) - fx * (day * fy + daz * fz)) * dDenomTerm
+    dagy = (day * (fx * fx + fz * fz) - fy * (dax * fx + daz * fz)) * dDenomTerm
+    dagz = (daz * (fx * fx + fy * fy) - fz * (dax * fx + day * fy)) * dDenomTerm
+
+    dbgx = (dbx * (fy * fy + fz * fz) - fx * (dby * fy + dbz * fz)) * dDenomTerm
+    dbgy = (dby * (fx * fx + fz * fz) - fy * (dbx * fx + dbz * fz)) * dDenomTerm
+    dbgz = (dbz * (fx * fx + fy * fy) - fz * (dbx * fx + dby * fy)) * dDenomTerm
+
+    #  Cross product gives local Jacobian
+    cx = dagy * dbgz - dagz * dbgy
+    cy = dagz * dbgx - dagx * dbgz
+    cz = dagx * dbgy - dagy * dbgx
+    dJacobian = np.sqrt(cx * cx + cy * cy + cz * cz)
+
+    if barycentric:
+        return 0.5 * dJacobian
+
+    return dJacobian
+
+
 @njit(cache=ENABLE_JIT_CACHE)
 def calculate_spherical_triangle_jacobian(node1, node2, node3, dA, dB):
     """Calculate Jacobian of a spherical triangle. This is a helper function
@@ -0,0 +1,221 @@
+"""Persistent on-disk cache of derived grid quantities (i.e. edges, face
+centroids, face areas and neighbor trees), which allows multiple processes
+working with the same grid to share the results of expensive constructions.
+
+Entries are stored as ``.npz`` files (or directories of ``.npy`` files for
+neighbor trees, which are memory-mapped when loaded) in a directory named
+after the fingerprint of the grid, a content hash of its node coordinates and
+``face_node_connectivity``, under ``uxarray.constants.GRID_CACHE_DIR``. The
+entries of neighbor trees are additionally named after a hash of the
+coordinates of the elements they are constructed from.
+"""
+import hashlib
+import os
+import tempfile
+import warnings
+import zipfile
+
+import numpy as np
+
+import uxarray.constants
+
+
+# number of faces hashed at a time when computing the fingerprint of a grid
+FINGERPRINT_CHUNK_SIZE = 2**20
+
+
+def _grid_fingerprint(grid):
+    """Computes (and stores on the grid) a content hash of the node
+    coordinates and face node connectivity of a ``Grid``, which is independent
+    of the dtype and storage mode (padded or ragged) of its connectivity.
+
+    The face node connectivity is hashed in chunks of faces, so that only
+    a chunk of the padded connectivity is compressed at a time.
+    """
+    if grid._fingerprint is not None:
+        return grid._fingerprint
+
+    fingerprint = hashlib.blake2b(digest_size=20)
+
+    def _update(arr, dtype):
+        arr = np.ascontiguousarray(arr, dtype=dtype)
+        fingerprint.update(np.int64(arr.size).tobytes())
+        fingerprint.update(arr)
+
+    _update(grid.node_lon.values, np.float64)
+    _update(grid.node_lat.values, np.float64)
+
+    if grid.ragged:
+        offsets, indices = grid.get_csr_connectivity("face_node_connectivity")
+    else:
+        face_nodes = grid.face_node_connectivity.values
+        fill_value = np.iinfo(face_nodes.dtype).min
+
+    for start in range(0, grid.n_face, FINGERPRINT_CHUNK_SIZE):
+        stop = min(start + FINGERPRINT_CHUNK_SIZE, grid.n_face)
+
+        if grid.ragged:
+            n_nodes_per_face = np.diff(offsets[start : stop + 1])
+            chunk_indices = indices[offsets[start] : offsets[stop]]
+        else:
+            valid = face_nodes[start:stop] != fill_value
+            n_nodes_per_face = np.count_nonzero(valid, axis=1)
+            chunk_indices = face_nodes[start:stop][valid]
+
+        _update(n_nodes_per_face, np.int64)
+        _update(chunk_indices, np.int64)
+
+    grid._fingerprint = fingerprint.hexdigest()
+
+    return grid._fingerprint
+
+
+def _cache_entry_path(grid, name, storage_dependent, suffix=".npz"):
+    """Path of a cache entry, or ``None`` if the grid cache is disabled.
+
+    Entries that contain connectivity (``storage_dependent``) are stored
+    separately for each connectivity dtype and storage mode.
+    """
+    cache_dir = uxarray.constants.GRID_CACHE_DIR
+
+    if cache_dir is None:
+        return None
+
+    if storage_dependent:
+        name = f"{name}-{np.dtype(grid.connectivity_dtype).name}"
+        if grid.ragged:
+            name += "-ragged"
+
+    return os.path.join(cache_dir, _grid_fingerprint(grid), f"{name}{suffix}")
+
+
+def _load_cached(grid, name, storage_dependent=False):
+    """Loads the arrays of a cache entry, returning ``None`` if the grid cache
+    is disabled or the entry does not exist or is unreadable."""
+    path = _cache_entry_path(grid, name, storage_dependent)
+
+    if path is None or not os.path.isfile(path):
+        return None
+
+    try:
+        with np.load(path, allow_pickle=False) as entry:
+            return {key: entry[key] for key in entry.files}
+    except (OSError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _store_cached(grid, name, storage_dependent=False, **arrays):
+    """Writes arrays to a cache entry if the grid cache is enabled.
+
+    Entries are first written to a temporary file and then renamed, so
+    that concurrent processes never read a partially written entry.
+    """
+    path = _cache_entry_path(grid, name, storage_dependent)
+
+    if path is None:
+        return
+
+    entry_dir = os.path.dirname(path)
+    tmp_path = None
+
+    try:
+        os.makedirs(entry_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)
+
+        os.replace(tmp_path, path)
+    except OSError as e:
+        warnings.warn(f"Unable to write grid cache entry {path}: {e}")
+
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# coordinate variables that a neighbor tree is constructed from, for each element and coordinate system
+TREE_COORDINATES = {
+    "nodes": {
+        "spherical": ("node_lon", "node_lat"),
+        "cartesian": ("node_x", "node_y", "node_z"),
+    },
+    "face centers": {
+        "spherical": ("face_lon", "face_lat"),
+        "cartesian": ("face_x", "face_y", "face_z"),
+    },
+    "edge centers": {
+        "spherical": ("edge_lon", "edge_lat"),
+        "cartesian": ("edge_x", "edge_y", "edge_z"),
+    },
+}
+
+
+def _tree_coordinates_hash(grid, coordinates, coordinate_system):
+    """Content hash of the coordinates of the elements that a neighbor tree
+    is constructed from.
+
+    Unlike the fingerprint of the grid, it covers the order of the edges and
+    the face and edge centers, which may be read from the source file of a
+    grid instead of being derived from its nodes.
+    """
+    coordinates_hash = hashlib.blake2b(digest_size=20)
+
+    for name in TREE_COORDINATES[coordinates][coordinate_system]:
+        arr = np.ascontiguousarray(getattr(grid, name).values, dtype=np.float64)
+        coordinates_hash.update(np.int64(arr.size).tobytes())
+        coordinates_hash.update(arr)
+
+    return coordinates_hash.hexdigest()
+
+
+def _tree_cache_name(grid, tree_type, coordinates, coordinate_system, distance_metric):
+    """Name of the cache entry of a neighbor tree, which includes the hash of
+    the coordinates it is constructed from, so that grids with the same
+    fingerprint but different elements never share a tree."""
+    coordinates_hash = _tree_coordinates_hash(grid, coordinates, coordinate_system)
+    name = (
+        f"tree-{tree_type.__name__}-{coordinates}-{coordinate_system}-{distance_metric}-"
+        f"{coordinates_hash[:16]}"
+    )
+
+    return name.replace(" ", "_")
+
+
+def _load_cached_tree(grid, tree_type, coordinates, coordinate_system, distance_metric):
+    """Loads a neighbor tree (``KDTree`` or ``BallTree``) from the grid
+    cache with its arrays memory-mapped, returning ``None`` if the grid cache
+    is disabled or the entry does not exist or is unreadable."""
+    if uxarray.constants.GRID_CACHE_DIR is None:
+        return None
+
+    name = _tree_cache_name(
+        grid, tree_type, coordinates, coordinate_system, distance_metric
+    )
+    path = _cache_entry_path(grid, name, False, suffix="")
+
+    if path is None or not os.path.isdir(path):
+        return None
+
+    try:
+        return tree_type.load(grid, path, mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _store_cached_tree(grid, tree):
+    """Writes a neighbor tree to the grid cache if it is enabled."""
+    if uxarray.constants.GRID_CACHE_DIR is None:
+        return
+
+    name = _tree_cache_name(
+        grid, type(tree), tree.coordinates, tree.coordinate_system, tree.distance_metric
+    )
+    path = _cache_entry_path(grid, name, False, suffix="")
+
+    if path is None:
+        return
+
+    try:
+        tree.save(path)
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Unable to write grid cache entry {path}: {e}")
@@ -1,12 +1,24 @@
 import numpy as np
 import xarray as xr
 
-from scipy import sparse
-
-from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+from uxarray.constants import INT_DTYPE
+from uxarray.grid.utils import _get_fill_value
+from uxarray.grid.cache import _load_cached, _store_cached
 
 from numba import njit
 
+# connectivity variables with a variable number of entries per row, which are stored in compressed sparse row (CSR)
+# format for grids that use ragged storage
+RAGGED_CONNECTIVITY = (
+    "face_node_connectivity",
+    "face_edge_connectivity",
+    "node_face_connectivity",
+    "face_face_connectivity",
+    "node_node_connectivity",
+    "node_edge_connectivity",
+    "edge_edge_connectivity",
+)
+
 
 def close_face_nodes(face_node_connectivity, n_face, n_max_face_nodes):
     """Closes (``face_node_connectivity``) by inserting the first node index
@@ -36,14 +48,18 @@ def close_face_nodes(face_node_connectivity, n_face, n_max_face_nodes):
         [4, 5, 6, 7, 8, 4]
     """
 
+    fill_value = _get_fill_value(face_node_connectivity.dtype)
+
     # padding to shape [n_face, n_max_face_nodes + 1]
-    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=INT_DTYPE) * INT_FILL_VALUE
+    closed = np.full(
+        (n_face, n_max_face_nodes + 1), fill_value, dtype=face_node_connectivity.dtype
+    )
 
     # set all non-paded values to original face nodee values
     closed[:, :-1] = face_node_connectivity.copy()
 
     # instance of first fill value
-    first_fv_idx_2d = np.argmax(closed == INT_FILL_VALUE, axis=1)
+    first_fv_idx_2d = np.argmax(closed == fill_value, axis=1)
 
     # 2d to 1d index for np.put()
     first_fv_idx_1d = first_fv_idx_2d + ((n_max_face_nodes + 1) * np.arange(0, n_face))
@@ -134,7 +150,12 @@ def _populate_n_nodes_per_face(grid):
         # convert scalar value into a [1, 1] array
         n_nodes_per_face = np.expand_dims(n_nodes_per_face, 0)
 
-    # add to internal dataset
+    _set_n_nodes_per_face(grid, n_nodes_per_face)
+
+
+def _set_n_nodes_per_face(grid, n_nodes_per_face):
+    """Stores ``n_nodes_per_face`` within the internal dataset
+    (``Grid._ds``)."""
     grid._ds["n_nodes_per_face"] = xr.DataArray(
         data=n_nodes_per_face,
         dims=["n_face"],
@@ -146,12 +167,14 @@ def _build_n_nodes_per_face(face_nodes, n_face, n_max_face_nodes):
     """Constructs ``n_nodes_per_face``, which contains the number of non-fill-
     value nodes for each face in ``face_node_connectivity``"""
 
+    fill_value = _get_fill_value(face_nodes.dtype)
+
     # padding to shape [n_face, n_max_face_nodes + 1]
-    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=INT_DTYPE) * INT_FILL_VALUE
+    closed = np.full((n_face, n_max_face_nodes + 1), fill_value, dtype=face_nodes.dtype)
 
     closed[:, :-1] = face_nodes.copy()
 
-    n_nodes_per_face = np.argmax(closed == INT_FILL_VALUE, axis=1)
+    n_nodes_per_face = np.argmax(closed == fill_value, axis=1)
 
     return n_nodes_per_face
 
@@ -161,17 +184,53 @@ def _populate_edge_node_connectivity(grid):
     and stores it within the internal (``Grid._ds``) and through the attribute
     (``Grid.edge_node_connectivity``)."""
 
-    edge_nodes, inverse_indices, fill_value_mask = _build_edge_node_connectivity(
-        grid.face_node_connectivity.values, grid.n_face, grid.n_max_face_nodes
-    )
+    cached = _load_cached(grid, "edge_node_connectivity", storage_dependent=True)
+
+    if cached is not None:
+        edge_nodes = cached["edge_nodes"]
+        inverse_indices = cached["inverse_indices"]
+        fill_value_mask = cached["fill_value_mask"]
+    else:
+        if grid.ragged:
+            edge_nodes, inverse_indices = _build_edge_node_connectivity_csr(
+                *grid.get_csr_connectivity("face_node_connectivity")
+            )
+            fill_value_mask = np.zeros(inverse_indices.shape[0], dtype=bool)
+        else:
+            (
+                edge_nodes,
+                inverse_indices,
+                fill_value_mask,
+            ) = _build_edge_node_connectivity(
+                grid.face_node_connectivity.values, grid.n_face, grid.n_max_face_nodes
+            )
+
+        _store_cached(
+            grid,
+            "edge_node_connectivity",
+            storage_dependent=True,
+            edge_nodes=edge_nodes,
+            inverse_indices=inverse_indices,
+            fill_value_mask=fill_value_mask,
+        )
+
+    _set_edge_node_connectivity(grid, edge_nodes, inverse_indices, fill_value_mask)
+
+
+def _set_edge_node_connectivity(grid, edge_nodes, inverse_indices, fill_value_mask):
+    """Stores ``edge_node_connectivity`` within the internal dataset
+    (``Grid._ds``), along with the attributes (``inverse_indices``) and
+    (``fill_value_mask``) used for constructing ``face_edge_connectivity``.
 
-    # add edge_node_connectivity to internal dataset
+    Both attributes are indexed per face-edge pair (not per unique edge), with
+    ``fill_value_mask`` flagging the pairs whose ``inverse_indices`` entry is a
+    fill value."""
     grid._ds["edge_node_connectivity"] = xr.DataArray(
         edge_nodes,
         dims=["n_edge", "Two"],
         attrs={
             "cf_role": "edge_node_connectivity",
-            "_FillValue": INT_FILL_VALUE,
+            "_FillValue": _get_fill_value(edge_nodes.dtype),
             "long_name": "Maps every edge to the two nodes that it connects",
             "start_index": INT_DTYPE(0),
             "inverse_indices": inverse_indices,
@@ -189,65 +248,169 @@ def _build_edge_node_connectivity(face_nodes, n_face, n_max_face_nodes):
     (``fill_value_mask``) are stored for constructing other
     connectivity variables.
 
+    Each edge is packed into a single 64-bit key (``min_node * n_node + max_node``), which allows the unique edges
+    and their inverse indices to be found with a single one-dimensional sort instead of a row-wise ``np.unique``.
+    The packed keys preserve the lexicographic ordering of the sorted node pairs.
+
+    Both ``inverse_indices`` and ``fill_value_mask`` are indexed per face-edge pair, of shape
+    (``n_face * n_max_face_nodes``), and not per unique edge, since the face-edge pairs that contain a fill value
+    are discarded before finding the unique edges.
+
     Parameters
     ----------
-    repopulate : bool, optional
-        Flag used to indicate if we want to overwrite the existed `edge_node_connectivity` and generate a new
-        inverse_indices, default is False
+    face_nodes : np.ndarray
+        Face node connectivity of shape (``n_face``, ``n_max_face_nodes``)
+    n_face : int
+        Number of faces
+    n_max_face_nodes : int
+        Maximum number of nodes that compose a face
+
+    Returns
+    -------
+    edge_nodes_unique : np.ndarray
+        Unique edges of shape (``n_edge``, 2), with the smaller node index stored first
+    inverse_indices : np.ndarray
+        Index of the unique edge for each face-edge pair, filled for padded pairs
+    fill_value_mask : np.ndarray
+        Boolean mask of face-edge pairs that contain a fill value, aligned with ``inverse_indices``
     """
 
     padded_face_nodes = close_face_nodes(face_nodes, n_face, n_max_face_nodes)
 
-    # array of empty edge nodes where each entry is a pair of indices
-    edge_nodes = np.empty((n_face * n_max_face_nodes, 2), dtype=INT_DTYPE)
-
-    # first index includes starting node up to non-padded value
-    edge_nodes[:, 0] = padded_face_nodes[:, :-1].ravel()
+    # first and second node of every face-edge pair
+    edge_start = padded_face_nodes[:, :-1].ravel()
+    edge_end = padded_face_nodes[:, 1:].ravel()
 
-    # second index includes second node up to padded value
-    edge_nodes[:, 1] = padded_face_nodes[:, 1:].ravel()
+    fill_value = _get_fill_value(face_nodes.dtype)
 
-    # sorted edge nodes
-    edge_nodes.sort(axis=1)
+    # find all face-edge pairs that contain a fill value
+    fill_value_mask = np.logical_or(edge_start == fill_value, edge_end == fill_value)
+    valid_mask = np.logical_not(fill_value_mask)
 
-    # unique edge nodes
-    edge_nodes_unique, inverse_indices = np.unique(
-        edge_nodes, return_inverse=True, axis=0
+    edge_nodes_unique, unique_inverse = _unique_edges(
+        edge_start[valid_mask], edge_end[valid_mask]
     )
-    # find all edge nodes that contain a fill value
-    fill_value_mask = np.logical_or(
-        edge_nodes_unique[:, 0] == INT_FILL_VALUE,
-        edge_nodes_unique[:, 1] == INT_FILL_VALUE,
+
+    inverse_indices = np.full(
+        fill_value_mask.shape[0], fill_value, dtype=face_nodes.dtype
     )
+    inverse_indices[valid_mask] = unique_inverse
 
-    # all edge nodes that do not contain a fill value
-    non_fill_value_mask = np.logical_not(fill_value_mask)
-    edge_nodes_unique = edge_nodes_unique[non_fill_value_mask]
+    return edge_nodes_unique, inverse_indices, fill_value_mask
 
-    # Update inverse_indices accordingly
-    indices_to_update = np.where(fill_value_mask)[0]
 
-    remove_mask = np.isin(inverse_indices, indices_to_update)
-    inverse_indices[remove_mask] = INT_FILL_VALUE
+def _build_edge_node_connectivity_csr(offsets, indices):
+    """Constructs the UGRID connectivity variable (``edge_node_connectivity``)
+    from a ``face_node_connectivity`` stored in compressed sparse row (CSR)
+    format.
 
-    # Compute the indices where inverse_indices exceeds the values in indices_to_update
-    indexes = np.searchsorted(indices_to_update, inverse_indices, side="right")
-    # subtract the corresponding indexes from `inverse_indices`
-    for i in range(len(inverse_indices)):
-        if inverse_indices[i] != INT_FILL_VALUE:
-            inverse_indices[i] -= indexes[i]
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Row offsets of the face node connectivity, of shape (``n_face + 1``)
+    indices : np.ndarray
+        Flattened node indices of each face
+
+    Returns
+    -------
+    edge_nodes_unique : np.ndarray
+        Unique edges of shape (``n_edge``, 2), with the smaller node index stored first
+    face_edges : np.ndarray
+        Index of the unique edge for each face-edge pair, aligned with ``indices``, which together with ``offsets``
+        forms the CSR representation of ``face_edge_connectivity``
+    """
+    return _unique_edges(indices, _next_face_nodes_csr(offsets, indices))
 
-    return edge_nodes_unique, inverse_indices, fill_value_mask
+
+def _next_face_nodes_csr(offsets, indices):
+    """Returns the node that follows each entry of a CSR ``face_node_connectivity``
+    within its face, wrapping around to the first node of the face."""
+    next_entry = np.arange(1, indices.shape[0] + 1, dtype=INT_DTYPE)
+
+    # the last node of each (non-empty) face connects back to its first node
+    non_empty = offsets[1:] > offsets[:-1]
+    next_entry[offsets[1:][non_empty] - 1] = offsets[:-1][non_empty]
+
+    return indices[next_entry]
+
+
+def _unique_edges(edge_start, edge_end):
+    """Finds the unique undirected edges given the start and end node of each
+    face-edge pair, which must not contain any fill values. The returned
+    arrays share the integer dtype of ``edge_start``.
+
+    Returns
+    -------
+    edge_nodes_unique : np.ndarray
+        Unique edges of shape (``n_edge``, 2), with the smaller node index stored first
+    unique_inverse : np.ndarray
+        Index of the unique edge for each face-edge pair
+    """
+    dtype = edge_start.dtype
+
+    if edge_start.size == 0:
+        return np.empty((0, 2), dtype=dtype), np.empty(0, dtype=dtype)
+
+    edge_keys, n_node = _encode_edge_keys(edge_start, edge_end)
+
+    # unique edges are obtained from a single 1D sort of the packed keys
+    unique_keys, unique_inverse = np.unique(edge_keys, return_inverse=True)
+
+    edge_nodes_unique = np.empty((unique_keys.shape[0], 2), dtype=dtype)
+    edge_nodes_unique[:, 0] = unique_keys // n_node
+    edge_nodes_unique[:, 1] = unique_keys % n_node
+
+    return edge_nodes_unique, unique_inverse.astype(dtype, copy=False)
+
+
+def _encode_edge_keys(edge_start, edge_end):
+    """Packs each (``edge_start``, ``edge_end``) node pair into a single
+    ``np.int64`` key, independent of the direction of the edge.
+
+    Returns
+    -------
+    edge_keys : np.ndarray
+        Packed key for each edge, computed as ``min_node * n_node + max_node``
+    n_node : int
+        Multiplier used for packing the keys (largest node index + 1)
+    """
+    edge_min = np.minimum(edge_start, edge_end).astype(np.int64)
+    edge_max = np.maximum(edge_start, edge_end).astype(np.int64)
+
+    n_node = np.int64(edge_max.max()) + 1
+
+    if n_node > np.iinfo(np.int64).max // n_node:
+        raise ValueError(
+            f"Unable to encode edges for a grid with {n_node} nodes into 64-bit keys."
+        )
+
+    return edge_min * n_node + edge_max, n_node
 
 
 def _populate_edge_face_connectivity(grid):
     """Constructs the UGRID connectivity variable (``edge_node_connectivity``)
     and stores it within the internal (``Grid._ds``) and through the attribute
     (``Grid.edge_node_connectivity``)."""
-    edge_faces = _build_edge_face_connectivity(
-        grid.face_edge_connectivity.values, grid.n_nodes_per_face.values, grid.n_edge
-    )
+    if grid.ragged:
+        if not grid._connectivity_populated("face_edge_connectivity"):
+            _populate_face_edge_connectivity(grid)
 
+        edge_faces = _build_edge_face_connectivity_csr(
+            *grid.get_csr_connectivity("face_edge_connectivity"), grid.n_edge
+        )
+    else:
+        edge_faces = _build_edge_face_connectivity(
+            grid.face_edge_connectivity.values,
+            grid.n_nodes_per_face.values,
+            grid.n_edge,
+        )
+
+    _set_edge_face_connectivity(grid, edge_faces)
+
+
+def _set_edge_face_connectivity(grid, edge_faces):
+    """Stores ``edge_face_connectivity`` within the internal dataset
+    (``Grid._ds``)."""
     grid._ds["edge_face_connectivity"] = xr.DataArray(
         data=edge_faces,
         dims=["n_edge", "Two"],
@@ -262,7 +425,8 @@ def _populate_edge_face_connectivity(grid):
 @njit
 def _build_edge_face_connectivity(face_edges, n_nodes_per_face, n_edge):
     """Helper for (``edge_face_connectivity``) construction."""
-    edge_faces = np.ones(shape=(n_edge, 2), dtype=face_edges.dtype) * INT_FILL_VALUE
+    fill_value = np.iinfo(face_edges.dtype).min
+    edge_faces = np.full((n_edge, 2), fill_value, dtype=face_edges.dtype)
 
     for face_idx, (cur_face_edges, n_edges) in enumerate(
         zip(face_edges, n_nodes_per_face)
@@ -270,7 +434,25 @@ def _build_edge_face_connectivity(face_edges, n_nodes_per_face, n_edge):
         # obtain all the edges that make up a face (excluding fill values)
         edges = cur_face_edges[:n_edges]
         for edge_idx in edges:
-            if edge_faces[edge_idx, 0] == INT_FILL_VALUE:
+            if edge_faces[edge_idx, 0] == fill_value:
+                edge_faces[edge_idx, 0] = face_idx
+            else:
+                edge_faces[edge_idx, 1] = face_idx
+
+    return edge_faces
+
+
+@njit
+def _build_edge_face_connectivity_csr(offsets, face_edges, n_edge):
+    """Helper for (``edge_face_connectivity``) construction from a
+    ``face_edge_connectivity`` stored in compressed sparse row (CSR)
+    format."""
+    fill_value = np.iinfo(face_edges.dtype).min
+    edge_faces = np.full((n_edge, 2), fill_value, dtype=face_edges.dtype)
+
+    for face_idx in range(offsets.shape[0] - 1):
+        for edge_idx in face_edges[offsets[face_idx] : offsets[face_idx + 1]]:
+            if edge_faces[edge_idx, 0] == fill_value:
                 edge_faces[edge_idx, 0] = face_idx
             else:
                 edge_faces[edge_idx, 1] = face_idx
@@ -289,20 +471,40 @@ def _populate_face_edge_connectivity(grid):
     ):
         _populate_edge_node_connectivity(grid)
 
-    face_edges = _build_face_edge_connectivity(
-        grid.edge_node_connectivity.attrs["inverse_indices"],
-        grid.n_face,
-        grid.n_max_face_nodes,
-    )
+    inverse_indices = grid.edge_node_connectivity.attrs["inverse_indices"]
+
+    if grid.ragged:
+        # the inverse indices are aligned with the CSR face node connectivity
+        offsets, _ = grid.get_csr_connectivity("face_node_connectivity")
+        _set_face_edge_connectivity(grid, (offsets, inverse_indices))
+    else:
+        _set_face_edge_connectivity(
+            grid,
+            _build_face_edge_connectivity(
+                inverse_indices, grid.n_face, grid.n_max_face_nodes
+            ),
+        )
+
+
+def _set_face_edge_connectivity(grid, face_edges):
+    """Stores ``face_edge_connectivity`` within the internal dataset
+    (``Grid._ds``), or in CSR format given as a tuple of (``offsets``,
+    ``indices``) for ragged grids."""
+    dims = ["n_face", "n_max_face_edges"]
+    attrs = {
+        "cf_role": "face_edges_connectivity",
+        "start_index": INT_DTYPE(0),
+        "long_name": "Maps every edge to the two nodes that it connects",
+    }
+
+    if grid.ragged:
+        _set_ragged_connectivity(
+            grid, "face_edge_connectivity", *face_edges, dims, attrs
+        )
+        return
 
     grid._ds["face_edge_connectivity"] = xr.DataArray(
-        data=face_edges,
-        dims=["n_face", "n_max_face_edges"],
-        attrs={
-            "cf_role": "face_edges_connectivity",
-            "start_index": INT_DTYPE(0),
-            "long_name": "Maps every edge to the two nodes that it connects",
-        },
+        data=face_edges, dims=dims, attrs=attrs
     )
 
 
@@ -315,21 +517,38 @@ def _build_face_edge_connectivity(inverse_indices, n_face, n_max_face_nodes):
 def _populate_node_face_connectivity(grid):
     """Constructs the UGRID connectivity variable (``node_face_connectivity``)
     and stores it within the internal (``Grid._ds``) and through the attribute
-    (``Grid.node_face_connectivity``)."""
+    (``Grid.node_face_connectivity``).
 
-    node_faces, n_max_faces_per_node = _build_node_faces_connectivity(
-        grid.face_node_connectivity.values, grid.n_node
-    )
+    The compressed (CSR) representation used to construct the padded
+    connectivity is cached and can be obtained through
+    ``Grid.get_csr_connectivity("node_face_connectivity")``.
+    """
+
+    if grid.ragged:
+        offsets, indices = _transpose_csr(
+            *grid.get_csr_connectivity("face_node_connectivity"), grid.n_node
+        )
+    else:
+        offsets, indices = _build_node_face_csr(
+            grid.face_node_connectivity.values, grid.n_node
+        )
+
+    _set_node_face_connectivity(grid, offsets, indices)
 
-    grid._ds["node_face_connectivity"] = xr.DataArray(
-        node_faces,
-        dims=["n_node", "n_max_node_faces"],  # TODO
-        attrs={
-            "long_name": "Maps every node to the faces that " "it connects",
-            "nMaxNumFacesPerNode": n_max_faces_per_node,  # todo, this possibly duplicates nNodes_per_face
-            "_FillValue": INT_FILL_VALUE,
-        },
-    )
+
+def _set_node_face_connectivity(grid, offsets, indices):
+    """Stores ``node_face_connectivity`` given in CSR format within the
+    internal dataset (``Grid._ds``), keeping the CSR representation."""
+    dims = ["n_node", "n_max_node_faces"]  # TODO
+    attrs = {
+        "long_name": "Maps every node to the faces that " "it connects",
+        "nMaxNumFacesPerNode": int(
+            np.diff(offsets).max(initial=0)
+        ),  # todo, this possibly duplicates nNodes_per_face
+        "_FillValue": _get_fill_value(indices.dtype),
+    }
+
+    _set_csr_connectivity(grid, "node_face_connectivity", offsets, indices, dims, attrs)
 
 
 def _build_node_faces_connectivity(face_nodes, n_node):
@@ -337,56 +556,673 @@ def _build_node_faces_connectivity(face_nodes, n_node):
     (n_node, n_max_faces_per_node) (optional) A DataArray of indices indicating
     faces that are neighboring each node.
 
-    This function converts the face-node connectivity data into a sparse matrix, and then constructs the node-face
-    connectivity by iterating over each node in the mesh and retrieving the set of neighboring faces.
+    The faces of each node are found using a counting sort over ``face_nodes`` (see ``_build_node_face_csr``), which
+    is then padded with fill values to a dense array.
+
+    Returns
+    -------
+    node_face_connectivity : np.ndarray
+        Padded node face connectivity of shape (``n_node``, ``n_max_faces_per_node``)
+    n_max_faces_per_node : int
+        Maximum number of faces that saddle a node
+    """
+    offsets, indices = _build_node_face_csr(face_nodes, n_node)
+
+    return _csr_to_padded(offsets, indices)
+
+
+@njit
+def _build_node_face_csr(face_nodes, n_node):
+    """Constructs the compressed sparse row (CSR) representation of the
+    ``node_face_connectivity`` using a counting sort over ``face_nodes``.
+
+    Parameters
+    ----------
+    face_nodes : np.ndarray
+        Face node connectivity of shape (``n_face``, ``n_max_face_nodes``)
+    n_node : int
+        Number of nodes
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Array of shape (``n_node + 1``), where the faces of node ``i`` are stored in
+        ``indices[offsets[i]:offsets[i + 1]]``
+    indices : np.ndarray
+        Face indices of each node, in ascending order, with the same dtype as ``face_nodes``
+    """
+    n_face, n_max_face_nodes = face_nodes.shape
+    fill_value = np.iinfo(face_nodes.dtype).min
+
+    # number of faces that contain each node, shifted by one for the cumulative sum
+    offsets = np.zeros(n_node + 1, dtype=INT_DTYPE)
+    for face_idx in range(n_face):
+        for node_idx in face_nodes[face_idx]:
+            if node_idx != fill_value:
+                offsets[node_idx + 1] += 1
+
+    offsets = np.cumsum(offsets)
+
+    indices = np.empty(offsets[-1], dtype=face_nodes.dtype)
+    cursor = offsets[:-1].copy()
+
+    # faces are visited in order, so each row is sorted
+    for face_idx in range(n_face):
+        for node_idx in face_nodes[face_idx]:
+            if node_idx != fill_value:
+                indices[cursor[node_idx]] = face_idx
+                cursor[node_idx] += 1
+
+    return offsets, indices
+
+
+@njit
+def _transpose_csr(offsets, indices, n_cols):
+    """Transposes a connectivity stored in compressed sparse row (CSR) format
+    using a counting sort, such that the rows of the result are sorted in
+    ascending order (i.e. face node connectivity to node face connectivity).
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Row offsets of shape (``n_rows + 1``)
+    indices : np.ndarray
+        Flattened connectivity entries
+    n_cols : int
+        Number of rows of the transposed connectivity
+
+    Returns
+    -------
+    offsets_t : np.ndarray
+        Row offsets of the transposed connectivity, of shape (``n_cols + 1``)
+    indices_t : np.ndarray
+        Flattened entries of the transposed connectivity
+    """
+    offsets_t = np.zeros(n_cols + 1, dtype=INT_DTYPE)
+    for col_idx in indices:
+        offsets_t[col_idx + 1] += 1
+
+    offsets_t = np.cumsum(offsets_t)
+
+    indices_t = np.empty(offsets_t[-1], dtype=indices.dtype)
+    cursor = offsets_t[:-1].copy()
+
+    for row_idx in range(offsets.shape[0] - 1):
+        for col_idx in indices[offsets[row_idx] : offsets[row_idx + 1]]:
+            indices_t[cursor[col_idx]] = row_idx
+            cursor[col_idx] += 1
+
+    return offsets_t, indices_t
+
+
+def _populate_face_face_connectivity(grid):
+    """Constructs the UGRID connectivity variable (``face_face_connectivity``)
+    and stores it within the internal (``Grid._ds``) and through the attribute
+    (``Grid.face_face_connectivity``)."""
+    offsets, indices = _build_face_face_csr(
+        *grid.get_csr_connectivity("face_edge_connectivity"),
+        grid.edge_face_connectivity.values,
+    )
+
+    _set_face_face_connectivity(grid, offsets, indices)
+
 
-    Raises
-    ------
-    RuntimeError
-        If the Mesh object does not contain a 'face_node_connectivity' variable.
+def _set_face_face_connectivity(grid, offsets, indices):
+    """Stores ``face_face_connectivity`` given in CSR format within the
+    internal dataset (``Grid._ds``), keeping the CSR representation."""
+    dims = ["n_face", "n_max_face_faces"]
+    attrs = {
+        "cf_role": "face_face_connectivity",
+        "start_index": INT_DTYPE(0),
+        "long_name": "Maps every face to the faces that share an edge with it",
+        "_FillValue": _get_fill_value(indices.dtype),
+    }
+
+    _set_csr_connectivity(grid, "face_face_connectivity", offsets, indices, dims, attrs)
+
+
+@njit
+def _build_face_face_csr(offsets, face_edges, edge_faces):
+    """Constructs the compressed sparse row (CSR) representation of the
+    ``face_face_connectivity``, where the neighbors of each face are ordered
+    by the edge they share with it and boundary edges are skipped.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Row offsets of the face edge connectivity, of shape (``n_face + 1``)
+    face_edges : np.ndarray
+        Flattened edge indices of each face
+    edge_faces : np.ndarray
+        Edge face connectivity of shape (``n_edge``, 2)
+
+    Returns
+    -------
+    offsets_ff : np.ndarray
+        Row offsets of shape (``n_face + 1``)
+    indices_ff : np.ndarray
+        Flattened neighboring face indices of each face
+    """
+    n_face = offsets.shape[0] - 1
+    fill_value = np.iinfo(edge_faces.dtype).min
+
+    offsets_ff = np.zeros(n_face + 1, dtype=INT_DTYPE)
+    for face_idx in range(n_face):
+        for edge_idx in face_edges[offsets[face_idx] : offsets[face_idx + 1]]:
+            if edge_faces[edge_idx, 1] != fill_value:
+                offsets_ff[face_idx + 1] += 1
+
+    offsets_ff = np.cumsum(offsets_ff)
+
+    indices_ff = np.empty(offsets_ff[-1], dtype=edge_faces.dtype)
+    cursor = 0
+    for face_idx in range(n_face):
+        for edge_idx in face_edges[offsets[face_idx] : offsets[face_idx + 1]]:
+            if edge_faces[edge_idx, 1] == fill_value:
+                continue
+            if edge_faces[edge_idx, 0] == face_idx:
+                indices_ff[cursor] = edge_faces[edge_idx, 1]
+            else:
+                indices_ff[cursor] = edge_faces[edge_idx, 0]
+            cursor += 1
+
+    return offsets_ff, indices_ff
+
+
+def _populate_node_edge_connectivity(grid):
+    """Constructs the UGRID connectivity variable (``node_edge_connectivity``)
+    and stores it within the internal (``Grid._ds``) and through the attribute
+    (``Grid.node_edge_connectivity``)."""
+    offsets, indices = _build_node_edge_csr(
+        grid.edge_node_connectivity.values, grid.n_node
+    )
+
+    dims = ["n_node", "n_max_node_edges"]
+    attrs = {
+        "cf_role": "node_edge_connectivity",
+        "start_index": INT_DTYPE(0),
+        "long_name": "Maps every node to the edges that it is part of",
+        "_FillValue": _get_fill_value(indices.dtype),
+    }
+
+    _set_csr_connectivity(grid, "node_edge_connectivity", offsets, indices, dims, attrs)
+
+
+def _build_node_edge_csr(edge_nodes, n_node):
+    """Constructs the compressed sparse row (CSR) representation of the
+    ``node_edge_connectivity`` by transposing the ``edge_node_connectivity``
+    with a counting sort, such that the edges of each node are in ascending
+    order."""
+    edge_offsets = np.arange(0, 2 * edge_nodes.shape[0] + 1, 2, dtype=INT_DTYPE)
+
+    return _transpose_csr(
+        edge_offsets, np.ascontiguousarray(edge_nodes).ravel(), n_node
+    )
+
+
+def _populate_node_node_connectivity(grid):
+    """Constructs the UGRID connectivity variable (``node_node_connectivity``)
+    and stores it within the internal (``Grid._ds``) and through the attribute
+    (``Grid.node_node_connectivity``)."""
+    offsets, node_edges = grid.get_csr_connectivity("node_edge_connectivity")
+    indices = _build_node_node_csr(
+        offsets, node_edges, grid.edge_node_connectivity.values
+    )
+
+    dims = ["n_node", "n_max_node_nodes"]
+    attrs = {
+        "cf_role": "node_node_connectivity",
+        "start_index": INT_DTYPE(0),
+        "long_name": "Maps every node to the nodes that it shares an edge with",
+        "_FillValue": _get_fill_value(indices.dtype),
+    }
+
+    _set_csr_connectivity(grid, "node_node_connectivity", offsets, indices, dims, attrs)
+
+
+@njit
+def _build_node_node_csr(offsets, node_edges, edge_nodes):
+    """Constructs the flattened entries of the ``node_node_connectivity``,
+    which share the row offsets of the ``node_edge_connectivity`` since each
+    edge of a node leads to exactly one neighboring node."""
+    node_nodes = np.empty_like(node_edges)
+
+    for node_idx in range(offsets.shape[0] - 1):
+        for entry in range(offsets[node_idx], offsets[node_idx + 1]):
+            edge_idx = node_edges[entry]
+            if edge_nodes[edge_idx, 0] == node_idx:
+                node_nodes[entry] = edge_nodes[edge_idx, 1]
+            else:
+                node_nodes[entry] = edge_nodes[edge_idx, 0]
+
+    return node_nodes
+
+
+def _populate_edge_edge_connectivity(grid):
+    """Constructs the UGRID connectivity variable (``edge_edge_connectivity``)
+    and stores it within the internal (``Grid._ds``) and through the attribute
+    (``Grid.edge_edge_connectivity``)."""
+    offsets, indices = _build_edge_edge_csr(
+        grid.edge_node_connectivity.values,
+        *grid.get_csr_connectivity("node_edge_connectivity"),
+    )
+
+    dims = ["n_edge", "n_max_edge_edges"]
+    attrs = {
+        "cf_role": "edge_edge_connectivity",
+        "start_index": INT_DTYPE(0),
+        "long_name": "Maps every edge to the edges that it shares a node with",
+        "_FillValue": _get_fill_value(indices.dtype),
+    }
+
+    _set_csr_connectivity(grid, "edge_edge_connectivity", offsets, indices, dims, attrs)
+
+
+@njit
+def _build_edge_edge_csr(edge_nodes, node_edge_offsets, node_edges):
+    """Constructs the compressed sparse row (CSR) representation of the
+    ``edge_edge_connectivity``, containing the other edges of the first node
+    of each edge followed by the other edges of its second node.
+
+    Parameters
+    ----------
+    edge_nodes : np.ndarray
+        Edge node connectivity of shape (``n_edge``, 2)
+    node_edge_offsets : np.ndarray
+        Row offsets of the node edge connectivity, of shape (``n_node + 1``)
+    node_edges : np.ndarray
+        Flattened edge indices of each node
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Row offsets of shape (``n_edge + 1``)
+    indices : np.ndarray
+        Flattened neighboring edge indices of each edge
+    """
+    n_edge = edge_nodes.shape[0]
+
+    offsets = np.zeros(n_edge + 1, dtype=INT_DTYPE)
+    for edge_idx in range(n_edge):
+        for node_idx in edge_nodes[edge_idx]:
+            # every edge of the node except this edge
+            offsets[edge_idx + 1] += (
+                node_edge_offsets[node_idx + 1] - node_edge_offsets[node_idx] - 1
+            )
+
+    offsets = np.cumsum(offsets)
+
+    indices = np.empty(offsets[-1], dtype=node_edges.dtype)
+    cursor = 0
+    for edge_idx in range(n_edge):
+        for node_idx in edge_nodes[edge_idx]:
+            for entry in range(
+                node_edge_offsets[node_idx], node_edge_offsets[node_idx + 1]
+            ):
+                if node_edges[entry] != edge_idx:
+                    indices[cursor] = node_edges[entry]
+                    cursor += 1
+
+    return offsets, indices
+
+
+def _populate_topology(grid):
+    """Constructs ``n_nodes_per_face`` and the edge node, face edge, edge
+    face, node face and face face connectivity variables of a grid in a
+    single fused traversal of its face node connectivity (see
+    ``_build_topology_csr``) and stores the ones that are not already
+    present.
+
+    Falls back to populating each variable individually when the edges are
+    already defined (i.e. read from the source grid or the grid cache), since
+    their order must be preserved.
+    """
+    names = (
+        "n_nodes_per_face",
+        "edge_node_connectivity",
+        "face_edge_connectivity",
+        "edge_face_connectivity",
+        "node_face_connectivity",
+        "face_face_connectivity",
+    )
+
+    if "edge_node_connectivity" not in grid._ds:
+        cached = _load_cached(grid, "edge_node_connectivity", storage_dependent=True)
+        if cached is not None:
+            _set_edge_node_connectivity(
+                grid,
+                cached["edge_nodes"],
+                cached["inverse_indices"],
+                cached["fill_value_mask"],
+            )
+
+    if "edge_node_connectivity" in grid._ds:
+        for name in names:
+            getattr(grid, name)
+        return
+
+    offsets, indices = grid.get_csr_connectivity("face_node_connectivity")
+
+    # face-edge pairs are sorted by bucketing their node indices
+    n_buckets = int(indices.max(initial=-1)) + 1
+
+    (
+        n_nodes_per_face,
+        edge_nodes,
+        face_edges,
+        edge_faces,
+        node_face_offsets,
+        node_face_indices,
+        face_face_offsets,
+        face_face_indices,
+    ) = _build_topology_csr(offsets, indices, grid.n_node, n_buckets)
+
+    if grid.ragged:
+        inverse_indices = face_edges
+        fill_value_mask = np.zeros(face_edges.shape[0], dtype=bool)
+        face_edge_connectivity = (offsets, face_edges)
+    else:
+        face_edge_connectivity, _ = _csr_to_padded(
+            offsets, face_edges, grid.n_max_face_nodes
+        )
+        inverse_indices = face_edge_connectivity.ravel()
+        fill_value_mask = inverse_indices == _get_fill_value(inverse_indices.dtype)
+
+    _store_cached(
+        grid,
+        "edge_node_connectivity",
+        storage_dependent=True,
+        edge_nodes=edge_nodes,
+        inverse_indices=inverse_indices,
+        fill_value_mask=fill_value_mask,
+    )
+
+    if "n_nodes_per_face" not in grid._ds:
+        _set_n_nodes_per_face(grid, n_nodes_per_face)
+
+    _set_edge_node_connectivity(grid, edge_nodes, inverse_indices, fill_value_mask)
+
+    if not grid._connectivity_populated("face_edge_connectivity"):
+        _set_face_edge_connectivity(grid, face_edge_connectivity)
+
+    if "edge_face_connectivity" not in grid._ds:
+        _set_edge_face_connectivity(grid, edge_faces)
+
+    if not grid._connectivity_populated("node_face_connectivity"):
+        _set_node_face_connectivity(grid, node_face_offsets, node_face_indices)
+
+    if not grid._connectivity_populated("face_face_connectivity"):
+        _set_face_face_connectivity(grid, face_face_offsets, face_face_indices)
+
+
+@njit
+def _build_topology_csr(offsets, indices, n_node, n_buckets):
+    """Constructs ``n_nodes_per_face`` and the edge node, face edge, edge
+    face, node face and face face connectivity from a face node connectivity
+    stored in compressed sparse row (CSR) format.
+
+    Face-edge pairs are stably sorted by their node indices in linear time
+    with two counting sorts, first by the larger and then by the smaller node
+    index. The unique edges, the edge of each face-edge pair and the faces
+    that saddle each edge are then found in a single sweep over the sorted
+    pairs, which produces the same edges (in the same order) as
+    ``_build_edge_node_connectivity``.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Row offsets of the face node connectivity, of shape (``n_face + 1``)
+    indices : np.ndarray
+        Flattened node indices of each face
+    n_node : int
+        Number of nodes
+    n_buckets : int
+        Number of buckets of the counting sorts of the face-edge pairs (largest node index + 1)
+
+    Returns
+    -------
+    n_nodes_per_face : np.ndarray
+        Number of nodes of each face
+    edge_nodes : np.ndarray
+        Unique edges of shape (``n_edge``, 2), with the smaller node index stored first
+    face_edges : np.ndarray
+        Edge of each face-edge pair, aligned with ``indices``
+    edge_faces : np.ndarray
+        Faces that saddle each edge, of shape (``n_edge``, 2)
+    node_face_offsets, node_face_indices : np.ndarray
+        CSR representation of the node face connectivity
+    face_face_offsets, face_face_indices : np.ndarray
+        CSR representation of the face face connectivity
     """
-    # First we need to build a matrix such that: the row indices are face indexes and the column indices are node
-    # indexes (similar to an adjacency matrix)
-    face_indices, node_indices, non_filled_element_flags = _face_nodes_to_sparse_matrix(
-        face_nodes
+    n_face = offsets.shape[0] - 1
+    n_entries = indices.shape[0]
+    fill_value = np.iinfo(indices.dtype).min
+
+    n_nodes_per_face = np.empty(n_face, dtype=INT_DTYPE)
+
+    # smaller and larger node of each face-edge pair, and the face it belongs to
+    edge_min = np.empty(n_entries, dtype=indices.dtype)
+    edge_max = np.empty(n_entries, dtype=indices.dtype)
+    entry_faces = np.empty(n_entries, dtype=indices.dtype)
+    for face_idx in range(n_face):
+        start = offsets[face_idx]
+        end = offsets[face_idx + 1]
+        n_nodes_per_face[face_idx] = end - start
+
+        for entry in range(start, end):
+            next_entry = entry + 1 if entry + 1 < end else start
+            node_a = indices[entry]
+            node_b = indices[next_entry]
+            edge_min[entry] = min(node_a, node_b)
+            edge_max[entry] = max(node_a, node_b)
+            entry_faces[entry] = face_idx
+
+    # least significant digit radix sort: a stable counting sort by the larger node,
+    # followed by a stable counting sort by the smaller node
+    by_max = _counting_sort(edge_max, np.arange(n_entries, dtype=INT_DTYPE), n_buckets)
+    order = _counting_sort(edge_min, by_max, n_buckets)
+
+    n_edge = 0
+    for i in range(n_entries):
+        if (
+            i == 0
+            or edge_min[order[i]] != edge_min[order[i - 1]]
+            or edge_max[order[i]] != edge_max[order[i - 1]]
+        ):
+            n_edge += 1
+
+    edge_nodes = np.empty((n_edge, 2), dtype=indices.dtype)
+    edge_faces = np.full((n_edge, 2), fill_value, dtype=indices.dtype)
+    face_edges = np.empty(n_entries, dtype=indices.dtype)
+
+    edge_idx = -1
+    for i in range(n_entries):
+        entry = order[i]
+        if (
+            i == 0
+            or edge_min[entry] != edge_min[order[i - 1]]
+            or edge_max[entry] != edge_max[order[i - 1]]
+        ):
+            edge_idx += 1
+            edge_nodes[edge_idx, 0] = edge_min[entry]
+            edge_nodes[edge_idx, 1] = edge_max[entry]
+            edge_faces[edge_idx, 0] = entry_faces[entry]
+        else:
+            edge_faces[edge_idx, 1] = entry_faces[entry]
+        face_edges[entry] = edge_idx
+
+    node_face_offsets, node_face_indices = _transpose_csr(offsets, indices, n_node)
+    face_face_offsets, face_face_indices = _build_face_face_csr(
+        offsets, face_edges, edge_faces
     )
-    coo_matrix = sparse.coo_matrix(
-        (non_filled_element_flags, (node_indices, face_indices))
+
+    return (
+        n_nodes_per_face,
+        edge_nodes,
+        face_edges,
+        edge_faces,
+        node_face_offsets,
+        node_face_indices,
+        face_face_offsets,
+        face_face_indices,
     )
-    csr_matrix = coo_matrix.tocsr()
-    # get the row and column indices of the non-zero elements
-    rows, cols = csr_matrix.nonzero()
-    # Find the frequency of each face to determine the maximum number of faces per node
-    freq = np.bincount(rows)
-    nMaxNumFacesPerNode = freq.max()
-
-    node_face_connectivity = [[]] * n_node
-
-    # find the indices where the array changes value
-    change_indices = np.where(np.diff(rows) != 0)[0] + 1
-
-    # split the array at the change indices to get subarrays of consecutive same elements
-    subarrays = np.split(rows, change_indices)
-
-    # get the start and end indices for each subarray
-    start_indices = np.cumsum([0] + [len(subarray) for subarray in subarrays[:-1]])
-    end_indices = np.cumsum([len(subarray) for subarray in subarrays]) - 1
-
-    for node_index in range(n_node):
-        node_face_connectivity[node_index] = cols[
-            start_indices[node_index] : end_indices[node_index] + 1
-        ]
-        if len(node_face_connectivity[node_index]) < nMaxNumFacesPerNode:
-            node_face_connectivity[node_index] = np.append(
-                node_face_connectivity[node_index],
-                np.full(
-                    nMaxNumFacesPerNode - len(node_face_connectivity[node_index]),
-                    INT_FILL_VALUE,
-                    dtype=INT_DTYPE,
-                ),
+
+
+@njit
+def _counting_sort(keys, order, n_buckets):
+    """Stably reorders the entries ``order`` by their ``keys`` with a counting
+    sort, where each key is in the range [0, ``n_buckets``)."""
+    bucket_offsets = np.zeros(n_buckets + 1, dtype=INT_DTYPE)
+    for entry in order:
+        bucket_offsets[keys[entry] + 1] += 1
+
+    cursor = np.cumsum(bucket_offsets)[:-1]
+
+    sorted_order = np.empty_like(order)
+    for entry in order:
+        sorted_order[cursor[keys[entry]]] = entry
+        cursor[keys[entry]] += 1
+
+    return sorted_order
+
+
+def _set_csr_connectivity(grid, name, offsets, indices, dims, attrs):
+    """Stores a connectivity variable constructed in compressed sparse row
+    (CSR) format, either only in CSR format for ragged grids or padded within
+    the internal dataset (``Grid._ds``) with its CSR representation cached."""
+    if grid.ragged:
+        _set_ragged_connectivity(grid, name, offsets, indices, dims, attrs)
+        return
+
+    padded, _ = _csr_to_padded(offsets, indices)
+
+    grid._ds[name] = xr.DataArray(padded, dims=dims, attrs=attrs)
+
+    grid._csr_connectivity[name] = (offsets, indices)
+
+
+def _set_ragged_connectivity(grid, name, offsets, indices, dims, attrs):
+    """Stores a connectivity variable of a ragged ``Grid`` in compressed
+    sparse row (CSR) format, along with the dimensions and attributes used to
+    materialize its padded representation."""
+    grid._csr_connectivity[name] = (offsets, indices)
+    grid._ragged_connectivity[name] = (dims, attrs)
+
+
+def _convert_to_ragged(grid):
+    """Converts the variable-length connectivity variables stored in the
+    internal dataset (``Grid._ds``) of a ``Grid`` into compressed sparse row
+    (CSR) format, dropping their padded representation."""
+    if "n_nodes_per_face" not in grid._ds:
+        # keeps the ``n_face`` dimension once the face node connectivity is dropped
+        _populate_n_nodes_per_face(grid)
+
+    for name in RAGGED_CONNECTIVITY:
+        if name not in grid._ds:
+            continue
+
+        padded = getattr(grid, name)
+        offsets, indices = _padded_to_csr(padded.values)
+
+        _set_ragged_connectivity(
+            grid, name, offsets, indices, list(padded.dims), dict(padded.attrs)
+        )
+
+        grid._ds = grid._ds.drop_vars(name)
+
+
+def _convert_connectivity_dtype(grid, dtype):
+    """Converts the connectivity variables stored in the internal dataset
+    (``Grid._ds``) of a ``Grid`` to the integer data type ``dtype``, replacing
+    their fill values with the fill value of the new data type."""
+    new_fill = _get_fill_value(dtype)
+
+    for name in list(grid._ds.data_vars):
+        conn = grid._ds[name]
+
+        if (
+            "_connectivity" not in name
+            or not np.issubdtype(conn.dtype, np.integer)
+            or conn.dtype == dtype
+        ):
+            continue
+
+        if conn.size > 0 and conn.values.max() > np.iinfo(dtype).max:
+            raise ValueError(
+                f"Connectivity variable {name} can not be represented using {dtype}."
             )
 
-    return node_face_connectivity, nMaxNumFacesPerNode
+        attrs = dict(conn.attrs)
+        if "_FillValue" in attrs:
+            attrs["_FillValue"] = new_fill
+
+        grid._ds[name] = xr.DataArray(
+            data=_replace_fill_values(
+                conn.values, _get_fill_value(conn.dtype), new_fill, dtype
+            ),
+            dims=conn.dims,
+            attrs=attrs,
+        )
+
+
+def _csr_to_padded(offsets, indices, n_max_per_row=None):
+    """Converts a connectivity stored in compressed sparse row (CSR) format
+    into a dense array padded with the fill value of its dtype.
+
+    Parameters
+    ----------
+    offsets : np.ndarray
+        Row offsets of shape (``n_rows + 1``)
+    indices : np.ndarray
+        Flattened connectivity entries
+    n_max_per_row : int, optional
+        Number of columns of the padded array, defaults to the length of the longest row
+
+    Returns
+    -------
+    padded : np.ndarray
+        Padded connectivity of shape (``n_rows``, ``n_max_per_row``)
+    n_max_per_row : int
+        Number of columns of the padded array
+    """
+    counts = np.diff(offsets)
+    n_rows = counts.shape[0]
+
+    if n_max_per_row is None:
+        n_max_per_row = int(counts.max()) if n_rows > 0 else 0
+
+    padded = np.full(
+        (n_rows, n_max_per_row), _get_fill_value(indices.dtype), dtype=indices.dtype
+    )
+
+    # row and column of each entry in the padded array
+    rows = np.repeat(np.arange(n_rows), counts)
+    cols = np.arange(indices.shape[0]) - offsets[rows]
+
+    padded[rows, cols] = indices
+
+    return padded, n_max_per_row
+
+
+def _padded_to_csr(padded):
+    """Converts a connectivity padded with fill values into compressed
+    sparse row (CSR) format.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Row offsets of shape (``n_rows + 1``)
+    indices : np.ndarray
+        Flattened non-fill-value connectivity entries, in row-major order
+    """
+    valid = padded != _get_fill_value(padded.dtype)
+
+    offsets = np.zeros(padded.shape[0] + 1, dtype=INT_DTYPE)
+    np.cumsum(np.count_nonzero(valid, axis=1), out=offsets[1:])
+
+    indices = padded[valid]
+
+    return offsets, indices
 
 
 def _face_nodes_to_sparse_matrix(dense_matrix: np.ndarray) -> tuple:
@@ -422,7 +1258,7 @@ def _face_nodes_to_sparse_matrix(dense_matrix: np.ndarray) -> tuple:
     """
     n_rows, n_cols = dense_matrix.shape
     flattened_matrix = dense_matrix.ravel()
-    valid_node_mask = flattened_matrix != INT_FILL_VALUE
+    valid_node_mask = flattened_matrix != _get_fill_value(flattened_matrix.dtype)
     face_indices = np.repeat(np.arange(n_rows), n_cols)[valid_node_mask]
     node_indices = flattened_matrix[valid_node_mask]
     non_filled_element_flags = np.ones(len(node_indices))
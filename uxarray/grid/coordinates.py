@@ -4,9 +4,15 @@ import xarray as xr
 import numpy as np
 import math
 
-from numba import njit, config
+from numba import njit, prange, config
 
 from uxarray.constants import ENABLE_JIT_CACHE, ENABLE_JIT, ERROR_TOLERANCE
+from uxarray.grid.cache import _load_cached, _store_cached
+from uxarray.grid.dependencies import (
+    _invalidate_derived,
+    FACE_CENTROIDS,
+    EDGE_CENTROIDS,
+)
 
 config.DISABLE_JIT = not ENABLE_JIT
 
@@ -110,13 +116,139 @@ def normalize_in_place(node):
     return list(np.array(node) / np.linalg.norm(np.array(node), ord=2))
 
 
-def _get_xyz_from_lonlat(node_lon, node_lat):
-    nodes_lon_rad = np.deg2rad(node_lon)
-    nodes_lat_rad = np.deg2rad(node_lat)
-    nodes_rad = np.stack((nodes_lon_rad, nodes_lat_rad), axis=1)
-    nodes_cart = np.asarray(list(map(node_lonlat_rad_to_xyz, list(nodes_rad))))
+def _lonlat_rad_to_xyz(lon, lat):
+    """Converts arrays of longitudes and latitudes in radians to the
+    Cartesian coordinates of the corresponding points on the unit sphere.
 
-    return nodes_cart[:, 0], nodes_cart[:, 1], nodes_cart[:, 2]
+    Vectorized counterpart of ``node_lonlat_rad_to_xyz``, which broadcasts
+    its inputs like a NumPy ufunc.
+
+    Parameters
+    ----------
+    lon : array_like
+        Longitudes in radians
+    lat : array_like
+        Latitudes in radians
+
+    Returns
+    -------
+    x, y, z : np.ndarray
+        Cartesian coordinates on the unit sphere
+    """
+    cos_lat = np.cos(lat)
+    return cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)
+
+
+def _xyz_to_lonlat_rad(x, y, z):
+    """Converts arrays of Cartesian coordinates to longitudes in [0, 2*pi)
+    and latitudes in [-pi/2, pi/2], in radians.
+
+    Vectorized counterpart of ``node_xyz_to_lonlat_rad``, which broadcasts
+    its inputs like a NumPy ufunc. Points are projected onto the unit sphere
+    and the longitude of points within ``ERROR_TOLERANCE`` of a pole is set to
+    zero.
+
+    Parameters
+    ----------
+    x, y, z : array_like
+        Cartesian coordinates
+
+    Returns
+    -------
+    lon, lat : np.ndarray
+        Longitudes and latitudes in radians
+    """
+    x, y, z = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64),
+        np.asarray(y, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+    )
+    z = z / np.sqrt(x * x + y * y + z * z)
+
+    pole = np.absolute(z) >= 1.0 - ERROR_TOLERANCE
+
+    lon = np.arctan2(y, x)
+    lon[lon < 0.0] += 2.0 * np.pi
+    lon[pole] = 0.0
+
+    lat = np.arcsin(z)
+    lat[pole] = np.copysign(0.5 * np.pi, z[pole])
+
+    return lon, lat
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _lonlat_deg_to_xyz_kernel(lon, lat, x, y, z):
+    """Parallel kernel that writes the Cartesian coordinates of points given
+    by their longitudes and latitudes in degrees into ``x``, ``y`` and ``z``,
+    whose dtype determines the precision of the result."""
+    for i in prange(lon.shape[0]):
+        lon_rad = np.deg2rad(np.float64(lon[i]))
+        lat_rad = np.deg2rad(np.float64(lat[i]))
+
+        cos_lat = np.cos(lat_rad)
+        x[i] = cos_lat * np.cos(lon_rad)
+        y[i] = cos_lat * np.sin(lon_rad)
+        z[i] = np.sin(lat_rad)
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _xyz_to_lonlat_deg_kernel(x, y, z, lon, lat):
+    """Parallel kernel that writes the longitudes in [0, 360) and latitudes
+    in degrees of points given by their Cartesian coordinates into ``lon`` and
+    ``lat``, whose dtype determines the precision of the result."""
+    for i in prange(x.shape[0]):
+        dx = np.float64(x[i])
+        dy = np.float64(y[i])
+        dz = np.float64(z[i])
+        dz /= np.sqrt(dx * dx + dy * dy + dz * dz)
+
+        if np.absolute(dz) < 1.0 - ERROR_TOLERANCE:
+            lon_rad = math.atan2(dy, dx)
+            if lon_rad < 0.0:
+                lon_rad += 2.0 * np.pi
+            lon[i] = np.rad2deg(lon_rad)
+            lat[i] = np.rad2deg(np.arcsin(dz))
+        else:
+            lon[i] = 0.0
+            lat[i] = 90.0 if dz > 0.0 else -90.0
+
+
+def _get_xyz_from_lonlat(node_lon, node_lat, dtype=np.float64):
+    """Converts arrays of longitudes and latitudes in degrees to Cartesian
+    coordinates on the unit sphere, in parallel when JIT compilation is
+    enabled.
+
+    Parameters
+    ----------
+    node_lon, node_lat : array_like
+        Longitudes and latitudes in degrees
+    dtype : np.dtype, optional
+        Floating point type of the result (i.e. ``np.float32``)
+
+    Returns
+    -------
+    x, y, z : np.ndarray
+        Cartesian coordinates with the shape of ``node_lon``
+    """
+    node_lon = np.asarray(node_lon)
+    node_lat = np.asarray(node_lat)
+
+    if not ENABLE_JIT:
+        x, y, z = _lonlat_rad_to_xyz(np.deg2rad(node_lon), np.deg2rad(node_lat))
+        return x.astype(dtype), y.astype(dtype), z.astype(dtype)
+
+    shape = node_lon.shape
+    x, y, z = (np.empty(shape, dtype=dtype) for _ in range(3))
+    _lonlat_deg_to_xyz_kernel(
+        np.ascontiguousarray(node_lon).ravel(),
+        np.ascontiguousarray(node_lat).ravel(),
+        x.reshape(-1),
+        y.reshape(-1),
+        z.reshape(-1),
+    )
+
+    return x, y, z
 
 
 def _populate_cartesian_xyz_coord(grid):
@@ -175,12 +307,41 @@ def _populate_cartesian_xyz_coord(grid):
     )
 
 
-def _get_lonlat_from_xyz(x, y, z):
-    nodes_cart = np.stack((x, y, z), axis=1).tolist()
-    nodes_rad = list(map(node_xyz_to_lonlat_rad, nodes_cart))
-    nodes_degree = np.rad2deg(nodes_rad)
+def _get_lonlat_from_xyz(x, y, z, dtype=np.float64):
+    """Converts arrays of Cartesian coordinates to longitudes in [0, 360) and
+    latitudes in degrees, in parallel when JIT compilation is enabled.
+
+    Parameters
+    ----------
+    x, y, z : array_like
+        Cartesian coordinates, which do not need to be normalized
+    dtype : np.dtype, optional
+        Floating point type of the result (i.e. ``np.float32``)
 
-    return nodes_degree[:, 0], nodes_degree[:, 1]
+    Returns
+    -------
+    lon, lat : np.ndarray
+        Longitudes and latitudes in degrees with the shape of ``x``
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    z = np.asarray(z)
+
+    if not ENABLE_JIT:
+        lon, lat = _xyz_to_lonlat_rad(x, y, z)
+        return np.rad2deg(lon).astype(dtype), np.rad2deg(lat).astype(dtype)
+
+    shape = x.shape
+    lon, lat = (np.empty(shape, dtype=dtype) for _ in range(2))
+    _xyz_to_lonlat_deg_kernel(
+        np.ascontiguousarray(x).ravel(),
+        np.ascontiguousarray(y).ravel(),
+        np.ascontiguousarray(z).ravel(),
+        lon.reshape(-1),
+        lat.reshape(-1),
+    )
+
+    return lon, lat
 
 
 def _populate_lonlat_coord(grid):
@@ -247,14 +408,12 @@ def _populate_face_centroids(grid, repopulate=False):
     node_x = grid.node_x.values
     node_y = grid.node_y.values
     node_z = grid.node_z.values
-    face_nodes = grid.face_node_connectivity.values
-    n_nodes_per_face = grid.n_nodes_per_face.values
 
     if "face_lon" not in grid._ds or repopulate:
         # Construct the centroids if there are none stored
         if "face_x" not in grid._ds:
-            centroid_x, centroid_y, centroid_z = _construct_face_centroids(
-                node_x, node_y, node_z, face_nodes, n_nodes_per_face
+            centroid_x, centroid_y, centroid_z = _build_face_centroids(
+                grid, node_x, node_y, node_z
             )
 
         else:
@@ -272,6 +431,9 @@ def _populate_face_centroids(grid, repopulate=False):
             centroid_lon, centroid_lat
         )
 
+    if repopulate:
+        _invalidate_derived(grid, FACE_CENTROIDS)
+
     # Populate the centroids
     if "face_lon" not in grid._ds or repopulate:
         grid._ds["face_lon"] = xr.DataArray(
@@ -295,6 +457,37 @@ def _populate_face_centroids(grid, repopulate=False):
         )
 
 
+def _build_face_centroids(grid, node_x, node_y, node_z):
+    """Constructs the xyz centroid coordinate of each face, which is loaded
+    from and stored to the grid cache when enabled."""
+    cached = _load_cached(grid, "face_centroids")
+
+    if cached is not None:
+        return cached["face_x"], cached["face_y"], cached["face_z"]
+
+    if grid.ragged:
+        centroid_x, centroid_y, centroid_z = _construct_face_centroids_csr(
+            node_x,
+            node_y,
+            node_z,
+            *grid.get_csr_connectivity("face_node_connectivity"),
+        )
+    else:
+        centroid_x, centroid_y, centroid_z = _construct_face_centroids(
+            node_x,
+            node_y,
+            node_z,
+            grid.face_node_connectivity.values,
+            grid.n_nodes_per_face.values,
+        )
+
+    _store_cached(
+        grid, "face_centroids", face_x=centroid_x, face_y=centroid_y, face_z=centroid_z
+    )
+
+    return centroid_x, centroid_y, centroid_z
+
+
 @njit()
 def _construct_face_centroids(node_x, node_y, node_z, face_nodes, n_nodes_per_face):
     """Constructs the xyz centroid coordinate for each face using Cartesian
@@ -320,6 +513,35 @@ def _construct_face_centroids(node_x, node_y, node_z, face_nodes, n_nodes_per_fa
     return centroids[0, :], centroids[1, :], centroids[2, :]
 
 
+@njit()
+def _construct_face_centroids_csr(node_x, node_y, node_z, offsets, indices):
+    """Constructs the xyz centroid coordinate for each face using Cartesian
+    Averaging, given a ``face_node_connectivity`` stored in compressed sparse
+    row (CSR) format."""
+    n_face = offsets.shape[0] - 1
+    centroids = np.zeros((3, n_face), dtype=np.float64)
+
+    for face_idx in range(n_face):
+        face_nodes = indices[offsets[face_idx] : offsets[face_idx + 1]]
+
+        # compute cartesian average
+        centroid_x = np.mean(node_x[face_nodes])
+        centroid_y = np.mean(node_y[face_nodes])
+        centroid_z = np.mean(node_z[face_nodes])
+
+        # normalize coordinates
+        centroid_normalized_xyz = normalize_in_place(
+            [centroid_x, centroid_y, centroid_z]
+        )
+
+        # store xyz
+        centroids[0, face_idx] = centroid_normalized_xyz[0]
+        centroids[1, face_idx] = centroid_normalized_xyz[1]
+        centroids[2, face_idx] = centroid_normalized_xyz[2]
+
+    return centroids[0, :], centroids[1, :], centroids[2, :]
+
+
 def _populate_edge_centroids(grid, repopulate=False):
     """Finds the centroids using cartesian averaging of the edges based off the
     vertices. The centroid is defined as the average of the x, y, z
@@ -359,6 +581,9 @@ def _populate_edge_centroids(grid, repopulate=False):
         )
 
     # Populate the centroids
+    if repopulate:
+        _invalidate_derived(grid, EDGE_CENTROIDS)
+
     if "edge_lon" not in grid._ds or repopulate:
         grid._ds["edge_lon"] = xr.DataArray(
             centroid_lon,
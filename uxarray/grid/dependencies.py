@@ -0,0 +1,184 @@
+"""Registry of the quantities that a ``Grid`` derives from its node
+coordinates and ``face_node_connectivity``, declaring which quantities each
+one is computed from.
+
+The registry is used to precompute several quantities at once in dependency
+order (``Grid.compute``) and to consistently discard everything that depends
+on a quantity (i.e. the node coordinates) once it has changed.
+"""
+import copy
+
+from collections import OrderedDict
+
+NODE_LONLAT = ("node_lon", "node_lat")
+NODE_XYZ = ("node_x", "node_y", "node_z")
+FACE_CENTROIDS = ("face_lon", "face_lat", "face_x", "face_y", "face_z")
+EDGE_CENTROIDS = ("edge_lon", "edge_lat", "edge_x", "edge_y", "edge_z")
+
+# quantities that describe a grid, which are never discarded
+SOURCE_QUANTITIES = ("face_node_connectivity",) + NODE_LONLAT + NODE_XYZ
+
+# derived quantities, mapped to the quantities they are directly computed from
+DERIVED_QUANTITIES = {
+    "n_nodes_per_face": ("face_node_connectivity",),
+    "edge_node_connectivity": ("face_node_connectivity",),
+    "face_edge_connectivity": ("face_node_connectivity", "edge_node_connectivity"),
+    "edge_face_connectivity": ("face_edge_connectivity", "n_nodes_per_face"),
+    "node_face_connectivity": ("face_node_connectivity",),
+    "face_face_connectivity": ("face_edge_connectivity", "edge_face_connectivity"),
+    "node_edge_connectivity": ("edge_node_connectivity",),
+    "node_node_connectivity": ("edge_node_connectivity", "node_edge_connectivity"),
+    "edge_edge_connectivity": ("edge_node_connectivity", "node_edge_connectivity"),
+    **{name: ("face_node_connectivity",) + NODE_XYZ for name in FACE_CENTROIDS},
+    **{name: ("edge_node_connectivity",) + NODE_XYZ for name in EDGE_CENTROIDS},
+    "edge_node_distances": ("edge_node_connectivity",) + NODE_LONLAT,
+    "edge_face_distances": ("edge_face_connectivity",) + NODE_LONLAT,
+    "antimeridian_face_indices": ("face_node_connectivity",) + NODE_LONLAT,
+    "face_areas": ("face_node_connectivity",) + NODE_XYZ,
+    "face_jacobian": ("face_node_connectivity",) + NODE_XYZ,
+    "fingerprint": ("face_node_connectivity",) + NODE_LONLAT,
+}
+
+# objects cached on a ``Grid`` that are only discarded (never precomputed), mapped to the quantities they depend on
+CACHED_OBJECTS = {
+    "ball_tree": NODE_LONLAT + NODE_XYZ + FACE_CENTROIDS + EDGE_CENTROIDS,
+    "kd_tree": NODE_LONLAT + NODE_XYZ + FACE_CENTROIDS + EDGE_CENTROIDS,
+    "geodataframe": ("face_node_connectivity", "antimeridian_face_indices")
+    + NODE_LONLAT,
+    "polycollection": ("face_node_connectivity", "antimeridian_face_indices")
+    + NODE_LONLAT,
+    "linecollection": ("face_node_connectivity",) + NODE_LONLAT,
+    "points_dataframes": ("face_lon", "face_lat") + NODE_LONLAT,
+    "operators": (
+        "face_node_connectivity",
+        "edge_node_connectivity",
+        "edge_face_connectivity",
+        "node_face_connectivity",
+        "edge_node_distances",
+        "edge_face_distances",
+        "face_areas",
+    ),
+}
+
+# quantities that are stored as attributes of a ``Grid`` instead of in ``Grid._ds``, mapped to each attribute and
+# its value when nothing is cached
+CACHED_ATTRIBUTES = {
+    "antimeridian_face_indices": {"_antimeridian_face_indices": None},
+    "face_areas": {
+        "_face_areas": None,
+        "_face_jacobian": None,
+        "_face_area_cache": OrderedDict(),
+    },
+    "face_jacobian": {
+        "_face_areas": None,
+        "_face_jacobian": None,
+        "_face_area_cache": OrderedDict(),
+    },
+    "fingerprint": {"_fingerprint": None},
+    "ball_tree": {"_tree_cache": OrderedDict()},
+    "kd_tree": {"_tree_cache": OrderedDict()},
+    "geodataframe": {"_gdf": None, "_gdf_exclude_am": None},
+    "polycollection": {"_poly_collection": None},
+    "linecollection": {"_line_collection": None},
+    "points_dataframes": {
+        "_centroid_points_df_proj": [None, None],
+        "_corner_points_df_proj": [None, None],
+    },
+    "operators": {"_operator_cache": {}},
+}
+
+
+def _dependencies(name):
+    """Quantities that ``name`` is directly computed from."""
+    return DERIVED_QUANTITIES.get(name, CACHED_OBJECTS.get(name, ()))
+
+
+def _resolve_order(names):
+    """Orders the requested derived quantities and everything they are
+    computed from, so that each quantity comes after its dependencies.
+
+    Raises
+    ------
+    ValueError
+        If a requested quantity is not a known derived quantity
+    """
+    for name in names:
+        if name not in DERIVED_QUANTITIES and name not in SOURCE_QUANTITIES:
+            raise ValueError(
+                f"Unknown derived quantity: {name}. Expected one of "
+                f"{list(DERIVED_QUANTITIES)}"
+            )
+
+    order = []
+    visited = set()
+
+    def _visit(name):
+        if name in visited:
+            return
+        visited.add(name)
+        for dependency in _dependencies(name):
+            _visit(dependency)
+        order.append(name)
+
+    for name in names:
+        _visit(name)
+
+    return order
+
+
+def _dependents(names):
+    """All derived quantities and cached objects that are directly or
+    indirectly computed from any of ``names``."""
+    registry = {**DERIVED_QUANTITIES, **CACHED_OBJECTS}
+
+    dependents = set()
+    changed = set(names)
+    while changed:
+        changed = {
+            name
+            for name, dependencies in registry.items()
+            if name not in dependents and changed.intersection(dependencies)
+        }
+        dependents |= changed
+
+    return dependents
+
+
+def _compute_derived(grid, names):
+    """Computes each of the requested derived quantities of a grid, along
+    with the quantities they are computed from, each at most once."""
+    for name in _resolve_order(names):
+        getattr(grid, name)
+
+
+def _invalidate_derived(grid, names):
+    """Discards every derived quantity and cached object of a grid that
+    depends on any of ``names``, so that they are recomputed from the current
+    values on their next access.
+
+    Must be called whenever a quantity (i.e. the node coordinates) is
+    modified in place. Modifying one representation of the node coordinates
+    (spherical or Cartesian) also discards the other one, which is
+    reconstructed from the modified one.
+    """
+    names = set(names)
+
+    for modified, other in ((NODE_LONLAT, NODE_XYZ), (NODE_XYZ, NODE_LONLAT)):
+        if names.intersection(modified) and not names.intersection(other):
+            grid._ds = grid._ds.drop_vars([name for name in other if name in grid._ds])
+            names.update(other)
+
+    # the CSR representation of a modified padded connectivity variable is stale
+    for name in names:
+        if name not in grid._ragged_connectivity:
+            grid._csr_connectivity.pop(name, None)
+
+    for name in _dependents(names):
+        if name in grid._ds:
+            grid._ds = grid._ds.drop_vars(name)
+
+        grid._csr_connectivity.pop(name, None)
+        grid._ragged_connectivity.pop(name, None)
+
+        for attr, value in CACHED_ATTRIBUTES.get(name, {}).items():
+            setattr(grid, attr, copy.copy(value))
@@ -1,6 +1,8 @@
 import numpy as np
 from uxarray.constants import INT_DTYPE, ERROR_TOLERANCE, INT_FILL_VALUE
 from uxarray.grid.intersections import gca_gca_intersection
+from uxarray.grid.connectivity import _next_face_nodes_csr
+from uxarray.grid.cache import _load_cached, _store_cached
 import warnings
 
 from numba import njit
@@ -25,7 +27,7 @@ def _pad_closed_face_nodes(
     Ensures each resulting polygon has the same number of vertices.
     """
 
-    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=INT_DTYPE)
+    closed = np.ones((n_face, n_max_face_nodes + 1), dtype=face_node_connectivity.dtype)
 
     # set final value to the original
     closed[:, :-1] = face_node_connectivity.copy()
@@ -183,19 +185,52 @@ def _build_antimeridian_face_indices(shells_x):
         return x_cross_indices
 
 
+def _build_antimeridian_face_indices_csr(node_lon, offsets, indices):
+    """Identifies any face that has an edge that crosses the antimeridian,
+    given a ``face_node_connectivity`` stored in compressed sparse row (CSR)
+    format."""
+    lon = node_lon.astype(np.float32)
+    x_mag = np.abs(lon[_next_face_nodes_csr(offsets, indices)] - lon[indices])
+
+    # face of each face-edge pair
+    face_ids = np.repeat(
+        np.arange(offsets.shape[0] - 1, dtype=INT_DTYPE), np.diff(offsets)
+    )
+
+    x_cross_counts = np.bincount(face_ids[x_mag >= 180], minlength=offsets.shape[0] - 1)
+
+    return np.flatnonzero(x_cross_counts).astype(INT_DTYPE)
+
+
 def _populate_antimeridian_face_indices(grid):
     """Populates ``Grid.antimeridian_face_indices``"""
-    polygon_shells = _build_polygon_shells(
-        grid.node_lon.values,
-        grid.node_lat.values,
-        grid.face_node_connectivity.values,
-        grid.n_face,
-        grid.n_max_face_nodes,
-        grid.n_nodes_per_face.values,
-    )
+    cached = _load_cached(grid, "antimeridian_face_indices")
 
-    antimeridian_face_indices = _build_antimeridian_face_indices(
-        polygon_shells[:, :, 0]
+    if cached is not None:
+        return cached["antimeridian_face_indices"]
+
+    if grid.ragged:
+        antimeridian_face_indices = _build_antimeridian_face_indices_csr(
+            grid.node_lon.values, *grid.get_csr_connectivity("face_node_connectivity")
+        )
+    else:
+        polygon_shells = _build_polygon_shells(
+            grid.node_lon.values,
+            grid.node_lat.values,
+            grid.face_node_connectivity.values,
+            grid.n_face,
+            grid.n_max_face_nodes,
+            grid.n_nodes_per_face.values,
+        )
+
+        antimeridian_face_indices = _build_antimeridian_face_indices(
+            polygon_shells[:, :, 0]
+        )
+
+    _store_cached(
+        grid,
+        "antimeridian_face_indices",
+        antimeridian_face_indices=antimeridian_face_indices,
     )
 
     return antimeridian_face_indices
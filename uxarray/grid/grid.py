@@ -2,6 +2,10 @@
 import xarray as xr
 import numpy as np
 
+import uxarray.constants
+
+from collections import OrderedDict
+
 from typing import Optional, Union
 
 # reader and writer imports
@@ -13,7 +17,13 @@ from uxarray.io._esmf import _read_esmf
 from uxarray.io._vertices import _read_face_vertices
 
 from uxarray.io.utils import _parse_grid_type
-from uxarray.grid.area import get_all_face_area_from_coords
+from uxarray.grid.area import (
+    _get_all_face_area_from_csr,
+    _get_all_face_area_exact_from_csr,
+    _get_control_areas,
+    _get_kite_areas,
+    AREA_METHODS,
+)
 from uxarray.grid.coordinates import (
     _populate_face_centroids,
     _populate_edge_centroids,
@@ -25,6 +35,15 @@ from uxarray.grid.connectivity import (
     _populate_n_nodes_per_face,
     _populate_node_face_connectivity,
     _populate_edge_face_connectivity,
+    _populate_face_face_connectivity,
+    _populate_node_node_connectivity,
+    _populate_node_edge_connectivity,
+    _populate_edge_edge_connectivity,
+    _populate_topology,
+    _padded_to_csr,
+    _csr_to_padded,
+    _convert_to_ragged,
+    _convert_connectivity_dtype,
 )
 
 from uxarray.grid.coordinates import (
@@ -32,6 +51,20 @@ from uxarray.grid.coordinates import (
     _populate_cartesian_xyz_coord,
 )
 
+from uxarray.grid.cache import (
+    _load_cached,
+    _store_cached,
+    _grid_fingerprint,
+    _load_cached_tree,
+    _store_cached_tree,
+)
+
+from uxarray.grid.dependencies import _compute_derived, _invalidate_derived
+
+from uxarray.grid.reorder import _reorder_grid
+
+from uxarray.grid.partition import _partition_grid
+
 from uxarray.grid.geometry import (
     _populate_antimeridian_face_indices,
     _grid_to_polygon_geodataframe,
@@ -42,6 +75,8 @@ from uxarray.grid.geometry import (
 from uxarray.grid.neighbors import (
     BallTree,
     KDTree,
+    SphericalIndex,
+    _locate_points,
     _populate_edge_face_distances,
     _populate_edge_node_distances,
 )
@@ -50,6 +85,8 @@ from uxarray.plot.accessor import GridPlotAccessor
 
 from uxarray.subset import GridSubsetAccessor
 
+from uxarray.grid.operators import GridOperatorsAccessor
+
 from uxarray.grid.validation import (
     _check_connectivity,
     _check_duplicate_nodes,
@@ -83,6 +120,16 @@ class Grid:
     source_dims_dict : dict, default={}
         Mapping of dimensions from the source dataset to their UGRID equivalent (i.e. {nCell : n_face})
 
+    ragged : bool, default=False
+        Whether to store connectivity variables with a variable number of entries per row (i.e.
+        ``face_node_connectivity``) in compressed sparse row (CSR) format instead of padding them with fill values,
+        which reduces the memory footprint of mixed-element grids. Padded representations are constructed on access.
+
+    connectivity_dtype : np.dtype, optional
+        Integer data type (``np.int32`` or ``np.int64``) used to store connectivity variables, with fill values set to
+        the minimum value of the data type. Defaults to ``uxarray.constants.CONNECTIVITY_DTYPE``, which can be set
+        using ``uxarray.utils.set_connectivity_dtype``
+
     Examples
     ----------
 
@@ -106,6 +153,8 @@ class Grid:
         grid_ds: xr.Dataset,
         source_grid_spec: Optional[str] = None,
         source_dims_dict: Optional[dict] = {},
+        ragged: Optional[bool] = False,
+        connectivity_dtype: Optional[np.dtype] = None,
     ):
         # check if inputted dataset is a minimum representable 2D UGRID unstructured grid
         if not _validate_minimum_ugrid(grid_ds):
@@ -137,6 +186,21 @@ class Grid:
         # initialize attributes
         self._antimeridian_face_indices = None
         self._face_areas = None
+        self._face_jacobian = None
+
+        # face areas and jacobians of each (method, quadrature rule, order, coordinate type), and node and edge areas
+        # keyed by their dimension followed by the same parameters, in least recently used order
+        self._face_area_cache = OrderedDict()
+
+        # compressed sparse row (offsets, indices) representation of connectivity variables
+        self._csr_connectivity = {}
+
+        # dimensions and attributes of connectivity variables that are only stored in CSR format
+        self._ragged = ragged
+        self._ragged_connectivity = {}
+
+        # content hash of the node coordinates and face node connectivity, used as the key of the grid cache
+        self._fingerprint = None
 
         # initialize cached data structures (visualization)
         self._gdf = None
@@ -147,22 +211,51 @@ class Grid:
         self._corner_points_df_proj = [None, None]
         self._raster_data_id = None
 
-        # initialize cached data structures (nearest neighbor operations)
-        self._ball_tree = None
-        self._kd_tree = None
+        # sparse matrices of linear operators on data mapped to the grid (i.e. nodal averaging)
+        self._operator_cache = {}
+
+        # initialize cached data structures (nearest neighbor operations), with one tree per tree type, element,
+        # coordinate system and distance metric, along with the number of cache hits and misses
+        self._tree_cache = OrderedDict()
+        self._tree_cache_hits = 0
+        self._tree_cache_misses = 0
 
         # set desired longitude range to [-180, 180]
         _set_desired_longitude_range(self._ds)
 
+        if connectivity_dtype is None:
+            connectivity_dtype = uxarray.constants.CONNECTIVITY_DTYPE
+
+        # integer data type of all connectivity variables
+        self._connectivity_dtype = np.dtype(connectivity_dtype)
+
+        if self._connectivity_dtype not in uxarray.constants.CONNECTIVITY_DTYPES:
+            raise ValueError(
+                f"Unsupported connectivity dtype: {self._connectivity_dtype}"
+            )
+
+        _convert_connectivity_dtype(self, self._connectivity_dtype)
+
+        if self._ragged:
+            _convert_to_ragged(self)
+
     # declare plotting accessor
     plot = UncachedAccessor(GridPlotAccessor)
 
     # declare subset accessor
     subset = UncachedAccessor(GridSubsetAccessor)
 
+    # declare operators accessor
+    operators = UncachedAccessor(GridOperatorsAccessor)
+
     @classmethod
     def from_dataset(
-        cls, dataset: xr.Dataset, use_dual: Optional[bool] = False, **kwargs
+        cls,
+        dataset: xr.Dataset,
+        use_dual: Optional[bool] = False,
+        ragged: Optional[bool] = False,
+        connectivity_dtype: Optional[np.dtype] = None,
+        **kwargs,
     ):
         """Constructs a ``Grid`` object from an ``xarray.Dataset``.
 
@@ -172,6 +265,10 @@ class Grid:
             ``xarray.Dataset`` containing unstructured grid coordinates and connectivity variables
         use_dual : bool, default=False
             When reading in MPAS formatted datasets, indicates whether to use the Dual Mesh
+        ragged : bool, default=False
+            Whether to store variable-length connectivity variables in compressed sparse row (CSR) format
+        connectivity_dtype : np.dtype, optional
+            Integer data type (``np.int32`` or ``np.int64``) used to store connectivity variables
         """
         if not isinstance(dataset, xr.Dataset):
             raise ValueError("Input must be an xarray.Dataset")
@@ -202,13 +299,21 @@ class Grid:
             grid_ds = dataset
             source_dims_dict = {}
 
-        return cls(grid_ds, source_grid_spec, source_dims_dict)
+        return cls(
+            grid_ds,
+            source_grid_spec,
+            source_dims_dict,
+            ragged=ragged,
+            connectivity_dtype=connectivity_dtype,
+        )
 
     @classmethod
     def from_face_vertices(
         cls,
         face_vertices: Union[list, tuple, np.ndarray],
         latlon: Optional[bool] = True,
+        ragged: Optional[bool] = False,
+        connectivity_dtype: Optional[np.dtype] = None,
     ):
         """Constructs a ``Grid`` object from user-defined face vertices.
 
@@ -218,6 +323,10 @@ class Grid:
             array-like input containing the face vertices to construct the grid from
         latlon : bool, default=True
             Indicates whether the inputted vertices are in lat/lon, with units in degrees
+        ragged : bool, default=False
+            Whether to store variable-length connectivity variables in compressed sparse row (CSR) format
+        connectivity_dtype : np.dtype, optional
+            Integer data type (``np.int32`` or ``np.int64``) used to store connectivity variables
         """
         if not isinstance(face_vertices, (list, tuple, np.ndarray)):
             raise ValueError("Input must be either a list, tuple, or np.ndarray")
@@ -237,7 +346,12 @@ class Grid:
                 f"one face is passed in."
             )
 
-        return cls(grid_ds, source_grid_spec="Face Vertices")
+        return cls(
+            grid_ds,
+            source_grid_spec="Face Vertices",
+            ragged=ragged,
+            connectivity_dtype=connectivity_dtype,
+        )
 
     def validate(self):
         """Validate a grid object check for common errors, such as:
@@ -305,50 +419,36 @@ class Grid:
 
         connectivity_heading = "Grid Connectivity Variables:\n"
         connectivity_str = ""
-        if "face_node_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * face_node_connectivity: {self.face_node_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("face_node_connectivity"):
+            connectivity_str += f"  * face_node_connectivity: {self._connectivity_shape('face_node_connectivity')}\n"
 
         if "edge_node_connectivity" in self._ds:
             connectivity_str += (
                 f"  * edge_node_connectivity: {self.edge_node_connectivity.shape}\n"
             )
 
-        if "node_node_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * node_node_connectivity: {self.node_node_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("node_node_connectivity"):
+            connectivity_str += f"  * node_node_connectivity: {self._connectivity_shape('node_node_connectivity')}\n"
 
-        if "face_edge_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * face_edge_connectivity: {self.face_edge_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("face_edge_connectivity"):
+            connectivity_str += f"  * face_edge_connectivity: {self._connectivity_shape('face_edge_connectivity')}\n"
 
-        if "edge_edge_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * edge_edge_connectivity: {self.edge_edge_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("edge_edge_connectivity"):
+            connectivity_str += f"  * edge_edge_connectivity: {self._connectivity_shape('edge_edge_connectivity')}\n"
 
-        if "node_edge_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * node_edge_connectivity: {self.node_edge_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("node_edge_connectivity"):
+            connectivity_str += f"  * node_edge_connectivity: {self._connectivity_shape('node_edge_connectivity')}\n"
 
-        if "face_face_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * face_face_connectivity: {self.face_face_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("face_face_connectivity"):
+            connectivity_str += f"  * face_face_connectivity: {self._connectivity_shape('face_face_connectivity')}\n"
 
         if "edge_face_connectivity" in self._ds:
             connectivity_str += (
                 f"  * edge_face_connectivity: {self.edge_face_connectivity.shape}\n"
             )
 
-        if "node_face_connectivity" in self._ds:
-            connectivity_str += (
-                f"  * node_face_connectivity: {self.node_face_connectivity.shape}\n"
-            )
+        if self._connectivity_populated("node_face_connectivity"):
+            connectivity_str += f"  * node_face_connectivity: {self._connectivity_shape('node_face_connectivity')}\n"
 
         return (
             prefix
@@ -365,6 +465,9 @@ class Grid:
         """Two grids are equal if they have matching grid topology variables,
         coordinates, and dims all of which are equal.
 
+        Grids are compared using their ``fingerprint``, which is computed once for each grid, so repeated comparisons
+        are constant time.
+
         Parameters
         ----------
         other : uxarray.Grid
@@ -378,18 +481,16 @@ class Grid:
         if not isinstance(other, Grid):
             return False
 
-        if self.source_grid_spec != other.source_grid_spec:
-            return False
+        if self is other:
+            return True
 
-        if not (
-            self.node_lon.equals(other.node_lon) or self.node_lat.equals(other.node_lat)
-        ):
+        if self.source_grid_spec != other.source_grid_spec:
             return False
 
-        if not self.face_node_connectivity.equals(other.face_node_connectivity):
+        if self.n_node != other.n_node or self.n_face != other.n_face:
             return False
 
-        return True
+        return self.fingerprint == other.fingerprint
 
     def __ne__(self, other) -> bool:
         """Two grids are not equal if they have differing grid topology
@@ -448,7 +549,7 @@ class Grid:
     def n_max_face_nodes(self) -> int:
         """Dimension ``n_max_face_nodes``, which represents the maximum number
         of nodes that a face may contain."""
-        return self.face_node_connectivity.shape[1]
+        return self._connectivity_shape("face_node_connectivity")[1]
 
     @property
     def n_max_face_edges(self) -> xr.DataArray:
@@ -457,10 +558,10 @@ class Grid:
 
         Equivalent to ``n_max_face_nodes``
         """
-        if "n_max_face_edges" not in self._ds:
+        if not self._connectivity_populated("face_edge_connectivity"):
             _populate_face_edge_connectivity(self)
 
-        return self._ds["face_edge_connectivity"].shape[1]
+        return self._connectivity_shape("face_edge_connectivity")[1]
 
     @property
     def n_nodes_per_face(self) -> xr.DataArray:
@@ -482,12 +583,20 @@ class Grid:
         in degrees.
 
         Dimensions (``n_node``)
+
+        Setting it discards every quantity derived from the node coordinates
+        (see ``Grid._update_coordinates``), which applies to all node
+        coordinates.
         """
         if "node_lon" not in self._ds:
             _set_desired_longitude_range(self._ds)
             _populate_lonlat_coord(self)
         return self._ds["node_lon"]
 
+    @node_lon.setter
+    def node_lon(self, value):
+        self._update_coordinates({"node_lon": value})
+
     @property
     def node_lat(self) -> xr.DataArray:
         """Coordinate ``node_lat``, which contains the latitude of each node in
@@ -500,6 +609,10 @@ class Grid:
             _populate_lonlat_coord(self)
         return self._ds["node_lat"]
 
+    @node_lat.setter
+    def node_lat(self, value):
+        self._update_coordinates({"node_lat": value})
+
     # ==================================================================================================================
     # Cartesian Node Coordinates
     @property
@@ -514,6 +627,10 @@ class Grid:
 
         return self._ds["node_x"]
 
+    @node_x.setter
+    def node_x(self, value):
+        self._update_coordinates({"node_x": value})
+
     @property
     def node_y(self) -> xr.DataArray:
         """Coordinate ``node_y``, which contains the Cartesian y location of
@@ -525,6 +642,10 @@ class Grid:
             _populate_cartesian_xyz_coord(self)
         return self._ds["node_y"]
 
+    @node_y.setter
+    def node_y(self, value):
+        self._update_coordinates({"node_y": value})
+
     @property
     def node_z(self) -> xr.DataArray:
         """Coordinate ``node_z``, which contains the Cartesian y location of
@@ -536,6 +657,10 @@ class Grid:
             _populate_cartesian_xyz_coord(self)
         return self._ds["node_z"]
 
+    @node_z.setter
+    def node_z(self, value):
+        self._update_coordinates({"node_z": value})
+
     # ==================================================================================================================
     # Spherical Edge Coordinates
     @property
@@ -674,6 +799,8 @@ class Grid:
 
         Nodes are in counter-clockwise order.
         """
+        if "face_node_connectivity" in self._ragged_connectivity:
+            return self._get_padded_connectivity("face_node_connectivity")
 
         if self._ds["face_node_connectivity"].values.ndim == 1:
             face_node_connectivity_1d = self._ds["face_node_connectivity"].values
@@ -705,8 +832,18 @@ class Grid:
 
     @property
     def node_node_connectivity(self) -> xr.DataArray:
-        """Connectivity Variable ``node_node_connectivity``."""
-        return None
+        """Connectivity Variable ``node_node_connectivity``, which maps every
+        node to the nodes that it shares an edge with.
+
+        Dimensions (``n_node``, ``n_max_node_nodes``) and DataType
+        ``INT_DTYPE``.
+
+        Neighbors are ordered by the index of the edge they share with the node.
+        """
+        if not self._connectivity_populated("node_node_connectivity"):
+            _populate_node_node_connectivity(self)
+
+        return self._get_padded_connectivity("node_node_connectivity")
 
     # ==================================================================================================================
     # (, edge) Connectivity
@@ -718,27 +855,57 @@ class Grid:
         Dimensions (``n_face``, ``n_max_face_nodes``) and DataType
         ``INT_DTYPE``.
         """
-        if "face_edge_connectivity" not in self._ds:
+        if not self._connectivity_populated("face_edge_connectivity"):
             _populate_face_edge_connectivity(self)
 
-        return self._ds["face_edge_connectivity"]
+        return self._get_padded_connectivity("face_edge_connectivity")
 
     @property
     def edge_edge_connectivity(self) -> xr.DataArray:
-        """Connectivity Variable ``edge_edge_connectivity``."""
-        return None
+        """Connectivity Variable ``edge_edge_connectivity``, which maps every
+        edge to the edges that it shares a node with.
+
+        Dimensions (``n_edge``, ``n_max_edge_edges``) and DataType
+        ``INT_DTYPE``.
+
+        Contains the other edges of the first node of each edge, followed by the other edges of its second node.
+        """
+        if not self._connectivity_populated("edge_edge_connectivity"):
+            _populate_edge_edge_connectivity(self)
+
+        return self._get_padded_connectivity("edge_edge_connectivity")
 
     @property
     def node_edge_connectivity(self) -> xr.DataArray:
-        """Connectivity Variable ``node_edge_connectivity``."""
-        return None
+        """Connectivity Variable ``node_edge_connectivity``, which maps every
+        node to the edges that it is part of.
+
+        Dimensions (``n_node``, ``n_max_node_edges``) and DataType
+        ``INT_DTYPE``.
+
+        Edges are in ascending order.
+        """
+        if not self._connectivity_populated("node_edge_connectivity"):
+            _populate_node_edge_connectivity(self)
+
+        return self._get_padded_connectivity("node_edge_connectivity")
 
     # ==================================================================================================================
     # (, face) Connectivity
     @property
     def face_face_connectivity(self) -> xr.DataArray:
-        """Connectivity Variable ``face_face_connectivity``."""
-        return None
+        """Connectivity Variable ``face_face_connectivity``, which maps every
+        face to the faces that share an edge with it.
+
+        Dimensions (``n_face``, ``n_max_face_faces``) and DataType
+        ``INT_DTYPE``.
+
+        Neighbors are ordered by the edge they share with the face, with faces on the boundary padded with fill values.
+        """
+        if not self._connectivity_populated("face_face_connectivity"):
+            _populate_face_face_connectivity(self)
+
+        return self._get_padded_connectivity("face_face_connectivity")
 
     @property
     def edge_face_connectivity(self) -> xr.DataArray:
@@ -757,13 +924,15 @@ class Grid:
         """Connectivity Variable ``node_face_connectivity``, which maps every
         node to its faces.
 
+        Faces are in ascending order.
+
         Dimensions (``n_node``, ``n_max_faces_per_node``) and DataType
         ``INT_DTYPE``.
         """
-        if "node_face_connectivity" not in self._ds:
+        if not self._connectivity_populated("node_face_connectivity"):
             _populate_node_face_connectivity(self)
 
-        return self._ds["node_face_connectivity"]
+        return self._get_padded_connectivity("node_face_connectivity")
 
     # ==================================================================================================================
     # Distance Quantities
@@ -804,6 +973,18 @@ class Grid:
             self._face_areas, self._face_jacobian = self.compute_face_areas()
         return self._face_areas
 
+    @property
+    def node_areas(self) -> np.ndarray:
+        """Area of the dual cell around each node, see
+        ``Grid.compute_node_areas``."""
+        return self.compute_node_areas()
+
+    @property
+    def edge_areas(self) -> np.ndarray:
+        """Area of the dual cell around each edge, see
+        ``Grid.compute_edge_areas``."""
+        return self.compute_edge_areas()
+
     # ==================================================================================================================
 
     @property
@@ -814,6 +995,185 @@ class Grid:
             self._face_areas, self._face_jacobian = self.compute_face_areas()
         return self._face_jacobian
 
+    @property
+    def ragged(self) -> bool:
+        """Whether variable-length connectivity variables (i.e.
+        ``face_node_connectivity``) are stored in compressed sparse row (CSR)
+        format instead of being padded with fill values."""
+        return self._ragged
+
+    @property
+    def fingerprint(self) -> str:
+        """Content hash of the node coordinates (``node_lon``, ``node_lat``)
+        and ``face_node_connectivity``, which identifies the topology of this
+        grid independent of how its connectivity is stored.
+
+        Computed once with a streaming hash and cached.
+        """
+        return _grid_fingerprint(self)
+
+    @property
+    def connectivity_dtype(self) -> np.dtype:
+        """Integer data type used to store connectivity variables, whose fill
+        value is the minimum value of the data type."""
+        return self._connectivity_dtype
+
+    def _connectivity_populated(self, name):
+        """Whether a connectivity variable is stored, either padded or in CSR
+        format."""
+        return name in self._ds or name in self._ragged_connectivity
+
+    def _connectivity_shape(self, name):
+        """Shape of the padded representation of a stored connectivity
+        variable, without constructing it."""
+        if name in self._ragged_connectivity:
+            offsets, _ = self._csr_connectivity[name]
+            counts = np.diff(offsets)
+            return (counts.shape[0], int(counts.max(initial=0)))
+        return getattr(self, name).shape
+
+    def _get_padded_connectivity(self, name):
+        """Returns the padded representation of a stored connectivity
+        variable, which is constructed from its CSR representation (and not
+        cached) for ragged grids."""
+        if name not in self._ragged_connectivity:
+            return self._ds[name]
+
+        dims, attrs = self._ragged_connectivity[name]
+        padded, _ = _csr_to_padded(*self._csr_connectivity[name])
+
+        return xr.DataArray(data=padded, dims=dims, attrs=attrs)
+
+    def _padded_ds(self):
+        """Returns the internal dataset (``Grid._ds``), including the padded
+        representation of any connectivity variable that is only stored in
+        CSR format."""
+        if not self._ragged_connectivity:
+            return self._ds
+
+        ds = self._ds.copy()
+        for name in self._ragged_connectivity:
+            ds[name] = self._get_padded_connectivity(name)
+
+        return ds
+
+    def get_csr_connectivity(self, name: str):
+        """Get the compressed sparse row (CSR) representation of a
+        connectivity variable, which stores the non-fill-value entries of
+        each row without padding.
+
+        Parameters
+        ----------
+        name : str
+            Name of the connectivity variable (i.e. "node_face_connectivity")
+
+        Returns
+        -------
+        offsets : np.ndarray
+            Row offsets of shape (``n_rows + 1``), where the entries of row ``i`` are stored in
+            ``indices[offsets[i]:offsets[i + 1]]``
+        indices : np.ndarray
+            Flattened non-fill-value entries of the connectivity variable
+
+        Examples
+        --------
+        >>> offsets, indices = uxgrid.get_csr_connectivity("node_face_connectivity")
+        >>> faces_of_first_node = indices[offsets[0] : offsets[1]]
+        """
+        if name in self._csr_connectivity:
+            return self._csr_connectivity[name]
+
+        if not name.endswith("_connectivity") or not hasattr(self, name):
+            raise ValueError(f"Unknown connectivity variable: {name}")
+
+        # accessing the connectivity may populate its CSR representation directly
+        padded = getattr(self, name)
+
+        if name not in self._csr_connectivity:
+            if padded is None:
+                raise ValueError(f"Connectivity variable {name} is not supported.")
+            self._csr_connectivity[name] = _padded_to_csr(padded.values)
+
+        return self._csr_connectivity[name]
+
+    def _update_coordinates(self, coords):
+        """Replaces node coordinates of this grid and discards every quantity
+        that is derived from them (i.e. face centers, face areas, neighbor
+        trees, operators and the fingerprint), which are recomputed from the
+        new coordinates on their next access.
+
+        Modifying one representation of the node coordinates (spherical or
+        Cartesian) also discards the other one, which is reconstructed from
+        the modified one.
+
+        Parameters
+        ----------
+        coords : dict
+            New values of ``node_lon``, ``node_lat``, ``node_x``, ``node_y`` or ``node_z``, each of shape (``n_node``)
+        """
+        for name, value in coords.items():
+            if name not in ("node_lon", "node_lat", "node_x", "node_y", "node_z"):
+                raise ValueError(f"Unknown node coordinate: {name}")
+
+            value = np.asarray(value)
+            if value.shape != (self.n_node,):
+                raise ValueError(
+                    f"Expected {name} of shape {(self.n_node,)}, got {value.shape}"
+                )
+
+            attrs = self._ds[name].attrs if name in self._ds else {}
+            self._ds[name] = xr.DataArray(value, dims=["n_node"], attrs=attrs)
+
+        _invalidate_derived(self, coords)
+
+    def compute(self, names):
+        """Computes several derived quantities (i.e. connectivity variables,
+        coordinates or face areas) at once, along with every quantity they are
+        computed from, so that each one is constructed at most once and in
+        dependency order.
+
+        Parameters
+        ----------
+        names : str or list of str
+            Names of the quantities to compute (i.e. ["edge_face_connectivity", "face_areas"])
+
+        Returns
+        -------
+        self : Grid
+            This grid, with the requested quantities computed
+
+        Examples
+        --------
+        >>> uxgrid.compute(["edge_face_connectivity", "face_areas"])
+        """
+        if isinstance(names, str):
+            names = [names]
+
+        _compute_derived(self, names)
+
+        return self
+
+    def build_topology(self):
+        """Constructs ``n_nodes_per_face`` and the edge node, face edge, edge
+        face, node face and face face connectivity variables at once, in a
+        single pass over ``face_node_connectivity`` that shares intermediate
+        buffers, instead of individually constructing each one on access.
+
+        Variables that are already present are kept.
+
+        Returns
+        -------
+        self : Grid
+            This grid, with its topology constructed
+
+        Examples
+        --------
+        >>> uxgrid = ux.open_grid(grid_path).build_topology()
+        """
+        _populate_topology(self)
+
+        return self
+
     def get_ball_tree(
         self,
         coordinates: Optional[str] = "nodes",
@@ -843,23 +1203,13 @@ class Grid:
 
         Returns
         -------
-        self._ball_tree : grid.Neighbors.BallTree
-            BallTree instance
+        ball_tree : grid.Neighbors.BallTree
+            BallTree instance, which is cached for each combination of ``coordinates``, ``coordinate_system`` and
+            ``distance_metric`` (see ``Grid.tree_cache_info``)
         """
-
-        if self._ball_tree is None or reconstruct:
-            self._ball_tree = BallTree(
-                self,
-                coordinates=coordinates,
-                distance_metric=distance_metric,
-                coordinate_system=coordinate_system,
-                reconstruct=reconstruct,
-            )
-        else:
-            if coordinates != self._ball_tree._coordinates:
-                self._ball_tree.coordinates = coordinates
-
-        return self._ball_tree
+        return self._get_tree(
+            BallTree, coordinates, coordinate_system, distance_metric, reconstruct
+        )
 
     def get_kd_tree(
         self,
@@ -890,32 +1240,177 @@ class Grid:
 
         Returns
         -------
-        self._kd_tree : grid.Neighbors.KDTree
-            KDTree instance
+        kd_tree : grid.Neighbors.KDTree
+            KDTree instance, which is cached for each combination of ``coordinates``, ``coordinate_system`` and
+            ``distance_metric`` (see ``Grid.tree_cache_info``)
         """
+        return self._get_tree(
+            KDTree, coordinates, coordinate_system, distance_metric, reconstruct
+        )
 
-        if self._kd_tree is None or reconstruct:
-            self._kd_tree = KDTree(
-                self,
-                coordinates=coordinates,
-                distance_metric=distance_metric,
-                coordinate_system=coordinate_system,
-                reconstruct=reconstruct,
-            )
+    def get_spherical_index(
+        self,
+        coordinates: Optional[str] = "nodes",
+        reconstruct: bool = False,
+    ):
+        """Get the spherical index of this Grid that allows for fast nearest
+        neighbor queries (k nearest or within some radius) in great-circle
+        distance on either the (``node_lon``, ``node_lat``), (``edge_lon``,
+        ``edge_lat``) or (``face_lon``, ``face_lat``) coordinates.
+
+        Unlike the haversine ``BallTree``, the index is constructed from the
+        unit vectors of the elements and queries batches of points in
+        parallel, which makes it considerably faster for large queries.
+
+        Parameters
+        ----------
+        coordinates : str, default="nodes"
+            Selects which elements to index, with "nodes" selecting the Corner Nodes, "edge centers" selecting the Edge
+            Centers of each edge, and "face centers" selecting the Face Centers of each face
+        reconstruct : bool, default=False
+            If true, reconstructs the index
+
+        Returns
+        -------
+        spherical_index : grid.Neighbors.SphericalIndex
+            SphericalIndex instance, which is cached for each ``coordinates`` (see ``Grid.tree_cache_info``)
+        """
+        return self._get_tree(
+            SphericalIndex, coordinates, "spherical", "haversine", reconstruct
+        )
+
+    def locate_points(self, lon, lat):
+        """Locates the face that contains each of a set of points, as opposed
+        to the face with the closest center (which may not contain a point
+        near the boundary of an elongated face).
+
+        Candidate faces are searched with the spherical index of the face
+        centers (see ``Grid.get_spherical_index``) and tested for containing
+        each point on the sphere, assuming that faces are convex.
+
+        Parameters
+        ----------
+        lon : array_like
+            Longitudes of the points in degrees
+        lat : array_like
+            Latitudes of the points in degrees, which are broadcast against ``lon``
+
+        Returns
+        -------
+        faces : np.ndarray
+            Index of the face that contains each point, with the broadcast shape of ``lon`` and ``lat``, or -1 for
+            points outside of the grid (i.e. of a regional grid). Points on an edge or node shared by several faces are
+            located in the face with the closest center.
+
+        Examples
+        --------
+        >>> faces = uxgrid.locate_points([0.0, 45.0], [0.0, 30.0])
+        """
+        return _locate_points(self, lon, lat)
+
+    def _get_tree(
+        self, tree_type, coordinates, coordinate_system, distance_metric, reconstruct
+    ):
+        """Returns the cached tree of type ``tree_type`` (``BallTree``,
+        ``KDTree`` or ``SphericalIndex``) for a combination of element,
+        coordinate system and distance metric. On a cache miss, a
+        ``BallTree`` or ``KDTree`` is loaded from the on-disk grid cache if
+        enabled, or constructed (and written to it).
+
+        A cached tree whose ``coordinates`` were changed after it was cached
+        no longer matches its cache key, and is discarded and replaced."""
+        cache_key = (
+            tree_type.__name__,
+            coordinates,
+            coordinate_system,
+            distance_metric,
+        )
+
+        if cache_key in self._tree_cache and not reconstruct:
+            cached = self._tree_cache[cache_key]
+            if (
+                cached._coordinates,
+                cached.coordinate_system,
+                cached.distance_metric,
+            ) == cache_key[1:]:
+                self._tree_cache_hits += 1
+                self._tree_cache.move_to_end(cache_key)
+                return cached
+
+            del self._tree_cache[cache_key]
+
+        self._tree_cache_misses += 1
 
+        if tree_type is SphericalIndex:
+            # the spherical index is inexpensive to construct, so it is not written to the on-disk grid cache
+            tree = SphericalIndex(self, coordinates=coordinates)
         else:
-            if coordinates != self._kd_tree._coordinates:
-                self._kd_tree.coordinates = coordinates
+            # consult the on-disk grid cache before constructing the tree
+            tree = None
+            if not reconstruct:
+                tree = _load_cached_tree(
+                    self, tree_type, coordinates, coordinate_system, distance_metric
+                )
+
+            if tree is None:
+                tree = tree_type(
+                    self,
+                    coordinates=coordinates,
+                    distance_metric=distance_metric,
+                    coordinate_system=coordinate_system,
+                    reconstruct=reconstruct,
+                )
+                _store_cached_tree(self, tree)
+
+        self._tree_cache[cache_key] = tree
+        self._tree_cache.move_to_end(cache_key)
+        while len(self._tree_cache) > uxarray.constants.TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+
+        return tree
 
-        return self._kd_tree
+    def tree_cache_info(self) -> dict:
+        """Statistics of the cache of the trees returned by
+        ``Grid.get_ball_tree``, ``Grid.get_kd_tree`` and
+        ``Grid.get_spherical_index``.
+
+        Returns
+        -------
+        info : dict
+            The number of cache ``hits`` and ``misses`` (each miss constructing a tree), the number of cached trees
+            (``size``) and the maximum number of cached trees (``max_size``, see
+            ``uxarray.constants.TREE_CACHE_SIZE``)
+
+        Examples
+        --------
+        >>> uxgrid.get_ball_tree(coordinates="face centers")
+        >>> uxgrid.tree_cache_info()
+        {'hits': 0, 'misses': 1, 'size': 1, 'max_size': 8}
+        """
+        return {
+            "hits": self._tree_cache_hits,
+            "misses": self._tree_cache_misses,
+            "size": len(self._tree_cache),
+            "max_size": uxarray.constants.TREE_CACHE_SIZE,
+        }
+
+    def clear_tree_cache(self):
+        """Discards the trees constructed by ``Grid.get_ball_tree``,
+        ``Grid.get_kd_tree`` and ``Grid.get_spherical_index`` and resets the
+        statistics of their cache."""
+        self._tree_cache.clear()
+        self._tree_cache_hits = 0
+        self._tree_cache_misses = 0
 
     def copy(self):
         """Returns a deep copy of this grid."""
 
         return Grid(
-            self._ds,
+            self._padded_ds(),
             source_grid_spec=self.source_grid_spec,
             source_dims_dict=self._source_dims_dict,
+            ragged=self._ragged,
+            connectivity_dtype=self._connectivity_dtype,
         )
 
     def encode_as(self, grid_type: str) -> xr.Dataset:
@@ -940,10 +1435,10 @@ class Grid:
         """
 
         if grid_type == "UGRID":
-            out_ds = _encode_ugrid(self._ds)
+            out_ds = _encode_ugrid(self._padded_ds())
 
         elif grid_type == "Exodus":
-            out_ds = _encode_exodus(self._ds)
+            out_ds = _encode_exodus(self._padded_ds())
 
         elif grid_type == "SCRIP":
             out_ds = _encode_scrip(
@@ -958,7 +1453,10 @@ class Grid:
         return out_ds
 
     def calculate_total_face_area(
-        self, quadrature_rule: Optional[str] = "triangular", order: Optional[int] = 4
+        self,
+        quadrature_rule: Optional[str] = "triangular",
+        order: Optional[int] = 4,
+        method: Optional[str] = "quadrature",
     ) -> float:
         """Function to calculate the total surface area of all the faces in a
         mesh.
@@ -969,6 +1467,8 @@ class Grid:
             Quadrature rule to use. Defaults to "triangular".
         order : int, optional
             Order of quadrature rule. Defaults to 4.
+        method : str, optional
+            Either "quadrature" (default) or "exact", see ``Grid.compute_face_areas``
 
         Returns
         -------
@@ -976,7 +1476,9 @@ class Grid:
         """
 
         # call function to get area of all the faces as a np array
-        face_areas, face_jacobian = self.compute_face_areas(quadrature_rule, order)
+        face_areas, face_jacobian = self.compute_face_areas(
+            quadrature_rule, order, method=method
+        )
 
         return np.sum(face_areas)
 
@@ -985,6 +1487,7 @@ class Grid:
         quadrature_rule: Optional[str] = "triangular",
         order: Optional[int] = 4,
         latlon: Optional[bool] = True,
+        method: Optional[str] = "quadrature",
     ):
         """Face areas calculation function for grid class, calculates area of
         all faces in the grid.
@@ -995,6 +1498,14 @@ class Grid:
             Quadrature rule to use. Defaults to "triangular".
         order : int, optional
             Order of quadrature rule. Defaults to 4.
+        method : str, optional
+            Either "quadrature" (default), which integrates the Jacobian of each face using ``quadrature_rule``
+            and ``order``, or "exact", which computes the area of each face (whose edges are great circle arcs)
+            in closed form as its spherical excess. For the "exact" method, the Jacobian of each face is its area.
+
+        The result is kept in memory for each combination of parameters, so that repeated calls (i.e. when
+        integrating many variables) return the same arrays without recomputing them. See
+        ``Grid.clear_face_area_cache``.
 
         Returns
         -------
@@ -1012,19 +1523,33 @@ class Grid:
         array([0.00211174, 0.00211221, 0.00210723, ..., 0.00210723, 0.00211221,
             0.00211174])
         """
-        # if self._face_areas is None: # this allows for using the cached result,
-        # but is not the expected behavior behavior as we are in need to recompute if this function is called with different quadrature_rule or order
+        if method not in AREA_METHODS:
+            raise ValueError(
+                f"Unsupported area method: {method}. Expected one of {AREA_METHODS}"
+            )
+
+        coords_type = "spherical" if latlon else "cartesian"
+
+        if method == "exact":
+            cache_key = (method, coords_type)
+            cache_name = f"face_areas-exact-{coords_type}"
+        else:
+            cache_key = (method, quadrature_rule, order, coords_type)
+            cache_name = f"face_areas-{quadrature_rule}-{order}-{coords_type}"
+
+        if cache_key in self._face_area_cache:
+            self._face_area_cache.move_to_end(cache_key)
+            self._face_areas, self._face_jacobian = self._face_area_cache[cache_key]
+            return self._face_areas, self._face_jacobian
 
         if latlon:
             x = self.node_lon.data
             y = self.node_lat.data
             z = np.zeros((self.n_node))
-            coords_type = "spherical"
         else:
             x = self.node_x.data
             y = self.node_y.data
             z = self.node_z.data
-            coords_type = "cartesian"
 
         dim = 2
 
@@ -1036,21 +1561,32 @@ class Grid:
             for arr in (x, y, z)
         )
 
-        face_nodes = self.face_node_connectivity.values
-        n_nodes_per_face = self.n_nodes_per_face.values
+        cached = _load_cached(self, cache_name)
 
-        # call function to get area of all the faces as a np array
-        self._face_areas, self._face_jacobian = get_all_face_area_from_coords(
-            x,
-            y,
-            z,
-            face_nodes,
-            n_nodes_per_face,
-            dim,
-            quadrature_rule,
-            order,
-            coords_type,
-        )
+        if cached is not None:
+            self._face_areas = cached["face_areas"]
+            self._face_jacobian = cached["face_jacobian"]
+        elif method == "exact":
+            offsets, indices = self.get_csr_connectivity("face_node_connectivity")
+
+            self._face_areas = _get_all_face_area_exact_from_csr(
+                x, y, z, offsets, indices, coords_type
+            )
+            self._face_jacobian = self._face_areas
+        else:
+            offsets, indices = self.get_csr_connectivity("face_node_connectivity")
+
+            self._face_areas, self._face_jacobian = _get_all_face_area_from_csr(
+                x, y, z, offsets, indices, dim, quadrature_rule, order, coords_type
+            )
+
+        if cached is None:
+            _store_cached(
+                self,
+                cache_name,
+                face_areas=self._face_areas,
+                face_jacobian=self._face_jacobian,
+            )
 
         min_jacobian = np.min(self._face_jacobian)
         max_jacobian = np.max(self._face_jacobian)
@@ -1062,8 +1598,125 @@ class Grid:
                 )
             )
 
+        self._face_area_cache[cache_key] = (self._face_areas, self._face_jacobian)
+        while len(self._face_area_cache) > uxarray.constants.FACE_AREA_CACHE_SIZE:
+            self._face_area_cache.popitem(last=False)
+
         return self._face_areas, self._face_jacobian
 
+    def compute_node_areas(
+        self,
+        quadrature_rule: Optional[str] = "triangular",
+        order: Optional[int] = 4,
+        latlon: Optional[bool] = True,
+        method: Optional[str] = "quadrature",
+    ) -> np.ndarray:
+        """Computes the area of the dual (control) cell around each node,
+        which is used to integrate node-centered data.
+
+        The area of each face is split equally among its nodes, so the dual
+        cells partition the surface covered by the faces (which is exact for
+        triangles and regular polygons).
+
+        Parameters
+        ----------
+        quadrature_rule, order, latlon, method
+            Parameters used to compute the face areas, see ``Grid.compute_face_areas``
+
+        Returns
+        -------
+        node_areas : np.ndarray
+            Area of the dual cell around each node
+        """
+        return self._compute_control_areas(
+            "n_node", quadrature_rule, order, latlon, method
+        )
+
+    def compute_edge_areas(
+        self,
+        quadrature_rule: Optional[str] = "triangular",
+        order: Optional[int] = 4,
+        latlon: Optional[bool] = True,
+        method: Optional[str] = "quadrature",
+    ) -> np.ndarray:
+        """Computes the area of the dual (kite or diamond-shaped) cell around
+        each edge, formed by its nodes and the centers of the faces on either
+        side, which is used to integrate edge-centered data.
+
+        The kite is made of the spherical triangles formed by each edge and
+        the centers of its faces, which are scaled such that the triangles of
+        each face sum to its area, so the dual cells partition the surface
+        covered by the faces.
+
+        Parameters
+        ----------
+        quadrature_rule, order, latlon, method
+            Parameters used to compute the face areas, see ``Grid.compute_face_areas``
+
+        Returns
+        -------
+        edge_areas : np.ndarray
+            Area of the dual cell around each edge
+        """
+        return self._compute_control_areas(
+            "n_edge", quadrature_rule, order, latlon, method
+        )
+
+    def _compute_control_areas(self, dim, quadrature_rule, order, latlon, method):
+        """Computes the area of the dual cell around each element of ``dim``
+        ("n_node" or "n_edge"), which is kept in the face area cache."""
+        coords_type = "spherical" if latlon else "cartesian"
+
+        if method == "exact":
+            cache_key = (dim, method, coords_type)
+        else:
+            cache_key = (dim, method, quadrature_rule, order, coords_type)
+
+        if cache_key in self._face_area_cache:
+            self._face_area_cache.move_to_end(cache_key)
+            return self._face_area_cache[cache_key]
+
+        face_areas, _ = self.compute_face_areas(
+            quadrature_rule, order, latlon=latlon, method=method
+        )
+
+        if dim == "n_node":
+            control_areas = _get_control_areas(
+                face_areas,
+                *self.get_csr_connectivity("face_node_connectivity"),
+                self.n_node,
+            )
+        else:
+            control_areas = _get_kite_areas(
+                face_areas,
+                (self.face_x.values, self.face_y.values, self.face_z.values),
+                (self.node_x.values, self.node_y.values, self.node_z.values),
+                *self.get_csr_connectivity("face_edge_connectivity"),
+                self.edge_node_connectivity.values,
+            )
+
+        self._face_area_cache[cache_key] = control_areas
+        while len(self._face_area_cache) > uxarray.constants.FACE_AREA_CACHE_SIZE:
+            self._face_area_cache.popitem(last=False)
+
+        return control_areas
+
+    def clear_face_area_cache(self):
+        """Discards the face areas and jacobians computed by
+        ``Grid.compute_face_areas`` and the node and edge areas derived from
+        them, which are otherwise kept in memory for each combination of
+        parameters (up to ``uxarray.constants.FACE_AREA_CACHE_SIZE``
+        combinations).
+
+        Examples
+        --------
+        >>> uxgrid.compute_face_areas(quadrature_rule="gaussian", order=5)
+        >>> uxgrid.clear_face_area_cache()
+        """
+        self._face_area_cache.clear()
+        self._face_areas = None
+        self._face_jacobian = None
+
     def to_geodataframe(
         self,
         override: Optional[bool] = False,
@@ -1184,6 +1837,63 @@ class Grid:
 
         return line_collection
 
+    def reorder(self, method: Optional[str] = "hilbert"):
+        """Reorders the faces, nodes and edges of this grid in place, such
+        that elements that are close to each other are stored close to each
+        other, which improves the memory locality of operations that gather
+        the nodes or neighbors of each face.
+
+        Faces are ordered along a space-filling curve through their centroids ("hilbert" or "morton") or by the
+        reverse Cuthill-McKee ordering of the face adjacency graph ("rcm"). Nodes and edges are then ordered by their
+        first appearance in the reordered faces. All connectivity variables are updated to the new indices.
+
+        Parameters
+        ----------
+        method : str, default="hilbert"
+            Reordering method, one of "hilbert", "morton" or "rcm"
+
+        Returns
+        -------
+        permutation : dict
+            Mapping of each reordered dimension (``n_face``, ``n_node`` and, if edges are present, ``n_edge``) to the
+            original index of each element, which can be used to permute data variables consistently
+            (``uxda.isel(n_face=permutation["n_face"])``) or to restore the original order
+            (``np.argsort(permutation["n_face"])``)
+
+        Examples
+        --------
+        >>> permutation = uxgrid.reorder("hilbert")
+        >>> face_data = face_data.isel(n_face=permutation["n_face"])
+        """
+        return _reorder_grid(self, method)
+
+    def partition(self, n_parts: int, method: Optional[str] = "rcb"):
+        """Partitions the faces of this grid into spatially contiguous parts
+        of (nearly) equal size, which can be processed independently.
+
+        Parameters
+        ----------
+        n_parts : int
+            Number of parts
+        method : str, default="rcb"
+            Partitioning method, either "rcb" for recursive coordinate bisection of the face centroids, or "hilbert"
+            for splitting the faces into consecutive ranges along a Hilbert curve through their centroids
+
+        Returns
+        -------
+        parts : list of np.ndarray
+            Sorted face indices of each part
+        halos : list of np.ndarray
+            Sorted indices of the faces outside each part that share at least one node with it, which are required
+            for operations that gather neighboring faces (i.e. gradients)
+
+        Examples
+        --------
+        >>> parts, halos = uxgrid.partition(8)
+        >>> subgrid = uxgrid.isel(n_face=np.concatenate([parts[0], halos[0]]))
+        """
+        return _partition_grid(self, n_parts, method)
+
     def isel(self, **dim_kwargs):
         """Indexes an unstructured grid along a given dimension (``n_node``,
         ``n_edge``, or ``n_face``) and returns a new grid.
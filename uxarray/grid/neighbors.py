@@ -1,16 +1,27 @@
+import json
+import os
+import shutil
+import tempfile
+
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from numpy import deg2rad
 
 import xarray as xr
 
-from numba import njit
+from numba import njit, prange
 
+import sklearn
 from sklearn.neighbors import BallTree as SKBallTree
 from sklearn.neighbors import KDTree as SKKDTree
+from sklearn.metrics import DistanceMetric
 
 from typing import Optional, Union
 
-from uxarray.constants import INT_DTYPE, INT_FILL_VALUE
+from uxarray.constants import INT_DTYPE, ENABLE_JIT_CACHE, ERROR_TOLERANCE
+from uxarray.grid.cache import _tree_coordinates_hash
+from uxarray.grid.coordinates import _lonlat_rad_to_xyz
 
 
 class KDTree:
@@ -211,6 +222,11 @@ class KDTree:
         dualtree: Optional[bool] = False,
         breadth_first: Optional[bool] = False,
         sort_results: Optional[bool] = True,
+        chunk_size: Optional[int] = None,
+        n_workers: Optional[int] = None,
+        out: Optional[Union[np.ndarray, tuple]] = None,
+        index_dtype=INT_DTYPE,
+        distance_dtype=np.float64,
     ):
         """Queries the tree for the ``k`` nearest neighbors.
 
@@ -230,12 +246,25 @@ class KDTree:
             Indicates whether to query nodes in a breadth-first manner
         sort_results : bool, default=True
             Indicates whether distances should be sorted
+        chunk_size : int, optional
+            Number of points queried at once, which bounds the memory used by the query besides its output. Defaults
+            to querying all points at once
+        n_workers : int, optional
+            Number of threads used to query chunks of points concurrently. Defaults to querying one chunk at a time
+        out : ndarray or tuple of ndarray, optional
+            Preallocated (or memory-mapped) arrays of shape (coords.shape[0], k) that the distances and indices (or
+            only the indices if ``return_distance`` is False) are written to, in which case they are returned as is
+            and ``index_dtype`` and ``distance_dtype`` are ignored
+        index_dtype : dtype, default=INT_DTYPE
+            Data type of the returned indices (i.e. np.int32 to halve their memory footprint)
+        distance_dtype : dtype, default=np.float64
+            Data type of the returned distances (i.e. np.float32 to halve their memory footprint)
 
         Returns
         -------
-        d : ndarray of shape (xyz.shape[0], k), dtype=double
+        d : ndarray of shape (xyz.shape[0], k), dtype=distance_dtype
             Distance array that keeps the distances of the k-nearest neighbors to the entries from xyz in each row
-        ind : ndarray of shape (xyz.shape[0], k), dtype=INT_DTYPE
+        ind : ndarray of shape (xyz.shape[0], k), dtype=index_dtype
             Index array that keeps the indices of the k-nearest neighbors to the entries from xyz in each row
         """
 
@@ -244,49 +273,25 @@ class KDTree:
                 f"The value of k must be greater than 1 and less than the number of elements used to construct "
                 f"the tree ({self._n_elements})."
             )
-        if self.coordinate_system == "cartesian":
-            coords = _prepare_xyz_for_query(coords)
-        elif self.coordinate_system == "spherical":
-            coords = _prepare_xy_for_query(
-                coords, in_radians, distance_metric=self.distance_metric
-            )
-        else:
+        if self.coordinate_system not in ("cartesian", "spherical"):
             raise ValueError(
                 f"Unknown coordinate_system, {self.coordinate_system}, use either 'cartesian' or "
                 f"'spherical'"
             )
 
-        # perform query with distance
-        if return_distance:
-            d, ind = self._current_tree().query(
-                coords, k, return_distance, dualtree, breadth_first, sort_results
-            )
-
-            ind = np.asarray(ind, dtype=INT_DTYPE)
-
-            if coords.shape[0] == 1:
-                ind = ind.squeeze()
-
-            # only one pair was queried
-            if coords.shape[0] == 1:
-                d = d.squeeze()
-
-            if not in_radians and self.coordinate_system == "spherical":
-                d = np.rad2deg(d)
-
-            return d, ind
-
-        # perform query without distance
-        else:
-            ind = self._current_tree().query(
-                coords, k, return_distance, dualtree, breadth_first, sort_results
-            )
-
-            ind = np.asarray(ind, dtype=INT_DTYPE)
-
-            if coords.shape[0] == 1:
-                ind = ind.squeeze()
-        return ind
+        return _query_in_chunks(
+            self,
+            coords,
+            k,
+            in_radians,
+            return_distance,
+            (dualtree, breadth_first, sort_results),
+            chunk_size,
+            n_workers,
+            out,
+            index_dtype,
+            distance_dtype,
+        )
 
     def query_radius(
         self,
@@ -402,6 +407,45 @@ class KDTree:
                 f"or 'edge centers'"
             )
 
+    def save(self, path):
+        """Saves the tree constructed for the current ``coordinates`` to a
+        directory, which can be loaded (and memory-mapped) by ``KDTree.load``
+        in any process working with the same grid.
+
+        Parameters
+        ----------
+        path : str
+            Directory to write the tree to, which is replaced if it exists
+        """
+        _save_tree(self, path)
+
+    @classmethod
+    def load(cls, grid, path, mmap_mode: Optional[str] = "r"):
+        """Loads a tree written by ``KDTree.save`` without reconstructing it.
+
+        Parameters
+        ----------
+        grid : ux.Grid
+            Grid the tree was constructed from
+        path : str
+            Directory the tree was written to
+        mmap_mode : str, default="r"
+            Memory-maps the arrays of the tree with this mode (see ``numpy.load``), allowing them to be shared between
+            processes, or loads them into memory if None
+
+        Returns
+        -------
+        tree : KDTree
+            Tree on the same ``coordinates``, ``coordinate_system`` and ``distance_metric`` as the saved one
+
+        Raises
+        ------
+        ValueError
+            If the tree was not saved by a KDTree, was constructed from a different grid, or was saved by a different
+            version of scikit-learn
+        """
+        return _load_tree(cls, grid, path, mmap_mode)
+
 
 class BallTree:
     """Custom BallTree data structure written around the
@@ -593,6 +637,11 @@ class BallTree:
         dualtree: Optional[bool] = False,
         breadth_first: Optional[bool] = False,
         sort_results: Optional[bool] = True,
+        chunk_size: Optional[int] = None,
+        n_workers: Optional[int] = None,
+        out: Optional[Union[np.ndarray, tuple]] = None,
+        index_dtype=INT_DTYPE,
+        distance_dtype=np.float64,
     ):
         """Queries the tree for the ``k`` nearest neighbors.
 
@@ -612,12 +661,25 @@ class BallTree:
             Indicates whether to query nodes in a breadth-first manner
         sort_results : bool, default=True
             Indicates whether distances should be sorted
+        chunk_size : int, optional
+            Number of points queried at once, which bounds the memory used by the query besides its output. Defaults
+            to querying all points at once
+        n_workers : int, optional
+            Number of threads used to query chunks of points concurrently. Defaults to querying one chunk at a time
+        out : ndarray or tuple of ndarray, optional
+            Preallocated (or memory-mapped) arrays of shape (coords.shape[0], k) that the distances and indices (or
+            only the indices if ``return_distance`` is False) are written to, in which case they are returned as is
+            and ``index_dtype`` and ``distance_dtype`` are ignored
+        index_dtype : dtype, default=INT_DTYPE
+            Data type of the returned indices (i.e. np.int32 to halve their memory footprint)
+        distance_dtype : dtype, default=np.float64
+            Data type of the returned distances (i.e. np.float32 to halve their memory footprint)
 
         Returns
         -------
-        d : ndarray of shape (coords.shape[0], k), dtype=double
+        d : ndarray of shape (coords.shape[0], k), dtype=distance_dtype
             Distance array that keeps the distances of the k-nearest neighbors to the entries from coords in each row
-        ind : ndarray of shape (coords.shape[0], k), dtype=INT_DTYPE
+        ind : ndarray of shape (coords.shape[0], k), dtype=index_dtype
             Index array that keeps the indices of the k-nearest neighbors to the entries from coords in each row
         """
 
@@ -627,47 +689,19 @@ class BallTree:
                 f"the tree ({self._n_elements})."
             )
 
-        # Use the correct function to prepare for query based on coordinate type
-        if self.coordinate_system == "spherical":
-            coords = _prepare_xy_for_query(
-                coords, in_radians, distance_metric=self.distance_metric
-            )
-
-        elif self.coordinate_system == "cartesian":
-            coords = _prepare_xyz_for_query(coords)
-
-        # perform query with distance
-        if return_distance:
-            d, ind = self._current_tree().query(
-                coords, k, return_distance, dualtree, breadth_first, sort_results
-            )
-
-            ind = np.asarray(ind, dtype=INT_DTYPE)
-
-            if coords.shape[0] == 1:
-                ind = ind.squeeze()
-
-            # only one pair was queried
-            if coords.shape[0] == 1:
-                d = d.squeeze()
-
-            if not in_radians and self.coordinate_system == "spherical":
-                d = np.rad2deg(d)
-
-            return d, ind
-
-        # perform query without distance
-        else:
-            ind = self._current_tree().query(
-                coords, k, return_distance, dualtree, breadth_first, sort_results
-            )
-
-            ind = np.asarray(ind, dtype=INT_DTYPE)
-
-            if coords.shape[0] == 1:
-                ind = ind.squeeze()
-
-            return ind
+        return _query_in_chunks(
+            self,
+            coords,
+            k,
+            in_radians,
+            return_distance,
+            (dualtree, breadth_first, sort_results),
+            chunk_size,
+            n_workers,
+            out,
+            index_dtype,
+            distance_dtype,
+        )
 
     def query_radius(
         self,
@@ -780,6 +814,1165 @@ class BallTree:
                 f"or 'edge centers'"
             )
 
+    def save(self, path):
+        """Saves the tree constructed for the current ``coordinates`` to a
+        directory, which can be loaded (and memory-mapped) by ``BallTree.load``
+        in any process working with the same grid.
+
+        Parameters
+        ----------
+        path : str
+            Directory to write the tree to, which is replaced if it exists
+        """
+        _save_tree(self, path)
+
+    @classmethod
+    def load(cls, grid, path, mmap_mode: Optional[str] = "r"):
+        """Loads a tree written by ``BallTree.save`` without reconstructing it.
+
+        Parameters
+        ----------
+        grid : ux.Grid
+            Grid the tree was constructed from
+        path : str
+            Directory the tree was written to
+        mmap_mode : str, default="r"
+            Memory-maps the arrays of the tree with this mode (see ``numpy.load``), allowing them to be shared between
+            processes, or loads them into memory if None
+
+        Returns
+        -------
+        tree : BallTree
+            Tree on the same ``coordinates``, ``coordinate_system`` and ``distance_metric`` as the saved one
+
+        Raises
+        ------
+        ValueError
+            If the tree was not saved by a BallTree, was constructed from a different grid, or was saved by a different
+            version of scikit-learn
+        """
+        return _load_tree(cls, grid, path, mmap_mode)
+
+
+class SphericalIndex:
+    """Spatial index on the unit sphere for nearest neighbor queries (k
+    nearest or within some radius) on either the corner nodes (``node_lon``,
+    ``node_lat``), edge centers (``edge_lon``, ``edge_lat``) or face centers
+    (``face_lon``, ``face_lat``) of the inputted unstructured grid.
+
+    The index is a quadtree on each of the six faces of the cube enclosing
+    the sphere, built on an equiangular grid of buckets that are numbered
+    along a Z-order curve, so that the elements of each quadtree cell are
+    stored contiguously. Each cell is bounded by a spherical cap, which
+    allows queries to skip the cells that cannot contain a neighbor.
+    Distances are great-circle distances, computed from the unit vectors of
+    the elements, and batches of points are queried in parallel.
+
+    Parameters
+    ----------
+    grid : ux.Grid
+        Source grid used to construct the index
+    coordinates : str, default="nodes"
+        Identifies which elements to index, with "nodes" selecting the corner nodes, "face centers" selecting the face
+        centers of each face, and "edge centers" selecting the centers of each edge of a face
+    leaf_size : int, default=16
+        Number of elements below which the elements of a cell are searched directly
+
+    Examples
+    --------
+    >>> index = uxgrid.get_spherical_index(coordinates="face centers")
+    >>> d, ind = index.query([[0.0, 0.0], [45.0, 30.0]], k=3)
+    """
+
+    # the index uses spherical coordinates and great-circle distances
+    coordinate_system = "spherical"
+    distance_metric = "haversine"
+
+    def __init__(
+        self,
+        grid,
+        coordinates: Optional[str] = "nodes",
+        leaf_size: Optional[int] = 16,
+    ):
+        self._source_grid = grid
+        self._coordinates = coordinates
+
+        if coordinates == "nodes":
+            lon, lat = grid.node_lon.values, grid.node_lat.values
+        elif coordinates == "face centers":
+            lon, lat = grid.face_lon.values, grid.face_lat.values
+        elif coordinates == "edge centers":
+            lon, lat = grid.edge_lon.values, grid.edge_lat.values
+        else:
+            raise ValueError(
+                f"Unknown coordinates location, {coordinates}, use either 'nodes', 'face centers', "
+                f"or 'edge centers'"
+            )
+
+        if leaf_size < 1:
+            raise ValueError(f"leaf_size must be at least 1, got {leaf_size}")
+
+        self._n_elements = lon.shape[0]
+        self._leaf_size = leaf_size
+
+        xyz = np.stack(_lonlat_rad_to_xyz(np.deg2rad(lon), np.deg2rad(lat)), axis=-1)
+
+        # depth of the quadtrees, with about leaf_size elements per bucket if the elements cover the whole sphere
+        self._depth = _quadtree_depth(self._n_elements / (6 * leaf_size))
+        buckets = _cube_buckets(xyz, self._depth)
+
+        # deepen the quadtrees of elements that only cover part of the sphere (i.e. regional grids), keeping the
+        # number of buckets below the number of elements
+        max_depth = _quadtree_depth(self._n_elements / 6)
+        while self._depth < max_depth:
+            n_occupied = np.count_nonzero(np.bincount(buckets))
+            if n_occupied * leaf_size >= self._n_elements:
+                break
+
+            self._depth = min(
+                self._depth
+                + _quadtree_depth(self._n_elements / (leaf_size * n_occupied)),
+                max_depth,
+            )
+            buckets = _cube_buckets(xyz, self._depth)
+
+        # elements sorted by bucket, with the elements of each quadtree cell stored contiguously
+        self._order = np.argsort(buckets, kind="stable").astype(INT_DTYPE)
+        self._xyz = np.ascontiguousarray(xyz[self._order])
+        self._bucket_offsets = np.zeros(6 * 4**self._depth + 1, dtype=INT_DTYPE)
+        np.cumsum(
+            np.bincount(buckets, minlength=6 * 4**self._depth),
+            out=self._bucket_offsets[1:],
+        )
+
+        self._bounds = _quadtree_bounds(self._xyz, self._bucket_offsets, self._depth)
+
+    @property
+    def coordinates(self):
+        return self._coordinates
+
+    def _prepare_query(self, coords, in_radians):
+        """Unit vectors of (lon, lat) query points."""
+        coords = _prepare_xy_for_query(coords, True, distance_metric=None)
+
+        if not in_radians:
+            coords = np.deg2rad(coords)
+
+        return np.stack(_lonlat_rad_to_xyz(coords[:, 0], coords[:, 1]), axis=-1)
+
+    def query(
+        self,
+        coords: Union[np.ndarray, list, tuple],
+        k: Optional[int] = 1,
+        return_distance: Optional[bool] = True,
+        in_radians: Optional[bool] = False,
+    ):
+        """Queries the index for the ``k`` nearest neighbors.
+
+        Parameters
+        ----------
+        coords : array_like
+            coordinate pairs in degrees (lon, lat) to query
+        k: int, default=1
+            The number of nearest neighbors to return
+        return_distance : bool, optional
+            Indicates whether distances should be returned
+        in_radians : bool, optional
+            if True, queries assuming coords are inputted in radians, not degrees, and returns distances in radians
+
+        Returns
+        -------
+        d : ndarray of shape (coords.shape[0], k), dtype=double
+            Great-circle distances of the k-nearest neighbors to the entries from coords in each row, sorted in
+            ascending order
+        ind : ndarray of shape (coords.shape[0], k), dtype=INT_DTYPE
+            Indices of the k-nearest neighbors to the entries from coords in each row
+        """
+        if k < 1 or k > self._n_elements:
+            raise AssertionError(
+                f"The value of k must be greater than 1 and less than the number of elements used to construct "
+                f"the tree ({self._n_elements})."
+            )
+
+        xyz = self._prepare_query(coords, in_radians)
+
+        d, ind = _spherical_index_query(
+            xyz,
+            k,
+            self._xyz,
+            self._bucket_offsets,
+            self._bounds,
+            self._depth,
+            self._leaf_size,
+        )
+        ind = self._order[ind]
+
+        if xyz.shape[0] == 1:
+            ind = ind.squeeze()
+            d = d.squeeze()
+
+        if not return_distance:
+            return ind
+
+        if not in_radians:
+            d = np.rad2deg(d)
+
+        return d, ind
+
+    def query_radius(
+        self,
+        coords: Union[np.ndarray, list, tuple],
+        r: Optional[float] = 1.0,
+        return_distance: Optional[bool] = False,
+        in_radians: Optional[bool] = False,
+        count_only: Optional[bool] = False,
+        sort_results: Optional[bool] = False,
+    ):
+        """Queries the index for all neighbors within a radius ``r``.
+
+        Parameters
+        ----------
+        coords : array_like
+           coordinate pairs in degrees (lon, lat) to query
+        r: float, default=1.0
+            Great-circle distance (in degrees, or radians if ``in_radians``) within which neighbors are returned
+        return_distance : bool, default=False
+            Indicates whether distances should be returned
+        in_radians : bool, optional
+            if True, queries assuming coords and r are inputted in radians, not degrees, and returns distances in
+            radians
+        count_only : bool, default=False
+            Indicates whether only counts should be returned
+        sort_results : bool, default=False
+            Indicates whether the neighbors of each point should be sorted by distance
+
+        Returns
+        -------
+        d : list of ndarray
+            Great-circle distances of all neighbors within some radius to each entry from coords
+        ind : list of ndarray, dtype=INT_DTYPE
+            Indices of all neighbors within some radius to each entry from coords
+        """
+        if r < 0.0:
+            raise AssertionError(
+                "The value of r must be greater than or equal to zero."
+            )
+
+        xyz = self._prepare_query(coords, in_radians)
+        if not in_radians:
+            r = np.deg2rad(r)
+
+        offsets, ind, d = _spherical_index_query_radius(
+            xyz,
+            r,
+            self._xyz,
+            self._bucket_offsets,
+            self._bounds,
+            self._depth,
+            self._leaf_size,
+            count_only,
+            sort_results,
+        )
+
+        if count_only:
+            return np.diff(offsets)
+
+        ind = np.split(self._order[ind], offsets[1:-1])
+        d = np.split(d if in_radians else np.rad2deg(d), offsets[1:-1])
+
+        if xyz.shape[0] == 1:
+            ind = ind[0]
+            d = d[0]
+
+        if return_distance:
+            return d, ind
+
+        return ind
+
+
+def _quadtree_depth(n_buckets):
+    """Smallest depth of a quadtree with at least ``n_buckets`` leaves."""
+    return max(0, int(np.ceil(np.log2(max(n_buckets, 1.0)) / 2)))
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _cube_buckets(xyz, depth):
+    """Bucket of each unit vector on the equiangular grids of ``2**depth``
+    by ``2**depth`` buckets on the faces of the cube, numbered along a
+    Z-order curve on each face."""
+    buckets = np.empty(xyz.shape[0], dtype=np.int64)
+
+    for p in prange(xyz.shape[0]):
+        buckets[p] = _point_bucket(xyz[p, 0], xyz[p, 1], xyz[p, 2], depth)
+
+    return buckets
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _point_bucket(x, y, z, depth):
+    """Bucket of a unit vector, see ``_cube_buckets``."""
+    # major axis of the vector, which selects the face of the cube
+    if abs(x) >= abs(y) and abs(x) >= abs(z):
+        face, pm, pa, pb = 0, x, y, z
+    elif abs(y) >= abs(z):
+        face, pm, pa, pb = 1, y, z, x
+    else:
+        face, pm, pa, pb = 2, z, x, y
+
+    if pm < 0:
+        face += 3
+        pm = -pm
+
+    # position on the equiangular grid of the face
+    n_side = 1 << depth
+    i = min(max(int((np.arctan2(pa, pm) / (np.pi / 2) + 0.5) * n_side), 0), n_side - 1)
+    j = min(max(int((np.arctan2(pb, pm) / (np.pi / 2) + 0.5) * n_side), 0), n_side - 1)
+
+    # interleave the bits of the position
+    bucket = 0
+    for bit in range(depth):
+        bucket |= ((i >> bit) & 1) << (2 * bit + 1)
+        bucket |= ((j >> bit) & 1) << (2 * bit)
+
+    return (face << (2 * depth)) | bucket
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _cell_start(level):
+    """Index of the first cell of a level of the quadtrees, with the cells of
+    all levels numbered consecutively from the six root cells."""
+    return 2 * ((1 << (2 * level)) - 1)
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _quadtree_bounds(points, bucket_offsets, depth):
+    """Bounding cap of the points (sorted by bucket) of each cell of the
+    quadtrees, as the unit vector of its center followed by the cosine and
+    sine of its angular radius.
+
+    The cell ``c`` of a level contains the buckets ``[c * 4**(depth - level),
+    (c + 1) * 4**(depth - level))``, whose points are stored contiguously.
+    """
+    bounds = np.zeros((_cell_start(depth + 1), 5), dtype=np.float64)
+
+    for level in range(depth + 1):
+        shift = 2 * (depth - level)
+        for cell in prange(6 << (2 * level)):
+            start = bucket_offsets[cell << shift]
+            stop = bucket_offsets[(cell + 1) << shift]
+            node = _cell_start(level) + cell
+
+            if start == stop:
+                bounds[node, 3] = 1.0
+                continue
+
+            cx, cy, cz = 0.0, 0.0, 0.0
+            for p in range(start, stop):
+                cx += points[p, 0]
+                cy += points[p, 1]
+                cz += points[p, 2]
+
+            norm = np.sqrt(cx * cx + cy * cy + cz * cz)
+            if norm == 0.0:
+                cx, cy, cz = points[start, 0], points[start, 1], points[start, 2]
+            else:
+                cx, cy, cz = cx / norm, cy / norm, cz / norm
+
+            cos_r = 1.0
+            for p in range(start, stop):
+                cos_r = min(
+                    cos_r, cx * points[p, 0] + cy * points[p, 1] + cz * points[p, 2]
+                )
+            cos_r = max(cos_r, -1.0)
+
+            bounds[node, 0] = cx
+            bounds[node, 1] = cy
+            bounds[node, 2] = cz
+            bounds[node, 3] = cos_r
+            bounds[node, 4] = np.sqrt(1.0 - cos_r * cos_r)
+
+    return bounds
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _cell_within(qx, qy, qz, node, bounds, cos_theta, sin_theta):
+    """Whether the bounding cap of a cell intersects the cap with angular
+    radius ``theta`` around a unit vector, given the cosine and sine of
+    ``theta``."""
+    cos_r, sin_r = bounds[node, 3], bounds[node, 4]
+
+    # the caps always intersect if their radii add up to at least pi
+    if cos_r <= -cos_theta:
+        return True
+
+    dot = qx * bounds[node, 0] + qy * bounds[node, 1] + qz * bounds[node, 2]
+
+    # the angle between the centers is at most the sum of the radii, with some slack for rounding
+    return dot >= cos_theta * cos_r - sin_theta * sin_r - 1e-12
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _chord_squared(theta):
+    """Squared chord length of a great-circle distance ``theta``."""
+    if theta >= np.pi:
+        return 4.0
+
+    return (2 * np.sin(theta / 2)) ** 2
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _push_children(qx, qy, qz, level, cell, bounds, stack_level, stack_cell, top):
+    """Pushes the four children of a cell onto a stack, ordered such that
+    the child whose center is closest to a unit vector is popped first."""
+    start = _cell_start(level + 1)
+
+    for c in range(4):
+        child = 4 * cell + c
+        node = start + child
+        dot = qx * bounds[node, 0] + qy * bounds[node, 1] + qz * bounds[node, 2]
+
+        # insert into the children on top of the stack, sorted by ascending dot product
+        m = top + c
+        while m > top:
+            other = start + stack_cell[m - 1]
+            if (
+                qx * bounds[other, 0] + qy * bounds[other, 1] + qz * bounds[other, 2]
+                <= dot
+            ):
+                break
+            stack_cell[m] = stack_cell[m - 1]
+            m -= 1
+
+        stack_level[top + c] = level + 1
+        stack_cell[m] = child
+
+    return top + 4
+
+
+# number of query points that share the buffers of a k nearest neighbors search
+QUERY_CHUNK_SIZE = 1024
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _spherical_index_query(xyz, k, points, bucket_offsets, bounds, depth, leaf_size):
+    """Queries the ``k`` nearest points (sorted by bucket) to each unit
+    vector of ``xyz``, in parallel over chunks of query points.
+
+    The quadtrees are searched depth first, visiting the children of each
+    cell from the closest to the farthest, and skipping the cells that
+    cannot contain a point closer than the k-th nearest point found so far.
+    """
+    n_query = xyz.shape[0]
+
+    distances = np.empty((n_query, k), dtype=np.float64)
+    indices = np.empty((n_query, k), dtype=np.int64)
+
+    n_chunks = (n_query + QUERY_CHUNK_SIZE - 1) // QUERY_CHUNK_SIZE
+    for chunk in prange(n_chunks):
+        best_d2 = np.empty(k, dtype=np.float64)
+        best = np.empty(k, dtype=np.int64)
+
+        stack_level = np.empty(6 + 3 * depth, dtype=np.int64)
+        stack_cell = np.empty(6 + 3 * depth, dtype=np.int64)
+
+        for q in range(
+            chunk * QUERY_CHUNK_SIZE, min((chunk + 1) * QUERY_CHUNK_SIZE, n_query)
+        ):
+            _knn_search(
+                xyz[q, 0],
+                xyz[q, 1],
+                xyz[q, 2],
+                points,
+                bucket_offsets,
+                bounds,
+                depth,
+                leaf_size,
+                best_d2,
+                best,
+                stack_level,
+                stack_cell,
+            )
+
+            for m in range(k):
+                distances[q, m] = 2 * np.arcsin(min(np.sqrt(best_d2[m]) / 2, 1.0))
+                indices[q, m] = best[m]
+
+    return distances, indices
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _knn_search(
+    qx,
+    qy,
+    qz,
+    points,
+    bucket_offsets,
+    bounds,
+    depth,
+    leaf_size,
+    best_d2,
+    best,
+    stack_level,
+    stack_cell,
+):
+    """Searches the nearest points to a unit vector, writing their squared
+    chord distances and indices in ascending order of distance to
+    ``best_d2`` and ``best``, whose length is the number of neighbors."""
+    k = best.shape[0]
+    best_d2[:] = np.inf
+    best[:] = -1
+
+    # push the roots, with the closest one on top
+    for face in range(6):
+        dot = qx * bounds[face, 0] + qy * bounds[face, 1] + qz * bounds[face, 2]
+
+        m = face
+        while m > 0:
+            other = stack_cell[m - 1]
+            if (
+                qx * bounds[other, 0] + qy * bounds[other, 1] + qz * bounds[other, 2]
+                <= dot
+            ):
+                break
+            stack_cell[m] = stack_cell[m - 1]
+            m -= 1
+
+        stack_level[face] = 0
+        stack_cell[m] = face
+    top = 6
+
+    while top > 0:
+        top -= 1
+        level, cell = stack_level[top], stack_cell[top]
+
+        shift = 2 * (depth - level)
+        start = bucket_offsets[cell << shift]
+        stop = bucket_offsets[(cell + 1) << shift]
+        if start == stop:
+            continue
+
+        # angular distance of the k-th nearest point found so far
+        if best[k - 1] >= 0:
+            cos_best = 1.0 - best_d2[k - 1] / 2
+            sin_best = np.sqrt(max(1.0 - cos_best * cos_best, 0.0))
+        else:
+            cos_best, sin_best = -1.0, 0.0
+
+        if not _cell_within(
+            qx, qy, qz, _cell_start(level) + cell, bounds, cos_best, sin_best
+        ):
+            continue
+
+        if level < depth and stop - start > leaf_size:
+            top = _push_children(
+                qx, qy, qz, level, cell, bounds, stack_level, stack_cell, top
+            )
+            continue
+
+        for p in range(start, stop):
+            d2 = (
+                (points[p, 0] - qx) ** 2
+                + (points[p, 1] - qy) ** 2
+                + (points[p, 2] - qz) ** 2
+            )
+            if d2 < best_d2[k - 1]:
+                # insert into the sorted k nearest points
+                m = k - 1
+                while m > 0 and best_d2[m - 1] > d2:
+                    best_d2[m] = best_d2[m - 1]
+                    best[m] = best[m - 1]
+                    m -= 1
+                best_d2[m] = d2
+                best[m] = p
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _spherical_index_query_radius(
+    xyz, r, points, bucket_offsets, bounds, depth, leaf_size, count_only, sort_results
+):
+    """Queries the points (sorted by bucket) within a great-circle distance
+    ``r`` of each unit vector of ``xyz``, in parallel over the query points.
+
+    Returns
+    -------
+    offsets : np.ndarray
+        Offsets of the neighbors of each query point (CSR format)
+    indices, distances : np.ndarray
+        Neighbors of all query points and their distances, which are empty
+        if ``count_only``
+    """
+    n_query = xyz.shape[0]
+
+    counts = np.zeros(n_query, dtype=np.int64)
+    for q in prange(n_query):
+        counts[q] = _cap_neighbors(
+            xyz[q], r, points, bucket_offsets, bounds, depth, leaf_size, None, None
+        )
+
+    offsets = np.zeros(n_query + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+
+    if count_only:
+        return offsets, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+    indices = np.empty(offsets[-1], dtype=np.int64)
+    distances = np.empty(offsets[-1], dtype=np.float64)
+
+    for q in prange(n_query):
+        start, stop = offsets[q], offsets[q + 1]
+
+        _cap_neighbors(
+            xyz[q],
+            r,
+            points,
+            bucket_offsets,
+            bounds,
+            depth,
+            leaf_size,
+            indices[start:stop],
+            distances[start:stop],
+        )
+
+        if sort_results:
+            order = np.argsort(distances[start:stop])
+            indices[start:stop] = indices[start:stop][order]
+            distances[start:stop] = distances[start:stop][order]
+
+    return offsets, indices, distances
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _cap_neighbors(
+    q, r, points, bucket_offsets, bounds, depth, leaf_size, indices, distances
+):
+    """Counts the points within a cap of great-circle radius ``r`` around a
+    unit vector, writing their indices and distances unless they are
+    ``None``."""
+    count = 0
+
+    r2 = _chord_squared(r)
+    cos_r, sin_r = np.cos(min(r, np.pi)), np.sin(min(r, np.pi))
+
+    stack_level = np.zeros(6 + 3 * depth, dtype=np.int64)
+    stack_cell = np.arange(6 + 3 * depth)
+    top = 6
+
+    while top > 0:
+        top -= 1
+        level, cell = stack_level[top], stack_cell[top]
+
+        shift = 2 * (depth - level)
+        start = bucket_offsets[cell << shift]
+        stop = bucket_offsets[(cell + 1) << shift]
+        if start == stop:
+            continue
+
+        if not _cell_within(
+            q[0], q[1], q[2], _cell_start(level) + cell, bounds, cos_r, sin_r
+        ):
+            continue
+
+        if level < depth and stop - start > leaf_size:
+            for c in range(4):
+                stack_level[top] = level + 1
+                stack_cell[top] = 4 * cell + c
+                top += 1
+            continue
+
+        for p in range(start, stop):
+            d2 = (
+                (points[p, 0] - q[0]) ** 2
+                + (points[p, 1] - q[1]) ** 2
+                + (points[p, 2] - q[2]) ** 2
+            )
+            if d2 <= r2:
+                if indices is not None:
+                    indices[count] = p
+                    distances[count] = 2 * np.arcsin(min(np.sqrt(d2) / 2, 1.0))
+                count += 1
+
+    return count
+
+
+def _locate_points(grid, lon, lat, n_candidates=8):
+    """Index of the face of a grid that contains each (lon, lat) point in
+    degrees, or -1 for points outside of the grid.
+
+    The face centers closest to each point are searched with the spherical
+    index of the grid, and tested for containing the point from the closest
+    to the farthest. Points that are contained by none of them are tested
+    against every face whose bounding cap contains them. Faces are assumed to
+    be convex, with points on a shared edge or node located in the face with
+    the closest center.
+    """
+    lon, lat = np.broadcast_arrays(
+        np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+    )
+    shape = lon.shape
+
+    xyz = np.stack(
+        _lonlat_rad_to_xyz(np.deg2rad(lon.ravel()), np.deg2rad(lat.ravel())), axis=-1
+    )
+
+    index = grid.get_spherical_index(coordinates="face centers")
+
+    face_offsets, face_nodes = grid.get_csr_connectivity("face_node_connectivity")
+    node_xyz = np.stack(
+        _lonlat_rad_to_xyz(
+            np.deg2rad(grid.node_lon.values), np.deg2rad(grid.node_lat.values)
+        ),
+        axis=-1,
+    )
+    face_xyz = np.stack(
+        _lonlat_rad_to_xyz(
+            np.deg2rad(grid.face_lon.values), np.deg2rad(grid.face_lat.values)
+        ),
+        axis=-1,
+    )
+    cos_radii = _face_bounding_caps(face_xyz, node_xyz, face_offsets, face_nodes)
+
+    faces = np.full(xyz.shape[0], -1, dtype=np.int64)
+    remaining = np.arange(xyz.shape[0])
+
+    # faces with the closest centers to each point, with the closest face (which usually contains the point) being
+    # tested first and the others only for the remaining points
+    for k in (1, min(n_candidates, grid.n_face)):
+        d, ind = _spherical_index_query(
+            xyz[remaining],
+            k,
+            index._xyz,
+            index._bucket_offsets,
+            index._bounds,
+            index._depth,
+            index._leaf_size,
+        )
+        located = _locate_in_candidates(
+            xyz[remaining],
+            np.arange(0, remaining.shape[0] * k + 1, k),
+            index._order[ind.ravel()],
+            face_xyz,
+            cos_radii,
+            node_xyz,
+            face_offsets,
+            face_nodes,
+        )
+        faces[remaining] = located
+
+        remaining = remaining[located < 0]
+        d = d[located < 0]
+        if remaining.size == 0 or k == grid.n_face:
+            break
+
+    # a face farther away than every candidate can only contain a point that lies within its bounding cap, with some
+    # slack for rounding
+    max_radius = np.arccos(np.clip(cos_radii.min(), -1.0, 1.0)) + 1e-10
+    remaining = remaining[d[:, k - 1] <= max_radius]
+    if k < grid.n_face and remaining.size > 0:
+        offsets, ind, _ = _spherical_index_query_radius(
+            xyz[remaining],
+            max_radius,
+            index._xyz,
+            index._bucket_offsets,
+            index._bounds,
+            index._depth,
+            index._leaf_size,
+            False,
+            True,
+        )
+        faces[remaining] = _locate_in_candidates(
+            xyz[remaining],
+            offsets,
+            index._order[ind],
+            face_xyz,
+            cos_radii,
+            node_xyz,
+            face_offsets,
+            face_nodes,
+        )
+
+    return faces.astype(INT_DTYPE).reshape(shape)
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _face_bounding_caps(face_xyz, node_xyz, face_offsets, face_nodes):
+    """Cosine of the angular radius of the smallest cap around the center of
+    each face that contains all of its nodes."""
+    n_face = face_xyz.shape[0]
+    cos_radii = np.ones(n_face, dtype=np.float64)
+
+    for f in prange(n_face):
+        for i in range(face_offsets[f], face_offsets[f + 1]):
+            node = face_nodes[i]
+            cos_radii[f] = min(
+                cos_radii[f],
+                face_xyz[f, 0] * node_xyz[node, 0]
+                + face_xyz[f, 1] * node_xyz[node, 1]
+                + face_xyz[f, 2] * node_xyz[node, 2],
+            )
+
+    return cos_radii
+
+
+@njit(parallel=True, cache=ENABLE_JIT_CACHE)
+def _locate_in_candidates(
+    xyz,
+    candidate_offsets,
+    candidates,
+    face_xyz,
+    cos_radii,
+    node_xyz,
+    face_offsets,
+    face_nodes,
+):
+    """First of the candidate faces (CSR format) of each unit vector of
+    ``xyz`` that contains it, or -1 if none of them do."""
+    n_point = xyz.shape[0]
+    faces = np.full(n_point, -1, dtype=np.int64)
+
+    for p in prange(n_point):
+        for i in range(candidate_offsets[p], candidate_offsets[p + 1]):
+            face = candidates[i]
+            if _face_contains_point(
+                xyz[p],
+                face_xyz[face],
+                cos_radii[face],
+                node_xyz,
+                face_nodes[face_offsets[face] : face_offsets[face + 1]],
+            ):
+                faces[p] = face
+                break
+
+    return faces
+
+
+@njit(cache=ENABLE_JIT_CACHE)
+def _face_contains_point(pt, center, cos_radius, node_xyz, nodes):
+    """Whether a convex spherical polygon contains a unit vector, which is
+    the case if the vector lies on the same side of the plane of each edge
+    as the polygon (with either orientation of the nodes)."""
+    # points outside of the bounding cap of the face
+    dot = pt[0] * center[0] + pt[1] * center[1] + pt[2] * center[2]
+    if dot <= 0.0 or dot < cos_radius - ERROR_TOLERANCE:
+        return False
+
+    n_nodes = nodes.shape[0]
+    if n_nodes < 3:
+        return False
+
+    has_left, has_right = False, False
+    for i in range(n_nodes):
+        a = node_xyz[nodes[i]]
+        b = node_xyz[nodes[(i + 1) % n_nodes]]
+
+        # side of the point relative to the great circle through the edge
+        side = (
+            (a[1] * b[2] - a[2] * b[1]) * pt[0]
+            + (a[2] * b[0] - a[0] * b[2]) * pt[1]
+            + (a[0] * b[1] - a[1] * b[0]) * pt[2]
+        )
+
+        if side > ERROR_TOLERANCE:
+            has_left = True
+        elif side < -ERROR_TOLERANCE:
+            has_right = True
+
+        if has_left and has_right:
+            return False
+
+    return True
+
+
+# arrays that make up the state of a ``sklearn.neighbors`` tree, in the order returned by its ``__getstate__``
+TREE_STATE_ARRAYS = ("data", "idx_array", "node_data", "node_bounds")
+
+# integer statistics that follow the arrays in the state of a ``sklearn.neighbors`` tree
+TREE_STATE_STATS = (
+    "leaf_size",
+    "n_levels",
+    "n_nodes",
+    "n_trims",
+    "n_leaves",
+    "n_splits",
+    "n_calls",
+)
+
+
+def _check_tree_state(state):
+    """Checks that the state of a ``sklearn.neighbors`` tree (see
+    ``BinaryTree.__getstate__``) has the layout that ``_save_tree`` and
+    ``_load_tree`` rely on, which is private to scikit-learn.
+
+    Raises
+    ------
+    ValueError
+        If the state has a different layout
+    """
+    n_arrays = len(TREE_STATE_ARRAYS)
+    n_stats = len(TREE_STATE_STATS)
+
+    if (
+        len(state) != n_arrays + n_stats + 2
+        or not all(isinstance(arr, np.ndarray) for arr in state[:n_arrays])
+        or not all(
+            isinstance(stat, (int, np.integer))
+            for stat in state[n_arrays : n_arrays + n_stats]
+        )
+    ):
+        raise ValueError(
+            f"Unsupported layout of the state of sklearn.neighbors trees in scikit-learn {sklearn.__version__}."
+        )
+
+
+def _save_tree(tree, path):
+    """Writes the arrays of the current ``sklearn.neighbors`` tree of a
+    ``KDTree`` or ``BallTree`` to ``.npy`` files in a directory, along with a
+    ``tree.json`` file describing it.
+
+    The tree is first written to a temporary directory and then renamed (see
+    ``_replace_directory``), so that concurrent processes never read a
+    partially written or deleted tree.
+    """
+    state = tree._current_tree().__getstate__()
+    _check_tree_state(state)
+
+    metadata = {
+        "tree_type": type(tree).__name__,
+        "sklearn_version": sklearn.__version__,
+        "state_length": len(state),
+        "coordinates": tree.coordinates,
+        "coordinate_system": tree.coordinate_system,
+        "distance_metric": tree.distance_metric,
+        "fingerprint": tree._source_grid.fingerprint,
+        "coordinates_hash": _tree_coordinates_hash(
+            tree._source_grid, tree.coordinates, tree.coordinate_system
+        ),
+        **{
+            name: value
+            for name, value in zip(
+                TREE_STATE_STATS,
+                state[
+                    len(TREE_STATE_ARRAYS) : len(TREE_STATE_ARRAYS)
+                    + len(TREE_STATE_STATS)
+                ],
+            )
+        },
+    }
+
+    path = os.path.abspath(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = tempfile.mkdtemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        for name, arr in zip(TREE_STATE_ARRAYS, state):
+            np.save(os.path.join(tmp_path, f"{name}.npy"), np.asarray(arr))
+
+        with open(os.path.join(tmp_path, "tree.json"), "w") as f:
+            json.dump(metadata, f)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    _replace_directory(tmp_path, path)
+
+
+def _replace_directory(src, dst):
+    """Replaces the directory ``dst`` with ``src``, such that ``dst`` is
+    never partially deleted or written.
+
+    An existing ``dst`` is first renamed aside and then removed, so readers
+    either find the complete old or new directory or none at all. If another
+    writer moves its own directory into place in the meantime, ``src`` is
+    discarded in favor of it.
+    """
+    old_path = None
+    try:
+        if os.path.isdir(dst):
+            old_path = tempfile.mkdtemp(dir=os.path.dirname(dst), suffix=".old")
+            try:
+                os.replace(dst, os.path.join(old_path, "entry"))
+            except FileNotFoundError:
+                # another writer moved it aside first
+                pass
+
+        try:
+            os.rename(src, dst)
+        except OSError:
+            # another writer moved a complete directory into place
+            if not os.path.isdir(dst):
+                raise
+    finally:
+        shutil.rmtree(src, ignore_errors=True)
+        if old_path is not None:
+            shutil.rmtree(old_path, ignore_errors=True)
+
+
+def _load_tree(tree_type, grid, path, mmap_mode="r"):
+    """Constructs a ``KDTree`` or ``BallTree`` (``tree_type``) from a tree
+    written by ``_save_tree``, restoring the state of its
+    ``sklearn.neighbors`` tree from the (memory-mapped) arrays."""
+    with open(os.path.join(path, "tree.json")) as f:
+        metadata = json.load(f)
+
+    if metadata["tree_type"] != tree_type.__name__:
+        raise ValueError(
+            f"Unable to load a {metadata['tree_type']} as a {tree_type.__name__}."
+        )
+
+    # the state of the tree is only restored by the version of scikit-learn that saved it
+    if (
+        metadata.get("sklearn_version") != sklearn.__version__
+        or metadata.get("state_length")
+        != len(TREE_STATE_ARRAYS) + len(TREE_STATE_STATS) + 2
+    ):
+        raise ValueError(
+            f"The tree at {path} was saved by scikit-learn {metadata.get('sklearn_version')}, which cannot be "
+            f"loaded by scikit-learn {sklearn.__version__}."
+        )
+
+    # grids with the same fingerprint may still differ in the order of their edges or in their centers
+    coordinates_hash = _tree_coordinates_hash(
+        grid, metadata["coordinates"], metadata["coordinate_system"]
+    )
+    if (
+        metadata["fingerprint"] != grid.fingerprint
+        or metadata.get("coordinates_hash") != coordinates_hash
+    ):
+        raise ValueError(
+            f"The tree at {path} was constructed from a different grid than the one provided."
+        )
+
+    arrays = tuple(
+        np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+        for name in TREE_STATE_ARRAYS
+    )
+    stats = tuple(metadata[name] for name in TREE_STATE_STATS)
+    metric = DistanceMetric.get_metric(metadata["distance_metric"], dtype=np.float64)
+
+    sk_tree_type = SKBallTree if tree_type is BallTree else SKKDTree
+    sk_tree = sk_tree_type.__new__(sk_tree_type)
+    sk_tree.__setstate__(arrays + stats + (metric, None))
+
+    # set up the tree without constructing it
+    tree = tree_type.__new__(tree_type)
+    tree._source_grid = grid
+    tree._coordinates = metadata["coordinates"]
+    tree.coordinate_system = metadata["coordinate_system"]
+    tree.distance_metric = metadata["distance_metric"]
+    tree.reconstruct = False
+
+    tree._tree_from_nodes = None
+    tree._tree_from_face_centers = None
+    tree._tree_from_edge_centers = None
+
+    if tree._coordinates == "nodes":
+        tree._tree_from_nodes = sk_tree
+        tree._n_elements = grid.n_node
+    elif tree._coordinates == "face centers":
+        tree._tree_from_face_centers = sk_tree
+        tree._n_elements = grid.n_face
+    else:
+        tree._tree_from_edge_centers = sk_tree
+        tree._n_elements = grid.n_edge
+
+    return tree
+
+
+def _query_in_chunks(
+    tree,
+    coords,
+    k,
+    in_radians,
+    return_distance,
+    query_options,
+    chunk_size=None,
+    n_workers=None,
+    out=None,
+    index_dtype=INT_DTYPE,
+    distance_dtype=np.float64,
+):
+    """Queries the ``k`` nearest neighbors of a ``KDTree`` or ``BallTree``
+    in chunks of ``chunk_size`` points, which are prepared and queried
+    independently (concurrently with ``n_workers`` threads, since sklearn
+    releases the GIL during queries) and written to the output arrays.
+
+    Parameters
+    ----------
+    query_options : tuple
+        ``dualtree``, ``breadth_first`` and ``sort_results`` options of the sklearn query
+    """
+    coords = np.asarray(coords)
+    if coords.ndim == 1:
+        coords = np.expand_dims(coords, axis=0)
+    n_points = coords.shape[0]
+
+    if chunk_size is None:
+        chunk_size = max(n_points, 1)
+    elif chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    if out is None:
+        ind = np.empty((n_points, k), dtype=index_dtype)
+        d = np.empty((n_points, k), dtype=distance_dtype) if return_distance else None
+    elif return_distance:
+        d, ind = out
+    else:
+        d, ind = None, out
+
+    for name, array in (("distance", d), ("index", ind)):
+        if array is not None and array.shape != (n_points, k):
+            raise ValueError(
+                f"Expected an output {name} array of shape {(n_points, k)}, got {array.shape}"
+            )
+
+    if (
+        np.issubdtype(ind.dtype, np.integer)
+        and tree._n_elements - 1 > np.iinfo(ind.dtype).max
+    ):
+        raise ValueError(
+            f"The indices of {tree._n_elements} elements cannot be represented as {ind.dtype}"
+        )
+
+    sklearn_tree = tree._current_tree()
+    to_degrees = not in_radians and tree.coordinate_system == "spherical"
+
+    def _query_chunk(start):
+        stop = min(start + chunk_size, n_points)
+
+        if tree.coordinate_system == "spherical":
+            chunk = _prepare_xy_for_query(
+                coords[start:stop], in_radians, distance_metric=tree.distance_metric
+            )
+        else:
+            chunk = _prepare_xyz_for_query(coords[start:stop])
+
+        result = sklearn_tree.query(chunk, k, return_distance, *query_options)
+
+        if return_distance:
+            chunk_d, chunk_ind = result
+            d[start:stop] = np.rad2deg(chunk_d) if to_degrees else chunk_d
+        else:
+            chunk_ind = result
+        ind[start:stop] = chunk_ind
+
+    starts = range(0, n_points, chunk_size)
+    if n_workers is not None and n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_query_chunk, starts))
+    else:
+        for start in starts:
+            _query_chunk(start)
+
+    # only one pair was queried
+    if out is None and n_points == 1:
+        ind = ind.squeeze()
+        if return_distance:
+            d = d.squeeze()
+
+    if return_distance:
+        return d, ind
+
+    return ind
+
 
 def _prepare_xy_for_query(xy, use_radians, distance_metric):
     """Prepares xy coordinates for query with the sklearn BallTree or
@@ -895,7 +2088,7 @@ def _construct_edge_face_distances(node_lon, node_lat, edge_faces):
     """Helper for computing the arc-distance between faces that saddle a given
     edge."""
 
-    saddle_mask = edge_faces[:, 1] != INT_FILL_VALUE
+    saddle_mask = edge_faces[:, 1] != np.iinfo(edge_faces.dtype).min
 
     edge_face_distances = np.zeros(edge_faces.shape[0])
 
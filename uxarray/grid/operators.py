@@ -0,0 +1,270 @@
+"""Linear operators on data mapped to the elements of a grid (i.e. averaging
+node-centered data onto each face), represented as sparse matrices that are
+built once from the connectivity of a grid and cached on it.
+
+Each operator maps data on its source elements (columns) to data on its
+destination elements (rows), and is named the same way as the connectivity
+variables (i.e. ``edge_face_difference`` maps face-centered data to edges).
+"""
+from __future__ import annotations
+
+from functools import partial
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import dask.array as da
+
+from uxarray.grid.utils import _get_fill_value
+
+if TYPE_CHECKING:
+    from uxarray.grid import Grid
+
+
+class GridOperatorsAccessor:
+    """Accessor for the sparse matrices of the linear operators of a grid,
+    accessed through ``Grid.operators``.
+
+    Each matrix is built on first access and cached on the grid until the
+    connectivity, coordinates or face areas it is built from change. An
+    operator is applied to data with shape (..., n_source) as
+    ``(matrix @ data.reshape(-1, n_source).T).T``.
+    """
+
+    def __init__(self, uxgrid: Grid) -> None:
+        self.uxgrid = uxgrid
+
+    def __repr__(self):
+        prefix = "<uxarray.Grid.operators>\n"
+        operators_heading = "Supported Operators:\n"
+
+        for name in OPERATOR_BUILDERS:
+            operators_heading += f"  * {name}\n"
+
+        return prefix + operators_heading
+
+    @property
+    def edge_face_difference(self):
+        """(``n_edge``, ``n_face``) matrix that computes the difference
+        between the two faces that saddle each edge (first face minus second
+        face), which is zero on edges with a single face."""
+        return _get_operator(self.uxgrid, "edge_face_difference")
+
+    @property
+    def edge_node_difference(self):
+        """(``n_edge``, ``n_node``) matrix that computes the difference
+        between the two nodes of each edge (first node minus second node)."""
+        return _get_operator(self.uxgrid, "edge_node_difference")
+
+    @property
+    def edge_face_gradient(self):
+        """(``n_edge``, ``n_face``) matrix that computes the gradient across
+        each edge, as the difference between the faces that saddle it divided
+        by ``edge_face_distances``, which is zero on edges with a single
+        face."""
+        return _get_operator(self.uxgrid, "edge_face_gradient")
+
+    @property
+    def face_edge_divergence(self):
+        """(``n_face``, ``n_edge``) matrix that computes the divergence of an
+        edge-centered flux, taken as positive from the first to the second
+        face that saddle each edge, as the sum of the outward fluxes weighted
+        by ``edge_node_distances`` over ``face_areas``."""
+        return _get_operator(self.uxgrid, "face_edge_divergence")
+
+    @property
+    def face_node_average(self):
+        """(``n_face``, ``n_node``) matrix that averages node-centered data
+        over the nodes of each face."""
+        return _get_operator(self.uxgrid, "face_node_average")
+
+    @property
+    def node_face_average(self):
+        """(``n_node``, ``n_face``) matrix that averages face-centered data
+        over the faces around each node, weighted by the area each face
+        contributes to the dual cell of the node (see
+        ``Grid.compute_node_areas``)."""
+        return _get_operator(self.uxgrid, "node_face_average")
+
+    @property
+    def face_laplacian(self):
+        """(``n_face``, ``n_face``) matrix that computes the Laplacian of
+        face-centered data, as the divergence of the gradient across each
+        edge, with no flux across edges with a single face."""
+        return _get_operator(self.uxgrid, "face_laplacian")
+
+
+def _get_operator(grid, name):
+    """Returns the sparse matrix of the operator ``name`` of a grid, which
+    is built on first access and cached in ``Grid._operator_cache``."""
+    if name not in grid._operator_cache:
+        grid._operator_cache[name] = OPERATOR_BUILDERS[name](grid)
+
+    return grid._operator_cache[name]
+
+
+def _saddle_edges(grid):
+    """Index of each edge that saddles two faces, along with its faces."""
+    edge_faces = grid.edge_face_connectivity.values
+    saddle = np.flatnonzero(edge_faces[:, 1] != _get_fill_value(edge_faces.dtype))
+
+    return saddle, edge_faces[saddle, 0], edge_faces[saddle, 1]
+
+
+def _build_edge_face_difference(grid):
+    """Builds the (``n_edge``, ``n_face``) face difference matrix."""
+    from scipy.sparse import csr_matrix
+
+    saddle, face_a, face_b = _saddle_edges(grid)
+    ones = np.ones(saddle.shape[0])
+
+    return csr_matrix(
+        (
+            np.concatenate([ones, -ones]),
+            (np.concatenate([saddle, saddle]), np.concatenate([face_a, face_b])),
+        ),
+        shape=(grid.n_edge, grid.n_face),
+    )
+
+
+def _build_edge_node_difference(grid):
+    """Builds the (``n_edge``, ``n_node``) node difference matrix."""
+    from scipy.sparse import csr_matrix
+
+    edge_nodes = grid.edge_node_connectivity.values
+
+    weights = np.tile(np.array([1.0, -1.0]), grid.n_edge)
+
+    return csr_matrix(
+        (weights, edge_nodes.ravel(), np.arange(0, 2 * grid.n_edge + 1, 2)),
+        shape=(grid.n_edge, grid.n_node),
+    )
+
+
+def _build_edge_face_gradient(grid):
+    """Builds the (``n_edge``, ``n_face``) gradient matrix by scaling each
+    row of the face difference matrix by its inverse edge face distance."""
+    from scipy.sparse import diags
+
+    saddle, _, _ = _saddle_edges(grid)
+
+    inverse_distances = np.zeros(grid.n_edge)
+    inverse_distances[saddle] = 1.0 / grid.edge_face_distances.values[saddle]
+
+    difference = _get_operator(grid, "edge_face_difference")
+
+    return (diags(inverse_distances) @ difference).tocsr()
+
+
+def _build_face_edge_divergence(grid):
+    """Builds the (``n_face``, ``n_edge``) divergence matrix, with the flux
+    across an edge with a single face leaving that face."""
+    from scipy.sparse import csr_matrix
+
+    edge_faces = grid.edge_face_connectivity.values
+    saddle, face_a, face_b = _saddle_edges(grid)
+
+    edge_lengths = grid.edge_node_distances.values
+    face_areas = grid.face_areas
+
+    edges = np.arange(grid.n_edge)
+
+    return csr_matrix(
+        (
+            np.concatenate(
+                [
+                    edge_lengths / face_areas[edge_faces[:, 0]],
+                    -edge_lengths[saddle] / face_areas[face_b],
+                ]
+            ),
+            (
+                np.concatenate([edge_faces[:, 0], face_b]),
+                np.concatenate([edges, saddle]),
+            ),
+        ),
+        shape=(grid.n_face, grid.n_edge),
+    )
+
+
+def _build_face_node_average(grid):
+    """Builds the (``n_face``, ``n_node``) matrix that averages node-centered
+    data over the nodes of each face."""
+    from scipy.sparse import csr_matrix
+
+    offsets, indices = grid.get_csr_connectivity("face_node_connectivity")
+    counts = np.diff(offsets)
+
+    weights = np.repeat(1.0 / np.maximum(counts, 1), counts)
+
+    return csr_matrix((weights, indices, offsets), shape=(grid.n_face, grid.n_node))
+
+
+def _build_node_face_average(grid):
+    """Builds the (``n_node``, ``n_face``) matrix that averages face-centered
+    data over the faces around each node, with each face weighted by an equal
+    share of its area among its nodes."""
+    from scipy.sparse import csr_matrix
+
+    offsets, indices = grid.get_csr_connectivity("node_face_connectivity")
+    counts = np.diff(offsets)
+    n_nodes_per_face = np.diff(grid.get_csr_connectivity("face_node_connectivity")[0])
+
+    weights = grid.face_areas[indices] / np.maximum(n_nodes_per_face[indices], 1)
+
+    # normalize the weights of each node by the area of its dual cell
+    rows = np.repeat(np.arange(grid.n_node), counts)
+    node_areas = np.bincount(rows, weights=weights, minlength=grid.n_node)
+    weights /= node_areas[rows]
+
+    return csr_matrix((weights, indices, offsets), shape=(grid.n_node, grid.n_face))
+
+
+def _build_face_laplacian(grid):
+    """Builds the (``n_face``, ``n_face``) Laplacian matrix as the divergence
+    of the negated gradient, which is the outward gradient of the first face
+    of each edge."""
+    divergence = _get_operator(grid, "face_edge_divergence")
+    gradient = _get_operator(grid, "edge_face_gradient")
+
+    return (-(divergence @ gradient)).tocsr()
+
+
+# operators that can be built for a grid, mapped to the function that builds their matrix
+OPERATOR_BUILDERS = {
+    "edge_face_difference": _build_edge_face_difference,
+    "edge_node_difference": _build_edge_node_difference,
+    "edge_face_gradient": _build_edge_face_gradient,
+    "face_edge_divergence": _build_face_edge_divergence,
+    "face_node_average": _build_face_node_average,
+    "node_face_average": _build_node_face_average,
+    "face_laplacian": _build_face_laplacian,
+}
+
+
+def _apply_operator(matrix, data):
+    """Applies a sparse operator over the last dimension of an array.
+
+    Dask-backed data is processed lazily, with the operator being applied to
+    each block of the leading dimensions (the last dimension is merged into a
+    single chunk).
+    """
+    if isinstance(data, da.Array):
+        data = data.rechunk({data.ndim - 1: -1})
+
+        return data.map_blocks(
+            partial(_apply_operator_block, matrix),
+            chunks=data.chunks[:-1] + ((matrix.shape[0],),),
+            dtype=np.result_type(data.dtype, matrix.dtype),
+        )
+
+    return _apply_operator_block(matrix, np.asarray(data))
+
+
+def _apply_operator_block(matrix, block):
+    """Applies a sparse operator over the last dimension of an in-memory
+    array with a single sparse matrix product."""
+    flat = block.reshape(-1, block.shape[-1])
+
+    result = (matrix @ flat.T).T
+
+    return result.reshape(block.shape[:-1] + (matrix.shape[0],))
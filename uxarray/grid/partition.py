@@ -0,0 +1,97 @@
+"""Partitioning of the faces of a grid into spatially contiguous parts, which
+allows regions of a grid to be processed independently (i.e. one dask chunk
+per part)."""
+import numpy as np
+
+from uxarray.constants import INT_DTYPE
+from uxarray.grid.reorder import (
+    _face_centroids_xyz,
+    _permute_csr_rows,
+    _sfc_keys,
+    SFC_BITS,
+)
+
+PARTITION_METHODS = ("rcb", "hilbert")
+
+
+def _partition_grid(grid, n_parts, method="rcb"):
+    """Partitions the faces of a grid into ``n_parts`` spatially contiguous
+    parts of (nearly) equal size.
+
+    Returns
+    -------
+    parts : list of np.ndarray
+        Sorted face indices of each part
+    halos : list of np.ndarray
+        Sorted indices of the faces outside each part that share a node with it
+    """
+    if method not in PARTITION_METHODS:
+        raise ValueError(
+            f"Unsupported partitioning method: {method}. Expected one of {PARTITION_METHODS}"
+        )
+
+    if not 1 <= n_parts <= grid.n_face:
+        raise ValueError(
+            f"Number of parts must be between 1 and the number of faces ({grid.n_face}), got {n_parts}."
+        )
+
+    centroids = _face_centroids_xyz(grid)
+
+    if method == "rcb":
+        parts = _recursive_coordinate_bisection(centroids, n_parts)
+    else:
+        lower = centroids.min(axis=0)
+        extent = centroids.max(axis=0) - lower
+        extent[extent == 0] = 1.0
+        quantized = ((centroids - lower) / extent * (2**SFC_BITS - 1)).astype(np.int64)
+
+        order = np.argsort(_sfc_keys(quantized, SFC_BITS, True), kind="stable")
+        parts = np.array_split(order.astype(INT_DTYPE), n_parts)
+
+    parts = [np.sort(part) for part in parts]
+
+    return parts, [_halo_faces(grid, part) for part in parts]
+
+
+def _recursive_coordinate_bisection(centroids, n_parts):
+    """Recursively splits a set of faces along the axis in which their
+    centroids have the largest extent, such that the number of faces on
+    each side is proportional to the number of parts assigned to it.
+
+    Parts are returned in depth-first order, so consecutive parts are close
+    to each other.
+    """
+    parts = []
+
+    # stack of (faces, number of parts) pairs, with the leftmost split on top
+    stack = [(np.arange(centroids.shape[0], dtype=INT_DTYPE), n_parts)]
+    while stack:
+        faces, n = stack.pop()
+        if n == 1:
+            parts.append(faces)
+            continue
+
+        coords = centroids[faces]
+        axis = np.argmax(coords.max(axis=0) - coords.min(axis=0))
+
+        n_left = n // 2
+        split = int(round(faces.shape[0] * n_left / n))
+
+        order = np.argpartition(coords[:, axis], split - 1)
+        stack.append((faces[order[split:]], n - n_left))
+        stack.append((faces[order[:split]], n_left))
+
+    return parts
+
+
+def _halo_faces(grid, faces):
+    """Faces that share at least one node with ``faces``, excluding
+    ``faces`` themselves."""
+    _, nodes = _permute_csr_rows(
+        *grid.get_csr_connectivity("face_node_connectivity"), faces
+    )
+    _, neighbors = _permute_csr_rows(
+        *grid.get_csr_connectivity("node_face_connectivity"), np.unique(nodes)
+    )
+
+    return np.setdiff1d(neighbors, faces).astype(INT_DTYPE)
@@ -0,0 +1,352 @@
+"""Locality-preserving reordering of the faces, nodes and edges of a grid,
+which places elements that are close to each other on the sphere (or in the
+connectivity graph) close to each other in memory."""
+import copy
+
+import numpy as np
+
+from numba import njit
+
+from uxarray.constants import INT_DTYPE
+from uxarray.grid.connectivity import (
+    _build_edge_edge_csr,
+    _build_node_node_csr,
+    _csr_to_padded,
+    _padded_to_csr,
+)
+from uxarray.grid.dependencies import CACHED_ATTRIBUTES
+from uxarray.grid.utils import _get_fill_value
+
+REORDER_METHODS = ("hilbert", "morton", "rcm")
+
+# number of bits used to quantize each Cartesian coordinate for computing space-filling curve keys
+SFC_BITS = 21
+
+
+def _reorder_grid(grid, method="hilbert"):
+    """Reorders the faces of a grid along a space-filling curve ("hilbert"
+    or "morton") through their centroids, or using the reverse Cuthill-McKee
+    ordering ("rcm") of the face adjacency graph. Nodes and edges are then
+    ordered by their first appearance in the reordered faces.
+
+    Every variable of the internal dataset (``Grid._ds``) is permuted and the
+    connectivity variables are updated to the new indices, while any other
+    cached quantity (i.e. face areas) is discarded.
+
+    Returns
+    -------
+    permutation : dict
+        Mapping of each reordered dimension (``n_face``, ``n_node`` and, if present, ``n_edge``) to the
+        original index of each reordered element
+    """
+    if method not in REORDER_METHODS:
+        raise ValueError(
+            f"Unsupported reordering method: {method}. Expected one of {REORDER_METHODS}"
+        )
+
+    return _permute_grid(grid, _face_permutation(grid, method))
+
+
+def _permute_grid(grid, face_perm):
+    """Reorders the faces of a grid such that face ``i`` is the original face
+    ``face_perm[i]``, with its nodes and edges ordered by their first
+    appearance in the reordered faces.
+
+    Returns
+    -------
+    permutation : dict
+        Mapping of each reordered dimension (``n_face``, ``n_node`` and, if present, ``n_edge``) to the
+        original index of each reordered element
+    """
+    # edges are reordered through the face edge connectivity
+    if "edge_node_connectivity" in grid._ds:
+        grid.face_edge_connectivity
+
+    offsets, indices = _permute_csr_rows(
+        *grid.get_csr_connectivity("face_node_connectivity"), face_perm
+    )
+    permutation = {
+        "n_face": face_perm,
+        "n_node": _first_appearance_order(indices, grid.n_node),
+    }
+
+    if grid._connectivity_populated("face_edge_connectivity"):
+        _, face_edges = _permute_csr_rows(
+            *grid.get_csr_connectivity("face_edge_connectivity"), face_perm
+        )
+        permutation["n_edge"] = _first_appearance_order(face_edges, grid.n_edge)
+
+    _apply_permutation(grid, permutation)
+
+    return permutation
+
+
+def _face_permutation(grid, method):
+    """Computes the reordered index of each face."""
+    if method == "rcm":
+        from scipy.sparse import csr_matrix
+        from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+        offsets, indices = grid.get_csr_connectivity("face_face_connectivity")
+        adjacency = csr_matrix(
+            (np.ones(indices.shape[0], dtype=np.int8), indices, offsets),
+            shape=(grid.n_face, grid.n_face),
+        )
+        return reverse_cuthill_mckee(adjacency, symmetric_mode=True).astype(INT_DTYPE)
+
+    centroids = _face_centroids_xyz(grid)
+
+    # quantize each coordinate over the bounding box of the centroids
+    lower = centroids.min(axis=0)
+    extent = centroids.max(axis=0) - lower
+    extent[extent == 0] = 1.0
+    quantized = ((centroids - lower) / extent * (2**SFC_BITS - 1)).astype(np.int64)
+
+    keys = _sfc_keys(quantized, SFC_BITS, method == "hilbert")
+
+    return np.argsort(keys, kind="stable").astype(INT_DTYPE)
+
+
+def _face_centroids_xyz(grid):
+    """Cartesian centroid of each face, using the stored face coordinates if
+    present and the mean of its nodes otherwise."""
+    if "face_x" in grid._ds:
+        return np.stack(
+            [
+                grid._ds["face_x"].values,
+                grid._ds["face_y"].values,
+                grid._ds["face_z"].values,
+            ],
+            axis=1,
+        )
+
+    offsets, indices = grid.get_csr_connectivity("face_node_connectivity")
+    counts = np.diff(offsets)
+    entry_faces = np.repeat(np.arange(grid.n_face), counts)
+
+    centroids = np.empty((grid.n_face, 3))
+    for axis, node_coord in enumerate([grid.node_x, grid.node_y, grid.node_z]):
+        centroids[:, axis] = np.bincount(
+            entry_faces, weights=node_coord.values[indices], minlength=grid.n_face
+        ) / np.maximum(counts, 1)
+
+    return centroids
+
+
+@njit
+def _sfc_keys(quantized, n_bits, hilbert):
+    """Computes the position of each quantized three-dimensional point along
+    a Hilbert (using Skilling's transpose algorithm) or Morton (Z-order)
+    space-filling curve."""
+    n_points, n_dims = quantized.shape
+    keys = np.empty(n_points, dtype=np.int64)
+    x = np.empty(n_dims, dtype=np.int64)
+
+    for point_idx in range(n_points):
+        for i in range(n_dims):
+            x[i] = quantized[point_idx, i]
+
+        if hilbert:
+            # inverse undo
+            q = np.int64(1) << (n_bits - 1)
+            while q > 1:
+                p = q - 1
+                for i in range(n_dims):
+                    if x[i] & q:
+                        x[0] ^= p
+                    else:
+                        t = (x[0] ^ x[i]) & p
+                        x[0] ^= t
+                        x[i] ^= t
+                q >>= 1
+
+            # gray encode
+            for i in range(1, n_dims):
+                x[i] ^= x[i - 1]
+            t = np.int64(0)
+            q = np.int64(1) << (n_bits - 1)
+            while q > 1:
+                if x[n_dims - 1] & q:
+                    t ^= q - 1
+                q >>= 1
+            for i in range(n_dims):
+                x[i] ^= t
+
+        # interleave the bits of each coordinate, starting from the most significant bit
+        key = np.int64(0)
+        for bit in range(n_bits - 1, -1, -1):
+            for i in range(n_dims):
+                key = (key << 1) | ((x[i] >> bit) & 1)
+        keys[point_idx] = key
+
+    return keys
+
+
+@njit
+def _first_appearance_order(indices, n_elements):
+    """Orders elements by their first appearance in ``indices``, followed by
+    any element that does not appear in it in their original order."""
+    order = np.empty(n_elements, dtype=INT_DTYPE)
+    seen = np.zeros(n_elements, dtype=np.bool_)
+
+    n_ordered = 0
+    for element in indices:
+        if not seen[element]:
+            seen[element] = True
+            order[n_ordered] = element
+            n_ordered += 1
+
+    for element in range(n_elements):
+        if not seen[element]:
+            order[n_ordered] = element
+            n_ordered += 1
+
+    return order
+
+
+def _permute_csr_rows(offsets, indices, perm):
+    """Reorders the rows of a connectivity stored in compressed sparse row
+    (CSR) format, such that row ``i`` of the result is row ``perm[i]``."""
+    counts = np.diff(offsets)[perm]
+
+    new_offsets = np.zeros(counts.shape[0] + 1, dtype=INT_DTYPE)
+    np.cumsum(counts, out=new_offsets[1:])
+
+    # position of each entry of the result in the original entries
+    source = (
+        np.arange(new_offsets[-1], dtype=INT_DTYPE)
+        - np.repeat(new_offsets[:-1], counts)
+        + np.repeat(offsets[:-1][perm], counts)
+    )
+
+    return new_offsets, indices[source]
+
+
+def _remap_indices(values, inverse):
+    """Replaces each non-fill-value index with its reordered index."""
+    fill_value = _get_fill_value(values.dtype)
+    valid = values != fill_value
+
+    remapped = np.full_like(values, fill_value)
+    remapped[valid] = inverse[values[valid]]
+
+    return remapped
+
+
+def _apply_permutation(grid, permutation):
+    """Permutes every variable of a grid along the reordered dimensions and
+    updates the indices stored in its connectivity variables."""
+    # reordered index of each original element
+    inverse = {}
+    for dim, perm in permutation.items():
+        inverse[dim] = np.empty_like(perm)
+        inverse[dim][perm] = np.arange(perm.shape[0], dtype=perm.dtype)
+
+    def _indexed_dim(name):
+        # i.e. "face_node_connectivity" stores indices into "n_node"
+        return "n_" + name.split("_")[1]
+
+    ds = grid._ds.isel({dim: perm for dim, perm in permutation.items()})
+
+    for name in list(ds.data_vars):
+        if not name.endswith("_connectivity") or _indexed_dim(name) not in inverse:
+            continue
+
+        attrs = dict(ds[name].attrs)
+        attrs.pop("inverse_indices", None)
+        attrs.pop("fill_value_mask", None)
+
+        ds[name] = ds[name].copy(
+            data=_remap_indices(ds[name].values, inverse[_indexed_dim(name)])
+        )
+        ds[name].attrs = attrs
+
+    grid._ds = ds
+
+    for name in list(grid._csr_connectivity):
+        if name not in grid._ragged_connectivity:
+            # cached CSR representations of padded variables are reconstructed on access
+            del grid._csr_connectivity[name]
+            continue
+
+        offsets, indices = _permute_csr_rows(
+            *grid._csr_connectivity[name], permutation["n_" + name.split("_")[0]]
+        )
+        grid._csr_connectivity[name] = (
+            offsets,
+            _remap_indices(indices, inverse[_indexed_dim(name)]),
+        )
+
+    if "edge_node_connectivity" in grid._ds:
+        # face-edge pairs used for (re)constructing the face edge connectivity
+        if grid.ragged:
+            _, inverse_indices = grid._csr_connectivity["face_edge_connectivity"]
+        else:
+            inverse_indices = grid._ds["face_edge_connectivity"].values.ravel()
+
+        grid._ds["edge_node_connectivity"].attrs["inverse_indices"] = inverse_indices
+        grid._ds["edge_node_connectivity"].attrs["fill_value_mask"] = (
+            inverse_indices == _get_fill_value(inverse_indices.dtype)
+        )
+
+    _restore_row_order(grid)
+
+    for attrs in CACHED_ATTRIBUTES.values():
+        for attr, value in attrs.items():
+            setattr(grid, attr, copy.copy(value))
+
+
+def _sort_csr_rows(offsets, indices):
+    """Sorts the entries of each row of a connectivity stored in compressed
+    sparse row (CSR) format in ascending order."""
+    rows = np.repeat(np.arange(offsets.shape[0] - 1), np.diff(offsets))
+
+    return indices[np.lexsort((indices, rows))]
+
+
+def _restore_row_order(grid):
+    """Restores the documented order of the entries of each row of the node
+    connectivity variables, which is lost once their indices are remapped:
+    the faces and edges of each node are sorted in ascending order, while the
+    node node and edge edge connectivity are reconstructed from the sorted
+    node edge connectivity."""
+
+    def _get_csr(name):
+        if name in grid._ragged_connectivity:
+            return grid._csr_connectivity[name]
+        return _padded_to_csr(grid._ds[name].values)
+
+    def _set_csr(name, offsets, indices):
+        if name in grid._ragged_connectivity:
+            grid._csr_connectivity[name] = (offsets, indices)
+            return
+
+        padded, _ = _csr_to_padded(offsets, indices, grid._ds[name].shape[1])
+        grid._ds[name] = grid._ds[name].copy(data=padded)
+
+    for name in ("node_face_connectivity", "node_edge_connectivity"):
+        if grid._connectivity_populated(name):
+            offsets, indices = _get_csr(name)
+            _set_csr(name, offsets, _sort_csr_rows(offsets, indices))
+
+    if (
+        not grid._connectivity_populated("node_edge_connectivity")
+        or "edge_node_connectivity" not in grid._ds
+    ):
+        return
+
+    edge_nodes = grid._ds["edge_node_connectivity"].values
+    offsets, node_edges = _get_csr("node_edge_connectivity")
+
+    if grid._connectivity_populated("node_node_connectivity"):
+        _set_csr(
+            "node_node_connectivity",
+            offsets,
+            _build_node_node_csr(offsets, node_edges, edge_nodes),
+        )
+
+    if grid._connectivity_populated("edge_edge_connectivity"):
+        _set_csr(
+            "edge_edge_connectivity",
+            *_build_edge_edge_csr(edge_nodes, offsets, node_edges),
+        )
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import numpy as np
 import xarray as xr
-from uxarray.constants import INT_FILL_VALUE, INT_DTYPE
+from uxarray.constants import INT_DTYPE
+from uxarray.grid.utils import _get_fill_value
 
 from typing import TYPE_CHECKING
 
@@ -31,7 +32,7 @@ def _slice_node_indices(grid, indices, inclusive=True):
 
     # faces that saddle nodes given in 'indices'
     face_indices = np.unique(grid.node_face_connectivity.values[indices].ravel())
-    face_indices = face_indices[face_indices != INT_FILL_VALUE]
+    face_indices = face_indices[face_indices != _get_fill_value(face_indices.dtype)]
 
     return _slice_face_indices(grid, face_indices)
 
@@ -57,7 +58,7 @@ def _slice_edge_indices(grid, indices, inclusive=True):
 
     # faces that saddle nodes given in 'indices'
     face_indices = np.unique(grid.edge_face_connectivity.values[indices].ravel())
-    face_indices = face_indices[face_indices != INT_FILL_VALUE]
+    face_indices = face_indices[face_indices != _get_fill_value(face_indices.dtype)]
 
     return _slice_face_indices(grid, face_indices)
 
@@ -83,7 +84,9 @@ def _slice_face_indices(grid, indices, inclusive=True):
 
     from uxarray.grid import Grid
 
-    ds = grid._ds
+    # ragged grids only store the CSR representation of some connectivity variables
+    ds = grid._padded_ds()
+    conn_names = list(ds.data_vars)
 
     indices = np.asarray(indices, dtype=INT_DTYPE)
 
@@ -94,11 +97,11 @@ def _slice_face_indices(grid, indices, inclusive=True):
 
     # nodes of each face (inclusive)
     node_indices = np.unique(grid.face_node_connectivity.values[face_indices].ravel())
-    node_indices = node_indices[node_indices != INT_FILL_VALUE]
+    node_indices = node_indices[node_indices != _get_fill_value(node_indices.dtype)]
 
     # edges of each face (inclusive)
     edge_indices = np.unique(grid.face_edge_connectivity.values[face_indices].ravel())
-    edge_indices = edge_indices[edge_indices != INT_FILL_VALUE]
+    edge_indices = edge_indices[edge_indices != _get_fill_value(edge_indices.dtype)]
 
     # index original dataset to obtain a 'subgrid'
     ds = ds.isel(n_node=node_indices)
@@ -106,24 +109,27 @@ def _slice_face_indices(grid, indices, inclusive=True):
     ds = ds.isel(n_edge=edge_indices)
 
     ds["subgrid_node_indices"] = xr.DataArray(node_indices, dims=["n_node"])
-    ds["subgrid_face_indices"] = xr.DataArray(face_indices, dims=["n_face"])
+    ds["subgrid_face_indices"] = xr.DataArray(
+        face_indices.astype(grid.connectivity_dtype), dims=["n_face"]
+    )
     ds["subgrid_edge_indices"] = xr.DataArray(edge_indices, dims=["n_edge"])
 
     # mapping to update existing connectivity
     node_indices_dict = {
         key: val for key, val in zip(node_indices, np.arange(0, len(node_indices)))
     }
-    node_indices_dict[INT_FILL_VALUE] = INT_FILL_VALUE
+    fill_value = _get_fill_value(grid.connectivity_dtype)
+    node_indices_dict[fill_value] = fill_value
 
-    for conn_name in grid._ds.data_vars:
+    for conn_name in conn_names:
         # update or drop connectivity variables to correctly point to the new index of each element
 
-        if "_node_connectivity" in conn_name:
+        if conn_name in ("face_node_connectivity", "edge_node_connectivity"):
             # update connectivity vars that index into nodes
             ds[conn_name] = xr.DataArray(
-                np.vectorize(node_indices_dict.__getitem__, otypes=[INT_DTYPE])(
-                    ds[conn_name].values
-                ),
+                np.vectorize(
+                    node_indices_dict.__getitem__, otypes=[grid.connectivity_dtype]
+                )(ds[conn_name].values),
                 dims=ds[conn_name].dims,
             )
 
@@ -131,4 +137,9 @@ def _slice_face_indices(grid, indices, inclusive=True):
             # drop any conn that would require re-computation
             ds = ds.drop_vars(conn_name)
 
-    return Grid.from_dataset(ds, source_grid_spec=grid.source_grid_spec)
+    return Grid.from_dataset(
+        ds,
+        source_grid_spec=grid.source_grid_spec,
+        ragged=grid.ragged,
+        connectivity_dtype=grid.connectivity_dtype,
+    )
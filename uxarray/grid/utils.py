@@ -1,9 +1,16 @@
 import numpy as np
-from uxarray.constants import ERROR_TOLERANCE, INT_FILL_VALUE
+from uxarray.constants import ERROR_TOLERANCE
 import warnings
 import uxarray.utils.computing as ac_utils
 
 
+def _get_fill_value(dtype):
+    """Returns the fill value used for connectivity variables stored with the
+    integer data type ``dtype``, which is the smallest representable value
+    (``INT_FILL_VALUE`` for ``INT_DTYPE``)."""
+    return np.iinfo(dtype).min
+
+
 def _replace_fill_values(grid_var, original_fill, new_fill, new_dtype=None):
     """Replaces all instances of the current fill value (``original_fill``) in
     (``grid_var``) with (``new_fill``) and converts to the dtype defined by
@@ -222,10 +229,10 @@ def _get_cartesian_face_edge_nodes(
     - The output array contains the Cartesian coordinates for each edge of the face.
     """
 
-    # Create a mask that is True for all values not equal to INT_FILL_VALUE
-    mask = face_edges_ind != INT_FILL_VALUE
+    # Create a mask that is True for all values not equal to the fill value
+    mask = face_edges_ind != _get_fill_value(face_edges_ind.dtype)
 
-    # Use the mask to select only the elements not equal to INT_FILL_VALUE
+    # Use the mask to select only the elements not equal to the fill value
     valid_edges = face_edges_ind[mask]
     face_edges = edge_nodes_grid[valid_edges]
 
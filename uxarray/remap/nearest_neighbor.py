@@ -60,6 +60,14 @@ def _nearest_neighbor(
             f" source grid, but received: {source_data.shape}"
         )
 
+    # each element is its own nearest neighbor when both grids share the same elements, which equal grids only
+    # guarantee for their nodes (their edges may be ordered differently, and their centers read from different files)
+    if remap_to == source_data_mapping and (
+        source_grid is destination_grid
+        or (remap_to == "nodes" and source_grid == destination_grid)
+    ):
+        return source_data.copy()
+
     if coord_type == "spherical":
         # get destination coordinate pairs
         if remap_to == "nodes":
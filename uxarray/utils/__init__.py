@@ -0,0 +1,8 @@
+from .dtype_settings import set_connectivity_dtype
+from .cache_settings import enable_grid_cache, disable_grid_cache
+
+__all__ = (
+    "set_connectivity_dtype",
+    "enable_grid_cache",
+    "disable_grid_cache",
+)
@@ -0,0 +1,33 @@
+import os
+
+import uxarray.constants
+
+
+def enable_grid_cache(cache_dir=None):
+    """Enables the persistent on-disk cache of derived grid quantities (i.e.
+    edges, face centroids, face areas and antimeridian faces).
+
+    Each quantity is stored under a directory named after a content hash of
+    the node coordinates and face node connectivity of a grid, which allows
+    any process opening the same grid to load it instead of reconstructing
+    it. The cache can also be enabled by setting the
+    ``UXARRAY_GRID_CACHE_DIR`` environment variable.
+
+    Parameters
+    ----------
+    cache_dir : str or os.PathLike, optional
+        Root directory of the cache, defaults to ``uxarray.constants.DEFAULT_GRID_CACHE_DIR``
+    """
+    if cache_dir is None:
+        cache_dir = uxarray.constants.DEFAULT_GRID_CACHE_DIR
+
+    uxarray.constants.GRID_CACHE_DIR = os.fspath(cache_dir)
+
+
+def disable_grid_cache():
+    """Disables the persistent on-disk cache of derived grid quantities.
+
+    The default is off, unless the ``UXARRAY_GRID_CACHE_DIR``
+    environment variable is set.
+    """
+    uxarray.constants.GRID_CACHE_DIR = None
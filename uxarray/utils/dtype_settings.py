@@ -0,0 +1,28 @@
+import numpy as np
+
+import uxarray.constants
+
+
+def set_connectivity_dtype(dtype):
+    """Sets the default integer data type used to store the connectivity
+    variables of each newly constructed ``Grid``.
+
+    Storing connectivity as ``np.int32`` halves the memory footprint of a grid
+    and the memory bandwidth of operations that traverse its topology, and is
+    supported for grids with fewer than 2^31 elements. Fill values are set to
+    the minimum value of the data type. The default is ``INT_DTYPE``.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        Either ``np.int32`` or ``np.int64``
+    """
+    dtype = np.dtype(dtype)
+
+    if dtype not in uxarray.constants.CONNECTIVITY_DTYPES:
+        raise ValueError(
+            f"Unsupported connectivity dtype: {dtype}. Expected one of "
+            f"{[str(d) for d in uxarray.constants.CONNECTIVITY_DTYPES]}"
+        )
+
+    uxarray.constants.CONNECTIVITY_DTYPE = dtype